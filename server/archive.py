@@ -0,0 +1,134 @@
+"""
+archive.py – Team archive import (/import_team)
+
+/export_team 이 내보낸 NDJSON (rds.export_team_from_db) 을 읽어서 팀 하나를 복원한다.
+* 줄은 streaming.ndjson_records 로 한 줄씩 (gzip 자동 인식) – 업로드 전체를 메모리에 올리지 않는다
+* 같은 kind 의 연속된 줄을 batch_size 개까지 모아서 rds.import_team_rows_to_db 한 번 (= 트랜잭션 하나)
+* 첫 줄은 team 헤더, 마지막 줄은 end (kind 별 행 수) – end 가 없거나 수가 다르면 ArchiveError
+* 대상 팀은 team_name 인자 (없으면 헤더의 팀 이름). 이미 행이 있으면 rds.TeamNotEmpty, replace=True 면 비우고 시작
+
+batch 마다 commit 하므로 중간에 실패하면 그 앞 batch 는 남는다 → ArchiveError.imported 로 알려 주고,
+같은 archive 를 replace=True 로 다시 올리면 처음부터 복원된다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, List, Tuple
+
+import pymysql
+
+from rds import (EXPORT_FIELDS, EXPORT_FORMAT, EXPORT_VERSION,
+                 begin_team_import_to_db, import_team_rows_to_db)
+
+# db.call 과 같은 모양 : call(func, **kwargs)
+Call = Callable[..., Awaitable[Any]]
+
+# kind 별 필수 필드 – 나머지 (user_owner, board_color, task_state, task_color) 는 기본값
+REQUIRED = {
+    "member": ("user_email",),
+    "board": ("board_name",),
+    "card": ("board_name", "card_name", "card_content"),
+    "task": ("task_name", "task_start", "task_end", "task_target", "user_email"),
+}
+
+
+class ArchiveError(ValueError):
+    """잘못된 / 잘린 archive. imported = 그때까지 commit 된 kind 별 행 수"""
+
+    def __init__(self, message: str, imported: Dict[str, int] | None = None):
+        super().__init__(message)
+        self.imported = imported or {}
+
+
+def _header(lineno: int, record: Any) -> Dict[str, Any]:
+    if not isinstance(record, dict) or record.get("kind") != "team":
+        raise ArchiveError(f"line {lineno}: expected a team header")
+    if record.get("format") != EXPORT_FORMAT:
+        raise ArchiveError(f"line {lineno}: not a {EXPORT_FORMAT} archive")
+    if not isinstance(record.get("version"), int) or record["version"] > EXPORT_VERSION:
+        raise ArchiveError(f"line {lineno}: unsupported archive version {record.get('version')!r}")
+    return record
+
+
+def _row(lineno: int, record: Any) -> Tuple[str, Dict[str, Any]]:
+    kind = record.get("kind") if isinstance(record, dict) else None
+    if kind not in REQUIRED:
+        raise ArchiveError(f"line {lineno}: unknown kind {kind!r}")
+    missing = [field for field in REQUIRED[kind] if record.get(field) is None]
+    if missing:
+        raise ArchiveError(f"line {lineno} ({kind}): missing {', '.join(missing)}")
+    return kind, {field: record.get(field) for field in EXPORT_FIELDS[kind]}
+
+
+async def import_archive(
+    call: Call,
+    records: AsyncIterable[Tuple[int, Any]],
+    *,
+    team_name: str | None = None,
+    replace: bool = False,
+    batch_size: int = 1000,
+    before: Callable[[str], Awaitable[Any]] | None = None,
+) -> Dict[str, Any]:
+    """
+    records = streaming.ndjson_records(...) 의 (줄 번호, 값)
+    before(team_name) : 대상 팀이 정해진 뒤, DB 를 건드리기 전에 (예: write-behind 예약 버리기)
+    반환 {"team_name", "imported": {kind: 행 수}, "replaced": 지운 행 수 | None}
+    """
+    imported = dict.fromkeys(REQUIRED, 0)
+    kind: str | None = None
+    rows: List[Dict[str, Any]] = []
+    target = team_name
+
+    async def flush() -> None:
+        nonlocal rows
+        if rows:
+            await call(import_team_rows_to_db, team_name=target, kind=kind, rows=rows,
+                       task_table="task_table", card_table="card_table", member_table="member_table")
+            imported[kind] += len(rows)
+            rows = []
+
+    try:
+        iterator = records.__aiter__()
+        try:
+            lineno, record = await iterator.__anext__()
+        except StopAsyncIteration:
+            raise ArchiveError("empty archive") from None
+        header = _header(lineno, record)
+        target = team_name or header.get("team_name")
+        if not target or not isinstance(target, str):
+            raise ArchiveError("team_name is required (archive header has none)")
+        if before is not None:
+            await before(target)
+        replaced = await call(begin_team_import_to_db, team_name=target, replace=replace,
+                              task_table="task_table", card_table="card_table", member_table="member_table")
+
+        end = None
+        async for lineno, record in iterator:
+            if end is not None:
+                raise ArchiveError(f"line {lineno}: data after end record")
+            if isinstance(record, dict) and record.get("kind") == "end":
+                end = record
+                continue
+            row_kind, row = _row(lineno, record)
+            if row_kind != kind or len(rows) >= batch_size:
+                await flush()
+                kind = row_kind
+            rows.append(row)
+        await flush()
+
+        if end is None:
+            raise ArchiveError("archive truncated: no end record")
+        expected = end.get("count") if isinstance(end.get("count"), dict) else {}
+        wrong = {k: (n, expected[k]) for k, n in imported.items() if k in expected and expected[k] != n}
+        if wrong:
+            raise ArchiveError(f"row count mismatch (imported, expected): {wrong}")
+    except ArchiveError as exc:
+        exc.imported = imported
+        raise
+    except (ValueError, pymysql.err.DataError, pymysql.err.IntegrityError) as exc:
+        # 잘못된 JSON / gzip (streaming), DB 가 거부한 값 (날짜 형식, task_state …)
+        raise ArchiveError(str(exc), imported) from exc
+    return {"team_name": target, "imported": imported, "replaced": replaced}
+
+
+__all__ = ["ArchiveError", "import_archive", "REQUIRED"]
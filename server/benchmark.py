@@ -0,0 +1,428 @@
+"""
+benchmark.py – Load test / latency benchmark for server.py
+
+FastAPI 앱을 프로세스 안에서 (httpx.ASGITransport) 직접 호출하며 혼합 부하를 건다.
+uvicorn / 네트워크 비용은 빠지고, 핸들러 + 데이터 계층 비용만 측정된다.
+
+    python3 benchmark.py                                  # 메모리 fake backend
+    python3 benchmark.py --backend mysql                  # .env 의 실제 DB (startup 그대로 실행)
+    python3 benchmark.py --backend sqlite                 # 임시 SQLite 파일 (WAL) – DB 서버 없이 전체 경로
+    python3 benchmark.py --fake-latency 2 --clients 64 --duration 20 --out run.json
+    python3 benchmark.py --compare baseline.json          # 이전 결과 대비 p95 회귀 표시
+
+workload (가중치)
+  load_task / load_board / load_member / load_team_snapshot 폴링,
+  add_task 연속 burst, update_task, delete_team cascade (+ 재생성)
+
+필요 패키지 : httpx
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import partial
+from itertools import count
+from typing import Any, Callable, Dict, List, Tuple
+
+
+# ────────────────────────────────
+# 0.  In-memory fake backend
+# ────────────────────────────────
+
+
+class FakeStore:
+    """rds.py 함수와 같은 이름·인자(connection/cursor 제외)를 가진 메모리 구현"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids = count(1)
+        self.users: Dict[str, Tuple[Any, ...]] = {}
+        self.tasks: List[Tuple[Any, ...]] = []          # id, team, name, start, end, state, color, target, email
+        self.boards: List[Tuple[Any, ...]] = []         # id, team, board, color, card, content
+        self.members: List[Tuple[Any, ...]] = []        # id, team, email, owner
+
+    # setting / user
+    def ping_db(self, **_):
+        return True
+
+    def load_setting_from_db(self, **_):
+        return "kakao-key", "google-key"
+
+    def add_user_to_db(self, *, user_email, user_nickname, user_image, **_):
+        with self._lock:
+            self.users[user_email] = (next(self._ids), user_email, user_nickname, user_image)
+
+    def load_user_from_db(self, *, user_email, **_):
+        return self.users.get(user_email)
+
+    def delete_user_from_db(self, *, user_email, **_):
+        with self._lock:
+            self.users.pop(user_email, None)
+            self.members = [m for m in self.members if m[2] != user_email]
+
+    # task
+    def add_task_to_db(self, *, team_name, task_name, task_start, task_end, task_state,
+                       task_color, task_target, user_email, **_):
+        with self._lock:
+            self.tasks.append((next(self._ids), team_name, task_name, task_start, task_end,
+                               task_state or "TODO", task_color or 0, task_target, user_email))
+
+    def load_task_from_db(self, *, team_name, task_target, user_email, hide_done=True, **_):
+        with self._lock:
+            return [t for t in self.tasks
+                    if (t[1] == team_name or (t[7] == task_target and t[8] == user_email))
+                    and not (hide_done and t[5] == "DONE")]
+
+    def update_task_to_db(self, *, team_name, task_name, task_state=None, task_color=None, **_):
+        with self._lock:
+            self.tasks = [
+                t[:5] + (task_state or t[5], t[6] if task_color is None else task_color) + t[7:]
+                if t[1] == team_name and t[2] == task_name else t
+                for t in self.tasks
+            ]
+
+    def delete_task_from_db(self, *, team_name=None, task_name=None, user_email=None, **_):
+        with self._lock:
+            if team_name:
+                self.tasks = [t for t in self.tasks if not (t[1] == team_name and t[2] == task_name)]
+            else:
+                self.tasks = [t for t in self.tasks if not (t[8] == user_email and t[2] == task_name)]
+
+    # board
+    def add_board_to_db(self, *, team_name, board_name, card_name, card_content, board_color, **_):
+        with self._lock:
+            self.boards.append((next(self._ids), team_name, board_name, board_color, card_name, card_content))
+
+    def load_board_from_db(self, *, team_name, board_name, **_):
+        with self._lock:
+            return [b for b in self.boards if b[1] == team_name and b[2] == board_name]
+
+    def delete_board_from_db(self, *, team_name, board_name, **_):
+        with self._lock:
+            self.boards = [b for b in self.boards if not (b[1] == team_name and b[2] == board_name)]
+
+    def update_board_to_db(self, *, team_name, board_name, board_color, **_):
+        with self._lock:
+            self.boards = [b[:3] + (board_color,) + b[4:] if b[1] == team_name and b[2] == board_name else b
+                           for b in self.boards]
+
+    def delete_card_from_db(self, *, team_name, board_name, card_name, **_):
+        with self._lock:
+            self.boards = [b for b in self.boards
+                           if not (b[1] == team_name and b[2] == board_name and b[4] == card_name)]
+
+    # member
+    def add_member_to_db(self, *, team_name, user_email, is_owner=False, **_):
+        with self._lock:
+            self.members = [m for m in self.members if not (m[1] == team_name and m[2] == user_email)]
+            self.members.append((next(self._ids), team_name, user_email, int(bool(is_owner))))
+
+    def load_member_from_db(self, *, team_name=None, user_email=None, **_):
+        with self._lock:
+            return [m for m in self.members
+                    if (not team_name or m[1] == team_name) and (not user_email or m[2] == user_email)]
+
+    def update_member_to_db(self, *, team_name, user_email, is_owner, **_):
+        self.add_member_to_db(team_name=team_name, user_email=user_email, is_owner=is_owner)
+
+    def delete_member_from_db(self, *, team_name, user_email, **_):
+        with self._lock:
+            self.members = [m for m in self.members if not (m[1] == team_name and m[2] == user_email)]
+
+    def delete_team_from_db(self, *, team_name, **_):
+        with self._lock:
+            self.tasks = [t for t in self.tasks if t[1] != team_name]
+            self.boards = [b for b in self.boards if b[1] != team_name]
+            self.members = [m for m in self.members if m[1] != team_name]
+
+    # snapshot / batch / sync
+    def load_team_snapshot_from_db(self, *, team_name, task_target, user_email, hide_done=True, **_):
+        board: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            rows = sorted((b for b in self.boards if b[1] == team_name), key=lambda b: (b[2], b[0]))
+        for row in rows:
+            board.setdefault(row[2], {"board_name": row[2], "board_color": row[3], "card": []})["card"].append(row)
+        return {
+            "task": self.load_task_from_db(team_name=team_name, task_target=task_target,
+                                           user_email=user_email, hide_done=hide_done),
+            "board": list(board.values()),
+            "member": self.load_member_from_db(team_name=team_name),
+        }
+
+    def batch_tasks_to_db(self, *, operations, **_):
+        results = []
+        for i, op in enumerate(operations):
+            fn = {"create": self.add_task_to_db, "update": self.update_task_to_db,
+                  "delete": self.delete_task_from_db}[op["op"]]
+            fn(**{k: v for k, v in op.items() if k != "op"})
+            results.append({"index": i, "op": op["op"], "affected": 1})
+        return results
+
+    def sync_team_from_db(self, *, team_name, **_):
+        snapshot = self.load_team_snapshot_from_db(team_name=team_name, task_target="", user_email="")
+        return {"revision": 0, "reset": True, "deleted": [], **snapshot}
+
+
+class FakeDB:
+    """rds_async.AsyncDB 대체 – worker thread 에서 FakeStore 호출 (+ 선택적 왕복 지연)"""
+
+    def __init__(self, store: FakeStore, *, latency_ms: float = 0.0, max_workers: int = 10):
+        self.store = store
+        self.latency = latency_ms / 1000
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fake-rds")
+
+    async def call(self, func: Callable[..., Any], /, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(self._run, func.__name__, kwargs))
+
+    def _run(self, name: str, kwargs: Dict[str, Any]) -> Any:
+        if self.latency:
+            time.sleep(self.latency)
+        return getattr(self.store, name)(**kwargs)
+
+    def close(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+# ────────────────────────────────
+# 1.  Workload
+# ────────────────────────────────
+
+
+class Recorder:
+    def __init__(self):
+        self.latency: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def post(self, client, path: str, body: Dict[str, Any]) -> None:
+        start = time.perf_counter()
+        try:
+            response = await client.post(path, json=body)
+            ok = response.status_code < 400
+        except Exception:
+            ok = False
+        self.latency[path].append(time.perf_counter() - start)
+        if not ok:
+            self.errors[path] += 1
+
+
+def _task_body(team: str, user: str, name: str) -> Dict[str, Any]:
+    start = date.today() + timedelta(days=random.randint(-30, 30))
+    return {
+        "team_name": team, "task_name": name,
+        "task_start": start.isoformat(), "task_end": (start + timedelta(days=random.randint(0, 14))).isoformat(),
+        "task_state": random.choice(("TODO", "DOING", "DONE")), "task_color": str(random.randint(0, 11)),
+        "task_target": f"{team}:{name}", "user_email": user,
+    }
+
+
+async def seed(client, recorder: Recorder, team: str, users: List[str], tasks: int, boards: int) -> None:
+    for user in users:
+        await recorder.post(client, "/add_member", {"team_name": team, "user_email": user, "user_owner": "false"})
+    for i in range(tasks):
+        await recorder.post(client, "/add_task", _task_body(team, random.choice(users), f"task-{i}"))
+    for b in range(boards):
+        for c in range(5):
+            await recorder.post(client, "/add_board", {
+                "team_name": team, "board_name": f"board-{b}", "board_color": "0",
+                "card_name": f"card-{c}", "card_content": "x" * 64,
+            })
+
+
+async def virtual_client(worker: int, client, recorder: Recorder, teams: List[str],
+                         users: Dict[str, List[str]], deadline: float, args) -> None:
+    actions = [
+        ("load_task", 35), ("load_board", 20), ("load_member", 15), ("load_team_snapshot", 5),
+        ("add_task_burst", 10), ("update_task", 12), ("delete_team", 1),
+    ]
+    names, weights = zip(*actions)
+    serial = count()
+    while time.perf_counter() < deadline:
+        team = random.choice(teams)
+        user = random.choice(users[team])
+        action = random.choices(names, weights)[0]
+        if action == "load_task":
+            await recorder.post(client, "/load_task", {"team_name": team, "task_target": "", "user_email": user})
+        elif action == "load_board":
+            await recorder.post(client, "/load_board",
+                                {"team_name": team, "board_name": f"board-{random.randrange(args.boards)}"})
+        elif action == "load_member":
+            await recorder.post(client, "/load_member", {"team_name": team})
+        elif action == "load_team_snapshot":
+            await recorder.post(client, "/load_team_snapshot",
+                                {"team_name": team, "task_target": "", "user_email": user})
+        elif action == "add_task_burst":
+            for _ in range(args.burst):
+                await recorder.post(client, "/add_task", _task_body(team, user, f"burst-{worker}-{next(serial)}"))
+        elif action == "update_task":
+            await recorder.post(client, "/update_task", {
+                "team_name": team, "task_name": f"task-{random.randrange(args.tasks)}",
+                "task_state": random.choice(("TODO", "DOING", "DONE")),
+            })
+        elif action == "delete_team":
+            await recorder.post(client, "/delete_team", {"team_name": team})
+            await seed(client, recorder, team, users[team], args.tasks, args.boards)
+
+
+# ────────────────────────────────
+# 2.  Report
+# ────────────────────────────────
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> Dict[str, Any]:
+    endpoints = {}
+    for path, values in sorted(recorder.latency.items()):
+        endpoints[path] = {
+            "count": len(values),
+            "errors": recorder.errors.get(path, 0),
+            "rps": round(len(values) / elapsed, 2),
+            "p50_ms": round(percentile(values, 50) * 1000, 3),
+            "p95_ms": round(percentile(values, 95) * 1000, 3),
+            "p99_ms": round(percentile(values, 99) * 1000, 3),
+            "max_ms": round(max(values) * 1000, 3),
+        }
+    total = sum(len(v) for v in recorder.latency.values())
+    return {"elapsed_s": round(elapsed, 3), "requests": total, "rps": round(total / elapsed, 2),
+            "endpoints": endpoints}
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def print_report(result: Dict[str, Any], baseline: Dict[str, Any] | None, threshold: float) -> int:
+    """표 출력. baseline 대비 p95 가 threshold(%) 넘게 느려진 endpoint 수 반환"""
+    print(f"\n{'endpoint':<22}{'count':>8}{'err':>6}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    regressions = 0
+    for path, row in result["endpoints"].items():
+        note = ""
+        before = (baseline or {}).get("endpoints", {}).get(path)
+        if before and before["p95_ms"] > 0:
+            change = (row["p95_ms"] / before["p95_ms"] - 1) * 100
+            note = f"  p95 {change:+.1f}%"
+            if change > threshold:
+                note += "  << REGRESSION"
+                regressions += 1
+        print(f"{path:<22}{row['count']:>8}{row['errors']:>6}{row['rps']:>10}"
+              f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{note}")
+    print(f"\ntotal {result['requests']} requests in {result['elapsed_s']}s → {result['rps']} req/s")
+    return regressions
+
+
+# ────────────────────────────────
+# 3.  main
+# ────────────────────────────────
+
+
+async def run(args) -> Dict[str, Any]:
+    import httpx
+    import rds
+    import server
+
+    if args.backend == "fake":
+        server.db = FakeDB(FakeStore(), latency_ms=args.fake_latency, max_workers=args.workers)
+        await server.hub.start()
+        await server.settings.start()
+    else:
+        if args.backend == "sqlite":
+            # .env 보다 우선 (load_dotenv 는 이미 있는 환경 변수를 덮어쓰지 않는다)
+            os.environ["STORAGE_BACKEND"] = "sqlite"
+            os.environ["SQLITE_PATH"] = args.sqlite_path
+        await server.startup_event()
+        server.limiter.enabled = args.rate_limit      # 가상 클라이언트가 같은 IP / 사용자라 기본은 끔
+
+    random.seed(args.seed)
+    teams = [f"team-{i}" for i in range(args.teams)]
+    users = {team: [f"user{j}@{team}.test" for j in range(args.members)] for team in teams}
+    transport = httpx.ASGITransport(app=server.app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            setup = Recorder()
+            for team in teams:
+                await seed(client, setup, team, users[team], args.tasks, args.boards)
+
+            recorder = Recorder()
+            start = time.perf_counter()
+            deadline = start + args.duration
+            await asyncio.gather(*(
+                virtual_client(i, client, recorder, teams, users, deadline, args) for i in range(args.clients)
+            ))
+            elapsed = time.perf_counter() - start
+    finally:
+        await server.shutdown_event()
+
+    return {
+        "meta": {
+            "backend": args.backend, "storage": rds.backend.describe() if rds.backend else "fake",
+            "fake_latency_ms": args.fake_latency, "clients": args.clients,
+            "duration_s": args.duration, "teams": args.teams, "seed": args.seed,
+            "git": _git_revision(), "python": platform.python_version(), "time": time.time(),
+        },
+        **summarize(recorder, elapsed),
+    }
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=("fake", "mysql", "sqlite"), default="fake")
+    parser.add_argument("--sqlite-path", help="sqlite backend 파일 (기본: 임시 디렉터리, 끝나면 삭제)")
+    parser.add_argument("--fake-latency", type=float, default=1.0, help="fake backend 왕복 지연 (ms)")
+    parser.add_argument("--workers", type=int, default=10, help="fake backend thread 수 (= 풀 크기)")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--teams", type=int, default=8)
+    parser.add_argument("--members", type=int, default=5)
+    parser.add_argument("--tasks", type=int, default=200, help="팀별 초기 task 수")
+    parser.add_argument("--boards", type=int, default=4, help="팀별 board 수 (board 당 card 5장)")
+    parser.add_argument("--burst", type=int, default=5, help="add_task burst 크기")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rate-limit", action="store_true", help="mysql / sqlite backend 에서 .env rate limit 그대로 적용")
+    parser.add_argument("--out", default="bench_output.json")
+    parser.add_argument("--compare", help="이전 --out 결과 파일")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 볼 p95 증가율 (%%)")
+    args = parser.parse_args(argv)
+
+    if args.backend == "sqlite" and not args.sqlite_path:
+        with tempfile.TemporaryDirectory(prefix="planit-bench-") as directory:
+            args.sqlite_path = os.path.join(directory, "planit.db")
+            result = asyncio.run(run(args))
+    else:
+        result = asyncio.run(run(args))
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    regressions = print_report(result, baseline, args.threshold)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"results → {args.out}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
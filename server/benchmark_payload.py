@@ -0,0 +1,109 @@
+"""
+benchmark_payload.py – Micro-benchmark: load_* 응답 인코딩 (bytes-on-wire / encode 시간)
+
+DB 없이 합성 task 행으로 측정한다.
+  fastapi  : 예전 경로 (jsonable_encoder + json.dumps, JSONResponse 와 같은 설정)
+  json     : payload.dumps – stdlib json (orjson 미설치 환경)
+  orjson   : payload.dumps – orjson (설치된 경우)
+  columnar : {"columns", "rows"} JSON
+  msgpack  : columnar 모양 MessagePack (설치된 경우)
+형식마다 identity / gzip / br(설치된 경우) 크기와 압축 시간도 함께.
+
+    python3 benchmark_payload.py
+    python3 benchmark_payload.py --rows 50 500 5000 --number 200 --out payload.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import timeit
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+import payload
+from payload import COLUMNAR, JSON, MSGPACK, PayloadEncoder, field_names
+from rds import TASK_COLUMNS
+
+FIELDS = field_names(TASK_COLUMNS)
+
+
+def synthetic_rows(n: int, seed: int = 0) -> List[Tuple[Any, ...]]:
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    rows = []
+    for i in range(n):
+        begin = start + timedelta(days=rng.randrange(365))
+        rows.append((
+            i + 1, "planit-team-042", f"할 일 {i} – 회의 자료 정리", begin, begin + timedelta(days=rng.randrange(14)),
+            rng.choice(("TODO", "DOING", "DONE")), rng.randrange(12), "planit-team-042",
+            f"user{rng.randrange(8)}@example.com", rng.randrange(1, 5000),
+            datetime(2025, 7, 1, 12, 0, 0) + timedelta(seconds=rng.randrange(10 ** 6), microseconds=rng.randrange(10 ** 6)),
+        ))
+    return rows
+
+
+def _fastapi(rows: List[Tuple[Any, ...]]) -> bytes:
+    content = jsonable_encoder({"task": rows, "next": None})
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def _stdlib(rows: List[Tuple[Any, ...]]) -> bytes:
+    saved, payload.orjson = payload.orjson, None
+    try:
+        return payload.dumps({"task": rows, "next": None})
+    finally:
+        payload.orjson = saved
+
+
+def cases(encoder: PayloadEncoder) -> Dict[str, Callable[[List[Tuple[Any, ...]]], bytes]]:
+    result: Dict[str, Callable[[List[Tuple[Any, ...]]], bytes]] = {"fastapi": _fastapi, "json": _stdlib}
+    if payload.orjson is not None:
+        result["orjson"] = lambda rows: encoder.encode(JSON, "task", FIELDS, rows, {"next": None})
+    result["columnar"] = lambda rows: encoder.encode(COLUMNAR, "task", FIELDS, rows, {"next": None})
+    if payload.msgpack is not None:
+        result["msgpack"] = lambda rows: encoder.encode(MSGPACK, "task", FIELDS, rows, {"next": None})
+    return result
+
+
+def measure(counts: List[int], number: int) -> Dict[str, Any]:
+    encoder = PayloadEncoder()
+    codings = ["gzip"] + (["br"] if payload.brotli is not None else [])
+    result: Dict[str, Any] = {}
+    for n in counts:
+        rows = synthetic_rows(n)
+        per_rows: Dict[str, Any] = {}
+        for name, encode in cases(encoder).items():
+            body = encode(rows)
+            row: Dict[str, Any] = {
+                "encode_us": round(timeit.timeit(lambda: encode(rows), number=number) / number * 1e6, 1),
+                "bytes": len(body),
+            }
+            for coding in codings:
+                row[f"{coding}_bytes"] = len(encoder.compress(body, coding))
+                row[f"{coding}_us"] = round(
+                    timeit.timeit(lambda: encoder.compress(body, coding), number=number) / number * 1e6, 1)
+            per_rows[name] = row
+        result[str(n)] = per_rows
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[50, 500, 5000], help="응답 행 수")
+    parser.add_argument("--number", type=int, default=100, help="케이스당 반복 횟수")
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    text = json.dumps(measure(args.rows, args.number), indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+benchmark_schema.py – Before/after benchmark for migrations/0005 (team_name TEXT → team_id INT)
+
+빈 scratch DB 하나에서
+  1) mysql.txt 의 CREATE TABLE + migrations 0001‑0004 (예전 layout) 적용
+  2) 합성 데이터 seed (팀 / task / board·card / member)
+  3) 예전 SQL 로 조회·쓰기 시간 측정                          → before
+  4) 0005 migration 적용 (데이터 이전 시간도 측정)
+  5) 지금 rds.py 함수로 같은 조회·쓰기 시간 측정                → after
+  + information_schema 기준 테이블 크기 (data + index)
+
+    python3 benchmark_schema.py --database planit_bench
+    python3 benchmark_schema.py --database planit_bench --teams 2000 --tasks 100 --out schema.json
+
+주의) --database 의 테이블을 모두 DROP 한다. 운영 DB 이름을 넣지 말 것.
+접속 정보는 .env (HOST / USER / PASSWORD) 그대로, DATABASE 만 --database 로 바꾼다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from dotenv import load_dotenv
+
+BASE_SCHEMA = Path(__file__).resolve().parent / "mysql.txt"
+DROP_ORDER = (
+    "card_table", "board_table", "task_table", "member_table", "team_table", "user_table",
+    "setting_table", "revision_table", "tombstone_table", "cascade_job_table", "schema_migrations",
+)
+
+
+# ────────────────────────────────
+# 0.  예전 layout + 합성 데이터
+# ────────────────────────────────
+
+
+def base_tables() -> List[str]:
+    """mysql.txt 의 CREATE TABLE 블록 (주석 / select / drop 줄 제외)"""
+    return re.findall(r"CREATE TABLE .*?\n\);", BASE_SCHEMA.read_text(encoding="utf-8"), re.S)
+
+
+def reset_schema(connection, cursor) -> None:
+    import migrate
+
+    cursor.execute("SET FOREIGN_KEY_CHECKS=0")
+    for table in DROP_ORDER:
+        cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute("SET FOREIGN_KEY_CHECKS=1")
+    for ddl in base_tables():
+        cursor.execute(ddl)
+    # mysql.txt 의 task_target UNIQUE 는 0001 이전 초기 스키마 흔적 – 합성 데이터와 맞지 않아 제거
+    cursor.execute("ALTER TABLE task_table DROP INDEX task_target")
+    migrate.migrate_up(connection=connection, cursor=cursor, target=4)
+
+
+def _team(i: int) -> str:
+    return f"team-{i:05d}"
+
+
+def _email(team: int, j: int) -> str:
+    return f"user{j}@team{team:05d}.example.com"
+
+
+def seed(connection, cursor, args) -> Dict[str, int]:
+    rng = random.Random(args.seed)
+    states = ("TODO", "DOING", "DONE")
+    counts = {"team": args.teams, "task": 0, "card": 0, "member": 0}
+    for i in range(args.teams):
+        team = _team(i)
+        members = [_email(i, j) for j in range(args.members)]
+        cursor.executemany(
+            "INSERT INTO member_table (team_name, user_email, user_owner, revision) VALUES (%s, %s, %s, 1)",
+            [(team, email, int(j == 0)) for j, email in enumerate(members)],
+        )
+        tasks = []
+        for k in range(args.tasks):
+            start = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            tasks.append((team, f"task {k}", start, start, rng.choice(states), rng.randint(0, 11),
+                          team, rng.choice(members)))
+        cursor.executemany(
+            """
+            INSERT INTO task_table
+                (team_name, task_name, task_start, task_end, task_state, task_color, task_target, user_email, revision)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 1)
+            """,
+            tasks,
+        )
+        cards = [
+            (team, f"board {b}", b % 12, f"card {c}", "content " * 8)
+            for b in range(args.boards) for c in range(args.cards)
+        ]
+        cursor.executemany(
+            """
+            INSERT INTO board_table (team_name, board_name, board_color, card_name, card_content, revision)
+            VALUES (%s, %s, %s, %s, %s, 1)
+            """,
+            cards,
+        )
+        cursor.execute("INSERT INTO revision_table (team_name, revision) VALUES (%s, 1)", (team,))
+        counts["task"] += len(tasks)
+        counts["card"] += len(cards)
+        counts["member"] += len(members)
+        if i % 100 == 99:
+            connection.commit()
+    connection.commit()
+    cursor.execute("ANALYZE TABLE task_table, board_table, member_table")
+    cursor.fetchall()
+    return counts
+
+
+def table_bytes(cursor) -> Dict[str, int]:
+    cursor.execute(
+        """
+        SELECT table_name, data_length + index_length FROM information_schema.tables
+         WHERE table_schema = DATABASE()
+           AND table_name IN ('team_table', 'task_table', 'board_table', 'card_table', 'member_table')
+        """
+    )
+    return {name: int(size) for name, size in cursor.fetchall()}
+
+
+# ────────────────────────────────
+# 1.  측정 케이스 (before = 예전 SQL, after = rds.py)
+# ────────────────────────────────
+
+# case(connection, cursor, team_index) – 결과 행 수 반환
+Case = Callable[[Any, Any, int], int]
+
+
+def _query(sql: str, params: Callable[[int], Tuple[Any, ...]]) -> Case:
+    def run(connection, cursor, i: int) -> int:
+        cursor.execute(sql, params(i))
+        return len(cursor.fetchall())
+    return run
+
+
+def _old_update_board(connection, cursor, i: int) -> int:
+    import rds
+
+    revision = rds._bump_revision(cursor, _team(i))
+    n = cursor.execute(
+        "UPDATE board_table SET board_color=%s, revision=%s WHERE team_name=%s AND board_name=%s",
+        (i % 12, revision, _team(i), "board 0"),
+    )
+    connection.commit()
+    return n
+
+
+BEFORE: Dict[str, Case] = {
+    "load_task": _query(
+        "SELECT * FROM task_table WHERE (team_name=%s OR (task_target=%s AND user_email=%s)) AND task_state <> 'DONE'",
+        lambda i: (_team(i), _team(i), _email(i, 0)),
+    ),
+    "load_task_page": _query(
+        """
+        SELECT * FROM (
+            (SELECT * FROM task_table WHERE team_name=%s AND task_state <> 'DONE' ORDER BY task_end, id LIMIT 50)
+            UNION
+            (SELECT * FROM task_table WHERE task_target=%s AND user_email=%s AND task_state <> 'DONE'
+              ORDER BY task_end, id LIMIT 50)
+        ) page ORDER BY task_end, id LIMIT 50
+        """,
+        lambda i: (_team(i), _team(i), _email(i, 0)),
+    ),
+    "load_board": _query(
+        "SELECT * FROM board_table WHERE team_name=%s AND board_name=%s",
+        lambda i: (_team(i), "board 0"),
+    ),
+    "load_team_boards": _query(
+        "SELECT * FROM board_table WHERE team_name=%s ORDER BY board_name, id",
+        lambda i: (_team(i),),
+    ),
+    "load_member": _query("SELECT * FROM member_table WHERE team_name=%s", lambda i: (_team(i),)),
+    "sync_task": _query(
+        "SELECT * FROM task_table WHERE team_name=%s AND revision > %s AND revision <= %s",
+        lambda i: (_team(i), 0, 1 << 40),
+    ),
+    "update_board": _old_update_board,
+}
+
+
+def _after() -> Dict[str, Case]:
+    import rds
+
+    def rows(func: Callable[..., Any], **kwargs: Callable[[int], Any]) -> Case:
+        def run(connection, cursor, i: int) -> int:
+            return len(func(cursor=cursor, **{k: f(i) for k, f in kwargs.items()}))
+        return run
+
+    def update_board(connection, cursor, i: int) -> int:
+        rds.update_board_to_db(
+            connection=connection, cursor=cursor, team_name=_team(i), board_name="board 0", board_color=i % 12,
+        )
+        return 1
+
+    return {
+        "load_task": rows(rds.load_task_from_db, team_name=_team, task_target=_team,
+                          user_email=lambda i: _email(i, 0)),
+        "load_task_page": rows(rds.load_task_from_db, team_name=_team, task_target=_team,
+                               user_email=lambda i: _email(i, 0), limit=lambda i: 50),
+        "load_board": rows(rds.load_board_from_db, team_name=_team, board_name=lambda i: "board 0"),
+        "load_team_boards": rows(rds._load_team_boards, team_name=_team, table_name=lambda i: "card_table"),
+        "load_member": rows(rds.load_member_from_db, team_name=_team),
+        "sync_task": lambda connection, cursor, i: _query(
+            rds.SQL_CHANGED_TASKS["task_table", ""], lambda i: (rds._find_team(cursor, _team(i)), 0, 1 << 40),
+        )(connection, cursor, i),
+        "update_board": update_board,
+    }
+
+
+def measure(connection, cursor, cases: Dict[str, Case], args) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(args.seed)
+    result = {}
+    for name, case in cases.items():
+        samples, n = [], 0
+        for _ in range(args.repeat):
+            i = rng.randrange(args.teams)
+            start = time.perf_counter()
+            n = case(connection, cursor, i)
+            samples.append((time.perf_counter() - start) * 1000)
+        connection.commit()  # 읽기 스냅샷 정리
+        samples.sort()
+        result[name] = {
+            "rows": n,
+            "mean_ms": round(statistics.fmean(samples), 3),
+            "p50_ms": round(samples[len(samples) // 2], 3),
+            "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+        }
+    return result
+
+
+# ────────────────────────────────
+# 2.  CLI
+# ────────────────────────────────
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database", required=True, help="scratch DB 이름 (테이블을 모두 DROP 함)")
+    parser.add_argument("--teams", type=int, default=500)
+    parser.add_argument("--tasks", type=int, default=200, help="팀별 task 수")
+    parser.add_argument("--boards", type=int, default=6, help="팀별 board 수")
+    parser.add_argument("--cards", type=int, default=10, help="board 별 card 수")
+    parser.add_argument("--members", type=int, default=8, help="팀별 member 수")
+    parser.add_argument("--repeat", type=int, default=500, help="케이스당 반복 횟수 (팀은 무작위)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    load_dotenv()
+    os.environ["DATABASE"] = args.database
+    import migrate
+    import rds
+
+    connection, cursor = rds.init_db()
+    try:
+        reset_schema(connection, cursor)
+        counts = seed(connection, cursor, args)
+        result: Dict[str, Any] = {"rows": counts, "bytes_before": table_bytes(cursor)}
+        result["before"] = measure(connection, cursor, BEFORE, args)
+
+        start = time.perf_counter()
+        migrate.migrate_up(connection=connection, cursor=cursor, target=5)
+        result["migration_s"] = round(time.perf_counter() - start, 3)
+        cursor.execute("ANALYZE TABLE team_table, task_table, board_table, card_table, member_table")
+        cursor.fetchall()
+        result["bytes_after"] = table_bytes(cursor)
+        result["after"] = measure(connection, cursor, _after(), args)
+    finally:
+        rds.close_db(connection=connection, cursor=cursor)
+
+    result["speedup_p50"] = {
+        name: round(result["before"][name]["p50_ms"] / max(result["after"][name]["p50_ms"], 1e-6), 2)
+        for name in BEFORE
+    }
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+benchmark_sql.py – Micro-benchmark: f-string SQL vs statements.Statement registry
+
+DB 없이 rds.py 쿼리 한 번에 드는 클라이언트 쪽 비용만 잰다.
+  build  : SQL 텍스트 만들기 (예전 f-string 조립 vs 미리 compile 된 Statement 조회)
+  format : build + pymysql 방식 파라미터 escape / % 치환 (cursor.mogrify 와 같은 경로)
+  bytes  : 서버로 보내는 SQL 텍스트 길이 (공백 정리 효과)
+
+    python3 benchmark_sql.py
+    python3 benchmark_sql.py --number 200000 --out sql.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+from pymysql.converters import escape_item
+
+import rds
+
+# ────────────────────────────────
+# 0.  예전 방식 (f-string, 매 호출 조립)
+# ────────────────────────────────
+
+
+def old_load_user(table_name: str = "user_table") -> str:
+    return f"SELECT * FROM {table_name} WHERE user_email=%s"
+
+
+def old_load_task_page(table_name: str = "task_table") -> str:
+    filters: List[str] = ["task_state <> 'DONE'", "task_end >= %s",
+                          "(task_end > %s OR (task_end = %s AND id > %s))"]
+    extra = "".join(f" AND {f}" for f in filters)
+    return f"""
+            SELECT * FROM (
+                (SELECT * FROM {table_name} WHERE team_name=%s{extra}
+                  ORDER BY task_end, id LIMIT %s)
+                UNION
+                (SELECT * FROM {table_name} WHERE task_target=%s AND user_email=%s{extra}
+                  ORDER BY task_end, id LIMIT %s)
+            ) page
+            ORDER BY task_end, id LIMIT %s
+        """
+
+
+def old_update_task(table_name: str = "task_table") -> str:
+    sets = ["task_state=%s", "revision=%s"]
+    return f"UPDATE {table_name} SET {', '.join(sets)} WHERE team_name=%s AND task_name=%s"
+
+
+# ────────────────────────────────
+# 1.  registry 방식
+# ────────────────────────────────
+
+_PAGE_EXTRA = rds.TASK_FILTERS[0] + rds.TASK_FILTERS[1] + rds.TASK_FILTERS[3]
+
+
+def new_load_user(table_name: str = "user_table") -> str:
+    return rds.SQL_LOAD_USER[table_name]
+
+
+def new_load_task_page(table_name: str = "task_table") -> str:
+    return rds.SQL_LOAD_TASK_PAGE[table_name, _PAGE_EXTRA]
+
+
+def new_update_task(table_name: str = "task_table") -> str:
+    return rds.SQL_UPDATE_TASK[table_name, "task_state=%s"]
+
+
+PAGE_ARGS = ("team-1", "2025-07-01", "2025-07-10", "2025-07-10", 42, 50,
+             "team-1", "user@example.com", "2025-07-01", "2025-07-10", "2025-07-10", 42, 50, 50)
+
+CASES: List[Tuple[str, Callable[[], str], Callable[[], str], Tuple[Any, ...]]] = [
+    ("load_user", old_load_user, new_load_user, ("user@example.com",)),
+    ("load_task_page", old_load_task_page, new_load_task_page, PAGE_ARGS),
+    ("update_task", old_update_task, new_update_task, ("DONE", 17, "team-1", "task")),
+]
+
+
+def _format(build: Callable[[], str], args: Tuple[Any, ...]) -> str:
+    return build() % tuple(escape_item(a, "utf8mb4") for a in args)
+
+
+def measure(number: int) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for name, old, new, args in CASES:
+        row: Dict[str, Any] = {}
+        for label, build in (("old", old), ("new", new)):
+            row[f"{label}_build_ns"] = timeit.timeit(build, number=number) / number * 1e9
+            row[f"{label}_format_ns"] = timeit.timeit(lambda: _format(build, args), number=number) / number * 1e9
+            row[f"{label}_bytes"] = len(build().encode())
+        row["saved_build_ns"] = row["old_build_ns"] - row["new_build_ns"]
+        row["saved_bytes"] = row["old_bytes"] - row["new_bytes"]
+        result[name] = {k: round(v, 1) if isinstance(v, float) else v for k, v in row.items()}
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=100000, help="케이스당 반복 횟수")
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    result = measure(args.number)
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+cache.py – In-process read cache for Planit (FastAPI)
+
+* TTL + LRU 제거, 대략적인 메모리 상한 (max_bytes)
+* 태그 기반 무효화 : 항목마다 태그를 달고, 쓰기 시 태그 단위로 삭제
+* hit / miss / eviction 카운터
+
+프로세스 로컬 캐시이므로 다른 worker 의 쓰기는 TTL 이 지나야 반영된다.
+ttl = 0 이면 비활성 (get 은 항상 miss, set 은 무시).
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, NamedTuple, Set, Tuple
+
+
+def _sizeof(value: Any) -> int:
+    """rows(tuple/list/dict 중첩) 기준 대략적인 바이트 수"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _sizeof(k) + _sizeof(v)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            size += _sizeof(item)
+    return size
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires: float
+    size: int
+    tags: Tuple[Hashable, ...]
+
+
+class QueryCache:
+    def __init__(self, *, ttl: float = 0.0, max_entries: int = 2048, max_bytes: int = 32 << 20):
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._tags: Dict[Hashable, Set[Hashable]] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.configure(ttl=ttl, max_entries=max_entries, max_bytes=max_bytes)
+
+    def configure(self, *, ttl: float, max_entries: int, max_bytes: int) -> None:
+        with self._lock:
+            self.ttl = ttl
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._shrink()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    # ── 조회 / 저장 ────────────────────
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        if not self.enabled:
+            return False, None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry.expires < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[Hashable] = ()) -> None:
+        if not self.enabled:
+            return
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return
+        tags = tuple(set(tags))
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = _Entry(value, time.monotonic() + self.ttl, size, tags)
+            self._bytes += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            self._shrink()
+
+    # ── 무효화 ────────────────────────
+    def invalidate(self, *tags: Hashable) -> int:
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in self._tags.pop(tag, ()):
+                    if key in self._data:
+                        self._remove(key)
+                        removed += 1
+            self.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    # ── 내부 (lock 보유 상태에서 호출) ─────
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key)
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _shrink(self) -> None:
+        while self._data and (len(self._data) > self.max_entries or self._bytes > self.max_bytes):
+            self._remove(next(iter(self._data)))      # 가장 오래 안 쓴 항목
+            self.evictions += 1
+
+    # ── 통계 ──────────────────────────
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+__all__ = ["QueryCache"]
@@ -0,0 +1,225 @@
+"""
+events.py – Team change notifications for Planit (FastAPI)
+
+쓰기 핸들러가 hub.publish(team_name, event) 를 호출하면
+해당 팀을 구독 중인 WebSocket 클라이언트에게 event 가 전달된다.
+
+    handler ─ publish ─▶ Broker ─ deliver ─▶ EventHub ─▶ Subscription(queue) ─▶ WebSocket
+
+* Broker  : worker 간 전달 담당 인터페이스. EVENT_BROKER 로 선택 (load_broker)
+    local                      LocalBroker – 같은 프로세스 안에서 바로 전달 (WORKERS=1 / 테스트)
+    events:UnixSocketBroker    같은 호스트의 worker 끼리 Unix datagram socket fan-out (WORKERS>1)
+    "module:Class"             그 밖의 구현 (Redis pub/sub 등)
+* 느린 클라이언트 : 큐가 가득 차면 밀린 event 를 버리고 {"type": "resync"} 하나만 남긴다
+                    → 클라이언트는 /sync 로 따라잡는다. publish 쪽은 절대 기다리지 않음.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import logging
+import os
+import socket
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Set
+
+log = logging.getLogger("planit.events")
+
+Event = Dict[str, Any]
+Deliver = Callable[[str, Event], None]
+
+RESYNC: Event = {"type": "resync"}
+
+
+# ────────────────────────────────
+# 0.  Broker
+# ────────────────────────────────
+
+
+class Broker(ABC):
+    @abstractmethod
+    async def start(self, deliver: Deliver) -> None:
+        """수신 시작 – 다른 worker 의 event 도 deliver(team_name, event) 로 넘긴다"""
+
+    @abstractmethod
+    async def publish(self, team_name: str, event: Event) -> None:
+        """모든 worker 의 deliver 로 전달 (자기 자신 포함)"""
+
+    async def close(self) -> None:
+        pass
+
+
+class LocalBroker(Broker):
+    """같은 프로세스 안에서만 전달 (단일 worker / 테스트용)"""
+
+    def __init__(self):
+        self._deliver: Deliver | None = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def publish(self, team_name: str, event: Event) -> None:
+        if self._deliver is not None:
+            self._deliver(team_name, event)
+
+
+class UnixSocketBroker(Broker):
+    """
+    같은 호스트의 여러 worker 사이 fan-out – 외부 서비스 없이 WORKERS>1 에서 쓰는 stand-in
+    * worker 마다 directory/<pid>.sock 에 datagram socket 을 열고 (event loop reader 로 수신)
+    * publish 는 자기 구독자에게 바로 넘긴 뒤 directory 의 다른 .sock 모두에 JSON datagram 하나씩
+    * 응답 없는 socket (죽은 worker) 은 지우고, 받는 쪽 버퍼가 가득 차면 그 event 는 버린다
+      (구독자는 resync / /sync 로 따라잡는다 – publish 쪽은 기다리지 않음)
+    directory 기본값 = EVENT_SOCKET_DIR (없으면 <tmp>/planit-events). 호스트를 넘지는 않는다.
+    """
+
+    SUFFIX = ".sock"
+
+    def __init__(self, directory: str | None = None):
+        self.directory = directory or os.environ.get("EVENT_SOCKET_DIR") or \
+            os.path.join(tempfile.gettempdir(), "planit-events")
+        self.path = os.path.join(self.directory, f"{os.getpid()}-{id(self):x}{self.SUFFIX}")
+        self.dropped = 0
+        self._deliver: Deliver | None = None
+        self._socket: socket.socket | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def start(self, deliver: Deliver) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._deliver = deliver
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+        self._socket.bind(self.path)
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._socket.fileno(), self._receive)
+
+    def _receive(self) -> None:
+        while True:
+            try:
+                data = self._socket.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            try:
+                team_name, event = json.loads(data)
+            except ValueError:
+                log.warning("event broker: dropped malformed datagram (%d bytes)", len(data))
+                continue
+            self._deliver(team_name, event)
+
+    def _peers(self):
+        with os.scandir(self.directory) as entries:
+            return [entry.path for entry in entries if entry.name.endswith(self.SUFFIX) and entry.path != self.path]
+
+    async def publish(self, team_name: str, event: Event) -> None:
+        if self._deliver is None:
+            return
+        self._deliver(team_name, event)
+        data = json.dumps([team_name, event], default=str, separators=(",", ":")).encode()
+        for path in self._peers():
+            try:
+                self._socket.sendto(data, path)
+            except BlockingIOError:                 # 받는 worker 가 밀려 있음
+                self.dropped += 1
+            except (ConnectionRefusedError, FileNotFoundError):
+                try:                                # 죽은 worker 가 남긴 socket
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+    async def close(self) -> None:
+        if self._socket is not None:
+            self._loop.remove_reader(self._socket.fileno())
+            self._socket.close()
+            self._socket = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        self._deliver = None
+
+
+def load_broker(spec: str) -> Broker:
+    """ "local" 또는 "package.module:ClassName" (ratelimit.load_store 와 같은 모양) """
+    if spec in ("", "local"):
+        return LocalBroker()
+    module, _, name = spec.partition(":")
+    broker = getattr(importlib.import_module(module), name)()
+    if not isinstance(broker, Broker):
+        raise TypeError(f"{spec} is not a Broker")
+    return broker
+
+
+# ────────────────────────────────
+# 1.  Hub / Subscription
+# ────────────────────────────────
+
+
+class Subscription:
+    def __init__(self, team_name: str, maxsize: int):
+        self.team_name = team_name
+        self.dropped = 0
+        self._queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize)
+
+    def offer(self, event: Event) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 밀린 event 를 모두 버리고 resync 로 대체
+            self.dropped += self._queue.qsize()
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(RESYNC)
+
+    async def get(self) -> Event:
+        return await self._queue.get()
+
+
+class EventHub:
+    def __init__(self, broker: Broker | None = None, *, queue_size: int = 100):
+        self.broker = broker or LocalBroker()
+        self.queue_size = queue_size
+        self.published = 0
+        self._subs: Dict[str, Set[Subscription]] = {}
+
+    async def start(self) -> None:
+        await self.broker.start(self._deliver)
+
+    async def close(self) -> None:
+        await self.broker.close()
+
+    def subscribe(self, team_name: str) -> Subscription:
+        sub = Subscription(team_name, self.queue_size)
+        self._subs.setdefault(team_name, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subs.get(sub.team_name)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._subs[sub.team_name]
+
+    async def publish(self, team_name: str | None, event: Event) -> None:
+        if not team_name:           # 개인 할 일(team_name='')은 알리지 않음
+            return
+        self.published += 1
+        await self.broker.publish(team_name, {"team_name": team_name, **event})
+
+    def _deliver(self, team_name: str, event: Event) -> None:
+        for sub in tuple(self._subs.get(team_name, ())):
+            sub.offer(event)
+
+    def stats(self) -> Dict[str, Any]:
+        subs = [sub for group in self._subs.values() for sub in group]
+        return {
+            "teams": len(self._subs),
+            "subscribers": len(subs),
+            "published": self.published,
+            "dropped": sum(sub.dropped for sub in subs),
+        }
+
+
+__all__ = ["Broker", "LocalBroker", "UnixSocketBroker", "load_broker", "EventHub", "Subscription", "RESYNC"]
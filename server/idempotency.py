@@ -0,0 +1,168 @@
+"""
+idempotency.py – Idempotency-Key 처리 (/add_task, /add_board, /add_member)
+
+* 같은 (route, key) 요청은 한 번만 실행하고, 재시도에는 첫 응답(status, body)을 그대로 돌려준다
+* 메모리 : TTL + LRU (max_entries) 로 제한된 완료 결과 + 같은 worker 안 동시 재시도는 첫 요청을 기다림
+* DB (shared=True) : idempotency_table claim 을 쓰기와 같은 트랜잭션에 넣어 worker 간에도 한 번만
+  (rds.run_idempotent_to_db) – 메모리에 없을 때만 DB 를 거친다
+* fingerprint = 요청 본문 해시 → 같은 key 로 다른 본문이면 IdempotencyMismatch
+* 다른 요청이 아직 처리 중이면 IdempotencyConflict (클라이언트는 잠시 후 재시도)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Tuple
+
+from metrics import IDEMPOTENCY_REQUESTS
+from rds import prune_idempotency_from_db, run_idempotent_to_db
+
+log = logging.getLogger("planit.idempotency")
+
+# db.call 과 같은 모양 : call(func, **kwargs)
+Call = Callable[..., Awaitable[Any]]
+
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyConflict(RuntimeError):
+    """같은 key 의 첫 요청이 아직 처리 중"""
+
+
+class IdempotencyMismatch(ValueError):
+    """같은 key 로 본문이 다른 요청"""
+
+
+class Record(NamedTuple):
+    fingerprint: str
+    status: int
+    body: str
+    expires: float
+
+
+def fingerprint(payload: Dict[str, Any]) -> str:
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+class IdempotencyStore:
+    def __init__(self, call: Call, *, ttl: float = 86400.0, max_entries: int = 10000,
+                 shared: bool = True, prune_interval: float = 600.0):
+        self._call = call
+        self._done: "OrderedDict[Tuple[str, str], Record]" = OrderedDict()
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._task: asyncio.Task | None = None
+        self.configure(ttl=ttl, max_entries=max_entries, shared=shared, prune_interval=prune_interval)
+
+    def configure(self, *, ttl: float, max_entries: int, shared: bool, prune_interval: float) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.shared = shared
+        self.prune_interval = prune_interval
+        while len(self._done) > max_entries:
+            self._done.popitem(last=False)
+
+    # ── 메모리 ──
+    def _get(self, key: Tuple[str, str]) -> Record | None:
+        record = self._done.get(key)
+        if record is None:
+            return None
+        if record.expires <= time.monotonic():
+            del self._done[key]
+            return None
+        self._done.move_to_end(key)
+        return record
+
+    def _put(self, key: Tuple[str, str], record: Record) -> None:
+        self._done[key] = record
+        self._done.move_to_end(key)
+        while len(self._done) > self.max_entries:
+            self._done.popitem(last=False)
+
+    def _replay(self, route: str, record: Record, digest: str, outcome: str) -> Record:
+        if record.fingerprint != digest:
+            IDEMPOTENCY_REQUESTS.inc(route, "mismatch")
+            raise IdempotencyMismatch("Idempotency-Key reused with a different request body")
+        IDEMPOTENCY_REQUESTS.inc(route, outcome)
+        return record
+
+    # ── 실행 ──
+    async def run(self, route: str, key: str, payload: Dict[str, Any], func, **kwargs: Any) -> Tuple[bool, Record]:
+        """
+        반환 (replayed, record)
+          replayed=False : 이번에 func(**kwargs) 실행 (notify 같은 후속 작업은 이때만)
+          replayed=True  : 저장된 결과
+        """
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise ValueError(f"Idempotency-Key must be 1..{MAX_KEY_LENGTH} characters")
+        digest = fingerprint(payload)
+        slot = (route, key)
+        while True:
+            record = self._get(slot)
+            if record is not None:
+                return True, self._replay(route, record, digest, "hit_memory")
+            pending = self._pending.get(slot)
+            if pending is None:
+                break
+            await asyncio.shield(pending)           # 같은 worker 의 동시 재시도 → 첫 요청 결과를 기다렸다가 다시 확인
+            if self._get(slot) is None:             # 첫 요청 실패 → 이번 요청이 실행
+                continue
+
+        pending = self._pending[slot] = asyncio.get_running_loop().create_future()
+        try:
+            if self.shared:
+                replayed, stored, status, body = await self._call(
+                    run_idempotent_to_db,
+                    route=route, idem_key=key, fingerprint=digest, ttl=int(self.ttl),
+                    func=func, kwargs=kwargs, table_name="idempotency_table",
+                )
+                if status is None:
+                    IDEMPOTENCY_REQUESTS.inc(route, "conflict")
+                    raise IdempotencyConflict("request with this Idempotency-Key is in progress")
+            else:
+                result = await self._call(func, **kwargs)
+                replayed, stored, status = False, digest, 200
+                body = json.dumps(result, default=str, ensure_ascii=False)
+            record = Record(stored, status, body, time.monotonic() + self.ttl)
+            if replayed:
+                record = self._replay(route, record, digest, "hit_db")
+            else:
+                IDEMPOTENCY_REQUESTS.inc(route, "miss")
+            self._put(slot, record)
+            return replayed, record
+        finally:
+            del self._pending[slot]
+            pending.set_result(None)
+
+    # ── 만료 행 정리 (shared 일 때) ──
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.prune_interval)
+            try:
+                await self._call(prune_idempotency_from_db, table_name="idempotency_table")
+            except Exception:
+                log.exception("idempotency prune failed")
+
+    async def start(self) -> None:
+        if self.shared and self.prune_interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._done), "pending": len(self._pending), "shared": int(self.shared)}
+
+
+__all__ = ["IdempotencyStore", "IdempotencyConflict", "IdempotencyMismatch", "Record", "fingerprint"]
@@ -0,0 +1,254 @@
+"""
+metrics.py – Query / request instrumentation for Planit (FastAPI)
+
+* Histogram / Counter / Gauge + Prometheus text 출력 (render)
+* InstrumentedCursor : cursor.execute / executemany / fetch* 시간과 행 수를 기록
+    - 라벨 = 현재 rds 함수 이름 (AsyncDB 가 query_label 에 설정)
+    - SLOW_QUERY_MS 를 넘으면 planit.sql logger 로 JSON 한 줄 기록
+* pool 대기 시간, rds 함수 전체 시간, HTTP route 지연은 각 계층에서 observe
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+# rds 함수 이름 – worker thread 안에서 AsyncDB 가 설정
+query_label: ContextVar[str] = ContextVar("query_label", default="-")
+
+slow_log = logging.getLogger("planit.sql")
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROW_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+
+LabelKey = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+# ────────────────────────────────
+# 0.  Metric 종류
+# ────────────────────────────────
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_labels(self.labelnames, k)} {v}" for k, v in items
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[LabelKey, List[float]] = {}     # [bucket counts..., +Inf, sum]
+
+    def observe(self, *labels: str, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            data = self._values.get(labels)
+            if data is None:
+                data = self._values[labels] = [0.0] * (len(self.buckets) + 2)
+            data[index] += 1
+            data[-1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        lines = self._header()
+        for key, data in items:
+            cumulative = 0.0
+            for bound, n in zip(self.buckets, data):
+                cumulative += n
+                le = _labels(self.labelnames, key, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            cumulative += data[len(self.buckets)]
+            le = _labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {data[-1]}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        """render 직전에 호출 (캐시 통계 같은 값을 Gauge 로 옮겨 담는 용도)"""
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        for collect in self._collectors:
+            collect()
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+DB_QUERY_SECONDS = REGISTRY.register(Histogram(
+    "planit_db_query_seconds", "cursor execute/fetch time by rds function", ("function", "phase")))
+DB_QUERY_ROWS = REGISTRY.register(Histogram(
+    "planit_db_query_rows", "rows returned per fetch by rds function", ("function",), ROW_BUCKETS))
+DB_SLOW_QUERIES = REGISTRY.register(Counter(
+    "planit_db_slow_queries_total", "statements slower than SLOW_QUERY_MS", ("function",)))
+DB_CALL_SECONDS = REGISTRY.register(Histogram(
+    "planit_db_call_seconds", "rds function time incl. pool wait", ("function",)))
+POOL_WAIT_SECONDS = REGISTRY.register(Histogram(
+    "planit_pool_wait_seconds", "time to check out a pooled connection"))
+HTTP_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "planit_http_request_seconds", "request latency by route", ("method", "route", "status")))
+COMPONENT_STATS = REGISTRY.register(Gauge(
+    "planit_component_stat", "pool / cache / event hub counters at scrape time", ("component", "stat")))
+IDEMPOTENCY_REQUESTS = REGISTRY.register(Counter(
+    "planit_idempotency_requests_total",
+    "Idempotency-Key requests by outcome (miss / hit_memory / hit_db / conflict / mismatch)", ("route", "outcome")))
+RATE_LIMITED = REGISTRY.register(Counter(
+    "planit_rate_limited_total", "requests rejected with 429 by budget and reason (rate / team_concurrency)",
+    ("budget", "reason")))
+WRITE_BEHIND_UPDATES = REGISTRY.register(Counter(
+    "planit_write_behind_updates_total",
+    "write-behind color updates by kind and outcome (queued / coalesced / superseded / flushed / failed)",
+    ("kind", "outcome")))
+TASK_STATS_RECONCILED = REGISTRY.register(Counter(
+    "planit_task_stats_reconciled_total",
+    "teams checked by the task stats reconcile job (checked / fixed = summary had drifted from task_table)",
+    ("outcome",)))
+
+
+# ────────────────────────────────
+# 1.  Cursor 계측
+# ────────────────────────────────
+
+
+def _slow_threshold() -> float:
+    return float(os.getenv("SLOW_QUERY_MS", 200)) / 1000
+
+
+class InstrumentedCursor:
+    """pymysql cursor 래퍼 – 나머지 속성은 그대로 위임"""
+
+    def __init__(self, cursor: Any):
+        self._cursor = cursor
+        self._slow = _slow_threshold()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def _record(self, phase: str, started: float, statement: str = "", rows: int | None = None) -> None:
+        elapsed = time.perf_counter() - started
+        label = query_label.get()
+        DB_QUERY_SECONDS.observe(label, phase, value=elapsed)
+        if rows is not None:
+            DB_QUERY_ROWS.observe(label, value=rows)
+        if elapsed >= self._slow:
+            DB_SLOW_QUERIES.inc(label)
+            slow_log.warning(json.dumps({
+                "event": "slow_query", "function": label, "phase": phase,
+                "ms": round(elapsed * 1000, 3), "rows": rows,
+                "statement": " ".join(statement.split())[:500],
+            }, ensure_ascii=False))
+
+    def execute(self, query: str, args: Any = None) -> int:
+        started = time.perf_counter()
+        result = self._cursor.execute(query, args)
+        self._record("execute", started, query)
+        return result
+
+    def executemany(self, query: str, args: Any) -> int:
+        started = time.perf_counter()
+        result = self._cursor.executemany(query, args)
+        self._record("execute", started, query)
+        return result
+
+    def fetchone(self) -> Any:
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._record("fetch", started, rows=int(row is not None))
+        return row
+
+    def fetchmany(self, size: int | None = None) -> Any:
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(size) if size is not None else self._cursor.fetchmany()
+        self._record("fetch", started, rows=len(rows))
+        return rows
+
+    def fetchall(self) -> Any:
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._record("fetch", started, rows=len(rows))
+        return rows
+
+
+__all__ = [
+    "REGISTRY", "Registry", "Counter", "Gauge", "Histogram", "InstrumentedCursor", "query_label",
+    "DB_QUERY_SECONDS", "DB_QUERY_ROWS", "DB_SLOW_QUERIES", "DB_CALL_SECONDS",
+    "POOL_WAIT_SECONDS", "HTTP_REQUEST_SECONDS", "COMPONENT_STATS", "IDEMPOTENCY_REQUESTS",
+    "RATE_LIMITED", "WRITE_BEHIND_UPDATES", "TASK_STATS_RECONCILED",
+]
@@ -0,0 +1,274 @@
+"""
+migrate.py – Versioned schema migrations for Planit
+
+migrations/NNNN_<name>.up.sql / NNNN_<name>.down.sql 쌍을 순서대로 적용·롤백한다.
+적용 이력은 schema_migrations 테이블에 기록.
+
+    python3 migrate.py status           # 적용 현황
+    python3 migrate.py up [VERSION]     # VERSION 까지 (생략 시 최신) 적용
+    python3 migrate.py down [VERSION]   # VERSION 까지 (생략 시 1단계) 롤백
+    python3 migrate.py explain          # rds.py 조회문이 인덱스를 타는지 EXPLAIN 검사
+
+주의) MySQL DDL 은 암묵적 COMMIT 이라 파일 중간에서 실패하면 자동 복구되지 않는다.
+      파일 하나에는 되도록 ALTER TABLE 단위로 묶어 둘 것.
+      STORAGE_BACKEND=sqlite 는 대상이 아니다 – sqlite.sql 을 서버 시작 시 적용 (함께 고칠 것).
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+import rds
+from rds import close_db, init_backend, init_db
+from statements import Statement
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+_FILE_RE = re.compile(r"^(\d{4})_(\w+)\.(up|down)\.sql$")
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    up: Path
+    down: Path
+
+
+# ────────────────────────────────
+# 0.  migration 파일
+# ────────────────────────────────
+
+
+def discover(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    found: Dict[int, Dict[str, Any]] = {}
+    for path in directory.iterdir():
+        m = _FILE_RE.match(path.name)
+        if not m:
+            continue
+        version, name, direction = int(m.group(1)), m.group(2), m.group(3)
+        entry = found.setdefault(version, {"name": name})
+        if entry["name"] != name:
+            raise RuntimeError(f"migration {version:04d} has conflicting names")
+        entry[direction] = path
+    migrations = []
+    for version in sorted(found):
+        entry = found[version]
+        if "up" not in entry or "down" not in entry:
+            raise RuntimeError(f"migration {version:04d} needs both up and down files")
+        migrations.append(Migration(version, entry["name"], entry["up"], entry["down"]))
+    return migrations
+
+
+def split_statements(sql: str) -> List[str]:
+    """-- 주석 제거 후 ';' 로 끝나는 줄 단위로 분리 (DELIMITER 블록은 지원하지 않음)"""
+    statements, buf = [], []
+    for line in sql.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("--"):
+            continue
+        buf.append(line)
+        if stripped.endswith(";"):
+            statements.append("\n".join(buf).rstrip().rstrip(";"))
+            buf = []
+    if buf:
+        statements.append("\n".join(buf))
+    return statements
+
+
+# ────────────────────────────────
+# 1.  적용 / 롤백
+# ────────────────────────────────
+
+
+def _ensure_history(cursor) -> None:
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version     INT             PRIMARY KEY,
+            name        VARCHAR(255)    NOT NULL,
+            applied_at  DATETIME        NOT NULL    DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+
+def applied_versions(*, cursor) -> List[int]:
+    _ensure_history(cursor)
+    cursor.execute("SELECT version FROM schema_migrations ORDER BY version")
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _run_file(cursor, path: Path) -> None:
+    for statement in split_statements(path.read_text(encoding="utf-8")):
+        cursor.execute(statement)
+
+
+def migrate_up(*, connection, cursor, target: int | None = None) -> List[int]:
+    done = set(applied_versions(cursor=cursor))
+    applied = []
+    for mig in discover():
+        if target is not None and mig.version > target:
+            break
+        if mig.version in done:
+            continue
+        _run_file(cursor, mig.up)
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+            (mig.version, mig.name),
+        )
+        connection.commit()
+        applied.append(mig.version)
+    return applied
+
+
+def migrate_down(*, connection, cursor, target: int | None = None) -> List[int]:
+    """target 보다 큰 버전을 역순으로 롤백. target 생략 시 마지막 1개만."""
+    done = applied_versions(cursor=cursor)
+    if not done:
+        return []
+    if target is None:
+        target = done[-2] if len(done) > 1 else 0
+    by_version = {mig.version: mig for mig in discover()}
+    rolled = []
+    for version in reversed(done):
+        if version <= target:
+            break
+        _run_file(cursor, by_version[version].down)
+        cursor.execute("DELETE FROM schema_migrations WHERE version=%s", (version,))
+        connection.commit()
+        rolled.append(version)
+    return rolled
+
+
+# ────────────────────────────────
+# 2.  EXPLAIN 검사
+# ────────────────────────────────
+
+
+class ExplainCheck(NamedTuple):
+    label: str                  # rds 함수 이름[:용도]
+    statement: Statement        # rds.SQL_* – 서버가 실제로 실행하는 문장
+    key: Any                    # Statement key : 기본 테이블이면 None, 조각 자리가 있으면 (table, 조각 ...)
+    params: Tuple[Any, ...]     # 예시 값 (자리 수 = %s 수)
+    expected: Tuple[str, ...]   # 기대 인덱스 후보 (하나라도 쓰이면 OK)
+
+    @property
+    def sql(self) -> str:
+        return self.statement[self.key]
+
+
+HIDE_DONE, WINDOW_START, KEYSET = rds.TASK_FILTERS[0], rds.TASK_FILTERS[1], rds.TASK_FILTERS[3]
+DAY, EMAIL, CHUNK = "2025-03-01", "a@b.c", rds.CASCADE_CHUNK_SIZE
+TASK_INDEXES = ("ix_task_team_state", "ix_task_team_name", "ix_task_team_rev", "ix_task_team_end")
+
+# rds.py 의 Statement 를 그대로 EXPLAIN – 조각은 rds 의 필터 상수로 조합 (문장이 바뀌면 검사도 따라간다)
+EXPLAIN_CHECKS: List[ExplainCheck] = [
+    ExplainCheck("load_task_from_db", rds.SQL_LOAD_TASK, ("task_table", HIDE_DONE),
+                 (1, "target", EMAIL), ("ix_task_team_state", "ix_task_team_end", "ix_task_owner_end")),
+    ExplainCheck("load_task_from_db:page", rds.SQL_LOAD_TASK_PAGE, ("task_table", WINDOW_START + KEYSET),
+                 (1, DAY, DAY, DAY, 10, 50, "target", EMAIL, DAY, DAY, DAY, 10, 50, 50),
+                 ("ix_task_team_end", "ix_task_owner_end")),
+    ExplainCheck("load_user_task_from_db", rds.SQL_LOAD_USER_TASK_PAGE, ("task_table", rds.USER_TASK_FILTERS[1]),
+                 (EMAIL, DAY, 50, EMAIL, DAY, 50, 50), ("ix_member_user_team", "ix_task_owner_end")),
+    ExplainCheck("load_user_task_from_db:teams", rds.SQL_USER_TEAMS, None, (EMAIL,), ("ix_member_user_team",)),
+    ExplainCheck("_find_team", rds.SQL_TEAM_ID, None, ("team",), ("uq_team_name",)),
+    ExplainCheck("update_task_to_db", rds.SQL_UPDATE_TASK, ("task_table", "task_state=%s"),
+                 ("DONE", 5, 1, "task"), ("ix_task_team_name",)),
+    ExplainCheck("delete_task_from_db:team", rds.SQL_DELETE_TEAM_TASK, None, (1, "task"), ("ix_task_team_name",)),
+    ExplainCheck("delete_task_from_db:user", rds.SQL_DELETE_OWN_TASK, None, (EMAIL, "task"), ("ix_task_user_name",)),
+    ExplainCheck("load_board_from_db", rds.SQL_LOAD_BOARD, None, (1, "board"), ("uq_board_team_name",)),
+    ExplainCheck("load_team_snapshot_from_db:board", rds.SQL_LOAD_TEAM_BOARDS, None, (1,), ("uq_board_team_name",)),
+    ExplainCheck("update_card_to_db", rds.SQL_UPDATE_CARD, None,
+                 ("content", 5, 1, "board", "card"), ("uq_board_team_name", "ix_card_board_name")),
+    ExplainCheck("delete_card_from_db", rds.SQL_DELETE_CARD, None,
+                 (1, "board", "card"), ("uq_board_team_name", "ix_card_board_name")),
+    ExplainCheck("load_member_from_db:team", rds.SQL_LOAD_MEMBER, ("member_table", " WHERE t.team_id=%s"),
+                 (1,), ("uq_team_user", "ix_member_team_rev")),
+    ExplainCheck("load_member_from_db:user", rds.SQL_LOAD_MEMBER, ("member_table", " WHERE t.user_email=%s"),
+                 (EMAIL,), ("ix_member_user_team",)),
+    ExplainCheck("sync_team_from_db:task", rds.SQL_CHANGED_TASKS, ("task_table", ""),
+                 (1, 10, 20), ("ix_task_team_rev",)),
+    ExplainCheck("sync_team_from_db:board", rds.SQL_CHANGED_CARDS, None,
+                 (1, 10, 20), ("ix_card_board_rev", "uq_board_team_name")),
+    ExplainCheck("sync_team_from_db:member", rds.SQL_CHANGED_MEMBERS, None, (1, 10, 20), ("ix_member_team_rev",)),
+    ExplainCheck("sync_team_from_db:tombstone", rds.SQL_TOMBSTONES_SINCE, None,
+                 ("team", 10, 20), ("ix_tombstone_team_rev",)),
+    ExplainCheck("prune_tombstones_from_db", rds.SQL_PRUNE_TOMBSTONES, None, (30,), ("ix_tombstone_deleted_at",)),
+    ExplainCheck("delete_team_from_db:task", rds.SQL_DELETE_TEAM_CHUNK, "task_table", (1, CHUNK), TASK_INDEXES),
+    ExplainCheck("delete_team_from_db:card", rds.SQL_DELETE_TEAM_CARDS_CHUNK, None,
+                 (1, CHUNK), ("ix_card_board_name", "ix_card_board_rev")),
+    ExplainCheck("delete_team_from_db:board", rds.SQL_DELETE_TEAM_CHUNK, rds.BOARD_TABLE,
+                 (1, CHUNK), ("uq_board_team_name",)),
+    ExplainCheck("delete_team_from_db:member", rds.SQL_DELETE_TEAM_CHUNK, "member_table",
+                 (1, CHUNK), ("uq_team_user", "ix_member_team_rev")),
+    ExplainCheck("delete_user_from_db:member", rds.SQL_DELETE_EMAIL_CHUNK, None, (EMAIL, CHUNK), ("ix_member_user_team",)),
+    ExplainCheck("delete_user_from_db:task", rds.SQL_UNASSIGN_TASK_CHUNK, None, (EMAIL, CHUNK), ("ix_task_user_name",)),
+    ExplainCheck("load_task_stats_from_db", rds.SQL_LOAD_TASK_STATS, None, (DAY, DAY, DAY, 1), ("PRIMARY",)),
+    ExplainCheck("reconcile_task_stats_to_db", rds.SQL_TASK_STATS_ACTUAL, None, (1,), TASK_INDEXES),
+    ExplainCheck("run_idempotent_to_db", rds.SQL_LOAD_KEY, None, ("/add_task", "key"), ("PRIMARY",)),
+    ExplainCheck("prune_idempotency_from_db", rds.SQL_PRUNE_KEYS, None, (1000,), ("ix_idempotency_expires",)),
+]
+
+
+def explain_report(*, cursor) -> List[Tuple[str, str, str]]:
+    """
+    (label, status, detail) 목록
+      OK   : 실행 계획이 기대 인덱스를 사용
+      WARN : 후보(possible_keys)에는 있으나 선택 안 됨 (행 수가 적은 테이블에서 흔함)
+      FAIL : 후보에도 없음 → 인덱스 누락
+    """
+    report = []
+    for check in EXPLAIN_CHECKS:
+        cursor.execute("EXPLAIN " + check.sql, check.params)
+        columns = [d[0] for d in cursor.description]
+        rows = [dict(zip(columns, r)) for r in cursor.fetchall()]
+        used = {k for r in rows for k in str(r.get("key") or "").split(",") if k}
+        possible = {k for r in rows for k in str(r.get("possible_keys") or "").split(",") if k}
+        if used & set(check.expected):
+            status = "OK"
+        elif possible & set(check.expected):
+            status = "WARN"
+        else:
+            status = "FAIL"
+        report.append((check.label, status, f"key={sorted(used)} possible={sorted(possible)}"))
+    return report
+
+
+# ────────────────────────────────
+# 3.  CLI
+# ────────────────────────────────
+
+
+def main(argv: List[str]) -> int:
+    command = argv[0] if argv else "status"
+    target = int(argv[1]) if len(argv) > 1 else None
+    if init_backend().dialect != "mysql":
+        print("migrations are MySQL only – the sqlite backend creates its schema from sqlite.sql on startup")
+        return 2
+    connection, cursor = init_db()
+    try:
+        if command == "up":
+            print("applied:", migrate_up(connection=connection, cursor=cursor, target=target))
+        elif command == "down":
+            print("rolled back:", migrate_down(connection=connection, cursor=cursor, target=target))
+        elif command == "status":
+            done = set(applied_versions(cursor=cursor))
+            for mig in discover():
+                print(f"[{'x' if mig.version in done else ' '}] {mig.version:04d} {mig.name}")
+        elif command == "explain":
+            report = explain_report(cursor=cursor)
+            for label, status, detail in report:
+                print(f"{status:<4} {label:<32} {detail}")
+            return int(any(status == "FAIL" for _, status, _ in report))
+        else:
+            print(__doc__)
+            return 2
+    finally:
+        close_db(connection=connection, cursor=cursor)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
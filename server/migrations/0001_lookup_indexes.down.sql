@@ -0,0 +1,21 @@
+-- 0001 rollback : 인덱스 제거 + TEXT 복원
+
+ALTER TABLE member_table
+    DROP INDEX ix_member_user,
+    DROP INDEX uq_team_user,
+    MODIFY team_name    TEXT            NOT NULL,
+    ADD UNIQUE KEY uq_team_user     (team_name(255), user_email);
+
+ALTER TABLE board_table
+    DROP INDEX ix_board_team_board_card,
+    MODIFY team_name    TEXT            NOT NULL,
+    MODIFY board_name   TEXT            NOT NULL,
+    MODIFY card_name    TEXT            NOT NULL;
+
+ALTER TABLE task_table
+    DROP INDEX ix_task_user_name,
+    DROP INDEX ix_task_team_name,
+    DROP INDEX ix_task_target_user,
+    DROP INDEX ix_task_team_state,
+    MODIFY team_name    TEXT            NOT NULL,
+    MODIFY task_name    TEXT            NOT NULL;
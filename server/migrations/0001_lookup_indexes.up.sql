@@ -0,0 +1,25 @@
+-- 0001 : 조회 컬럼 TEXT → VARCHAR(255) + 복합 인덱스
+--   load_task_from_db    : team_name / (task_target, user_email) / task_state
+--   update/delete_task   : (team_name, task_name), (user_email, task_name)
+--   load/delete_board    : (team_name, board_name, card_name)
+--   load_member_from_db  : (team_name, user_email), user_email
+
+ALTER TABLE task_table
+    MODIFY team_name    VARCHAR(255)    NOT NULL,
+    MODIFY task_name    VARCHAR(255)    NOT NULL,
+    ADD INDEX ix_task_team_state    (team_name, task_state),
+    ADD INDEX ix_task_target_user   (task_target, user_email),
+    ADD INDEX ix_task_team_name     (team_name, task_name),
+    ADD INDEX ix_task_user_name     (user_email, task_name);
+
+ALTER TABLE board_table
+    MODIFY team_name    VARCHAR(255)    NOT NULL,
+    MODIFY board_name   VARCHAR(255)    NOT NULL,
+    MODIFY card_name    VARCHAR(255)    NOT NULL,
+    ADD INDEX ix_board_team_board_card  (team_name, board_name, card_name);
+
+ALTER TABLE member_table
+    MODIFY team_name    VARCHAR(255)    NOT NULL,
+    DROP INDEX uq_team_user,
+    ADD UNIQUE KEY uq_team_user     (team_name, user_email),
+    ADD INDEX ix_member_user        (user_email);
@@ -0,0 +1,20 @@
+-- 0002 rollback
+
+ALTER TABLE member_table
+    DROP INDEX ix_member_team_rev,
+    DROP COLUMN updated_at,
+    DROP COLUMN revision;
+
+ALTER TABLE board_table
+    DROP INDEX ix_board_team_rev,
+    DROP COLUMN updated_at,
+    DROP COLUMN revision;
+
+ALTER TABLE task_table
+    DROP INDEX ix_task_team_rev,
+    DROP COLUMN updated_at,
+    DROP COLUMN revision;
+
+DROP TABLE tombstone_table;
+
+DROP TABLE revision_table;
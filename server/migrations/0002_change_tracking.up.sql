@@ -0,0 +1,36 @@
+-- 0002 : delta sync 용 변경 추적
+--   revision_table  : 팀별 단조 증가 revision (쓰기 트랜잭션마다 +1, 팀 단위 쓰기 직렬화)
+--   revision 컬럼   : 행이 마지막으로 바뀐 revision
+--   tombstone_table : 삭제된 행 (table_name='*' 는 팀 전체 삭제)
+
+CREATE TABLE revision_table (
+    team_name           VARCHAR(255)        NOT NULL            PRIMARY KEY,
+    revision            BIGINT UNSIGNED     NOT NULL            DEFAULT 0,
+    pruned_revision     BIGINT UNSIGNED     NOT NULL            DEFAULT 0
+);
+
+CREATE TABLE tombstone_table (
+    id                  BIGINT              AUTO_INCREMENT      PRIMARY KEY,
+    table_name          VARCHAR(32)         NOT NULL,
+    row_id              INT                 NOT NULL,
+    team_name           VARCHAR(255)        NOT NULL,
+    revision            BIGINT UNSIGNED     NOT NULL,
+    deleted_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP,
+    INDEX ix_tombstone_team_rev     (team_name, revision),
+    INDEX ix_tombstone_deleted_at   (deleted_at)
+);
+
+ALTER TABLE task_table
+    ADD COLUMN revision     BIGINT UNSIGNED     NOT NULL    DEFAULT 0,
+    ADD COLUMN updated_at   TIMESTAMP(3)        NOT NULL    DEFAULT CURRENT_TIMESTAMP(3) ON UPDATE CURRENT_TIMESTAMP(3),
+    ADD INDEX ix_task_team_rev      (team_name, revision);
+
+ALTER TABLE board_table
+    ADD COLUMN revision     BIGINT UNSIGNED     NOT NULL    DEFAULT 0,
+    ADD COLUMN updated_at   TIMESTAMP(3)        NOT NULL    DEFAULT CURRENT_TIMESTAMP(3) ON UPDATE CURRENT_TIMESTAMP(3),
+    ADD INDEX ix_board_team_rev     (team_name, revision);
+
+ALTER TABLE member_table
+    ADD COLUMN revision     BIGINT UNSIGNED     NOT NULL    DEFAULT 0,
+    ADD COLUMN updated_at   TIMESTAMP(3)        NOT NULL    DEFAULT CURRENT_TIMESTAMP(3) ON UPDATE CURRENT_TIMESTAMP(3),
+    ADD INDEX ix_member_team_rev    (team_name, revision);
@@ -0,0 +1,6 @@
+-- 0003 rollback
+
+ALTER TABLE task_table
+    ADD INDEX ix_task_target_user   (task_target, user_email),
+    DROP INDEX ix_task_owner_end,
+    DROP INDEX ix_task_team_end;
@@ -0,0 +1,8 @@
+-- 0003 : load_task_from_db keyset 페이지 / 기간 필터용 인덱스
+--   (team_name, task_end) + PK(id) → 팀 조건에서 ORDER BY task_end, id 를 인덱스 순서로
+--   (task_target, user_email, task_end) 가 기존 (task_target, user_email) 를 대체
+
+ALTER TABLE task_table
+    ADD INDEX ix_task_team_end      (team_name, task_end),
+    ADD INDEX ix_task_owner_end     (task_target, user_email, task_end),
+    DROP INDEX ix_task_target_user;
@@ -0,0 +1,3 @@
+-- 0004 rollback
+
+DROP TABLE cascade_job_table;
@@ -0,0 +1,15 @@
+-- 0004 : 팀 / 사용자 삭제 cascade 작업 상태
+--   /delete_team, /delete_user 를 background 로 실행하면 여기에 진행 상황이 남는다
+--   (worker 가 여러 개여도 어느 worker 에서든 /cascade_job 으로 조회 가능)
+
+CREATE TABLE cascade_job_table (
+    id                  BIGINT              AUTO_INCREMENT      PRIMARY KEY,
+    kind                ENUM('team','user') NOT NULL,
+    target              VARCHAR(255)        NOT NULL,
+    state               ENUM('queued','running','done','failed') NOT NULL DEFAULT 'queued',
+    deleted             INT UNSIGNED        NOT NULL            DEFAULT 0,
+    error               TEXT                NULL,
+    created_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP,
+    updated_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX ix_cascade_state          (state, updated_at)
+);
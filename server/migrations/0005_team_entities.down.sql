@@ -0,0 +1,68 @@
+-- 0005 rollback – team_name 컬럼 / 카드 단위 board_table 로 되돌림 (id 유지)
+
+-- - - - card_table + board_table → board_table - - - #
+CREATE TABLE board_card_legacy (
+    id                  INT                 AUTO_INCREMENT      PRIMARY KEY,
+    team_name           VARCHAR(255)        NOT NULL,
+    board_name          VARCHAR(255)        NOT NULL,
+    board_color         TINYINT UNSIGNED    NOT NULL            DEFAULT 0,
+    card_name           VARCHAR(255)        NOT NULL,
+    card_content        TEXT                NOT NULL,
+    revision            BIGINT UNSIGNED     NOT NULL            DEFAULT 0,
+    updated_at          TIMESTAMP(3)        NOT NULL            DEFAULT CURRENT_TIMESTAMP(3) ON UPDATE CURRENT_TIMESTAMP(3),
+    INDEX ix_board_team_board_card  (team_name, board_name, card_name),
+    INDEX ix_board_team_rev         (team_name, revision)
+);
+
+INSERT INTO board_card_legacy
+    (id, team_name, board_name, board_color, card_name, card_content, revision, updated_at)
+SELECT c.id, tm.team_name, b.board_name, b.board_color, c.card_name, c.card_content, c.revision, c.updated_at
+  FROM card_table c
+  JOIN board_table b ON b.id = c.board_id
+  JOIN team_table tm ON tm.id = b.team_id;
+
+DROP TABLE card_table;
+
+DROP TABLE board_table;
+
+RENAME TABLE board_card_legacy TO board_table;
+
+-- - - - member_table - - - #
+ALTER TABLE member_table
+    DROP FOREIGN KEY fk_member_team,
+    ADD COLUMN team_name    VARCHAR(255)        NULL        AFTER id;
+
+UPDATE member_table t
+  JOIN team_table tm ON tm.id = t.team_id
+   SET t.team_name = tm.team_name;
+
+ALTER TABLE member_table
+    MODIFY team_name        VARCHAR(255)        NOT NULL,
+    DROP INDEX uq_team_user,
+    DROP INDEX ix_member_team_rev,
+    DROP COLUMN team_id,
+    ADD UNIQUE KEY uq_team_user     (team_name, user_email),
+    ADD INDEX ix_member_team_rev    (team_name, revision);
+
+-- - - - task_table - - - #
+ALTER TABLE task_table
+    DROP FOREIGN KEY fk_task_team,
+    ADD COLUMN team_name    VARCHAR(255)        NULL        AFTER id;
+
+UPDATE task_table t
+  JOIN team_table tm ON tm.id = t.team_id
+   SET t.team_name = tm.team_name;
+
+ALTER TABLE task_table
+    MODIFY team_name        VARCHAR(255)        NOT NULL,
+    DROP INDEX ix_task_team_state,
+    DROP INDEX ix_task_team_name,
+    DROP INDEX ix_task_team_rev,
+    DROP INDEX ix_task_team_end,
+    DROP COLUMN team_id,
+    ADD INDEX ix_task_team_state    (team_name, task_state),
+    ADD INDEX ix_task_team_name     (team_name, task_name),
+    ADD INDEX ix_task_team_rev      (team_name, revision),
+    ADD INDEX ix_task_team_end      (team_name, task_end);
+
+DROP TABLE team_table;
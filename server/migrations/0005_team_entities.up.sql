@@ -0,0 +1,101 @@
+-- 0005 : 팀 / board 를 정수 id 엔티티로 정규화
+--   team_table  : 팀 이름은 여기 한 곳에만 (개인 할 일 team_name '' 도 한 행)
+--   task_table / member_table : team_name(VARCHAR 255) → team_id(INT) FK, 인덱스 이름은 그대로
+--   board_table : (team_id, board_name) 엔티티 + board_color (예전에는 카드마다 중복 저장)
+--   card_table  : board_id FK, 예전 board_table 행 id 를 그대로 유지 (tombstone row_id 호환)
+-- revision_table / tombstone_table 은 계속 team_name 기준 (클라이언트 sync cursor 호환)
+
+CREATE TABLE team_table (
+    id                  INT                 AUTO_INCREMENT      PRIMARY KEY,
+    team_name           VARCHAR(255)        NOT NULL,
+    created_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_team_name         (team_name)
+);
+
+INSERT IGNORE INTO team_table (team_name)
+          SELECT team_name FROM task_table
+    UNION SELECT team_name FROM board_table
+    UNION SELECT team_name FROM member_table
+    UNION SELECT team_name FROM revision_table
+    UNION SELECT '';
+
+-- - - - task_table - - - #
+ALTER TABLE task_table
+    ADD COLUMN team_id      INT                 NULL        AFTER id;
+
+UPDATE task_table t
+  JOIN team_table tm ON tm.team_name = t.team_name
+   SET t.team_id = tm.id;
+
+ALTER TABLE task_table
+    MODIFY team_id          INT                 NOT NULL,
+    DROP INDEX ix_task_team_state,
+    DROP INDEX ix_task_team_name,
+    DROP INDEX ix_task_team_rev,
+    DROP INDEX ix_task_team_end,
+    DROP COLUMN team_name,
+    ADD INDEX ix_task_team_state    (team_id, task_state),
+    ADD INDEX ix_task_team_name     (team_id, task_name),
+    ADD INDEX ix_task_team_rev      (team_id, revision),
+    ADD INDEX ix_task_team_end      (team_id, task_end),
+    ADD CONSTRAINT fk_task_team     FOREIGN KEY (team_id) REFERENCES team_table (id);
+
+-- - - - member_table - - - #
+ALTER TABLE member_table
+    ADD COLUMN team_id      INT                 NULL        AFTER id;
+
+UPDATE member_table t
+  JOIN team_table tm ON tm.team_name = t.team_name
+   SET t.team_id = tm.id;
+
+ALTER TABLE member_table
+    MODIFY team_id          INT                 NOT NULL,
+    DROP INDEX uq_team_user,
+    DROP INDEX ix_member_team_rev,
+    DROP COLUMN team_name,
+    ADD UNIQUE KEY uq_team_user     (team_id, user_email),
+    ADD INDEX ix_member_team_rev    (team_id, revision),
+    ADD CONSTRAINT fk_member_team   FOREIGN KEY (team_id) REFERENCES team_table (id);
+
+-- - - - board_table → board_table + card_table - - - #
+RENAME TABLE board_table TO board_card_legacy;
+
+CREATE TABLE board_table (
+    id                  INT                 AUTO_INCREMENT      PRIMARY KEY,
+    team_id             INT                 NOT NULL,
+    board_name          VARCHAR(255)        NOT NULL,
+    board_color         TINYINT UNSIGNED    NOT NULL            DEFAULT 0,
+    revision            BIGINT UNSIGNED     NOT NULL            DEFAULT 0,
+    updated_at          TIMESTAMP(3)        NOT NULL            DEFAULT CURRENT_TIMESTAMP(3) ON UPDATE CURRENT_TIMESTAMP(3),
+    UNIQUE KEY uq_board_team_name   (team_id, board_name),
+    CONSTRAINT fk_board_team        FOREIGN KEY (team_id) REFERENCES team_table (id)
+);
+
+-- 카드마다 색이 달랐다면 가장 최근에 바뀐 카드의 색을 board 색으로
+INSERT INTO board_table (team_id, board_name, board_color, revision)
+SELECT tm.id, l.board_name,
+       CAST(SUBSTRING_INDEX(GROUP_CONCAT(l.board_color ORDER BY l.updated_at DESC, l.id DESC), ',', 1) AS UNSIGNED),
+       MAX(l.revision)
+  FROM board_card_legacy l
+  JOIN team_table tm ON tm.team_name = l.team_name
+ GROUP BY tm.id, l.board_name;
+
+CREATE TABLE card_table (
+    id                  INT                 AUTO_INCREMENT      PRIMARY KEY,
+    board_id            INT                 NOT NULL,
+    card_name           VARCHAR(255)        NOT NULL,
+    card_content        TEXT                NOT NULL,
+    revision            BIGINT UNSIGNED     NOT NULL            DEFAULT 0,
+    updated_at          TIMESTAMP(3)        NOT NULL            DEFAULT CURRENT_TIMESTAMP(3) ON UPDATE CURRENT_TIMESTAMP(3),
+    INDEX ix_card_board_name        (board_id, card_name),
+    INDEX ix_card_board_rev         (board_id, revision),
+    CONSTRAINT fk_card_board        FOREIGN KEY (board_id) REFERENCES board_table (id) ON DELETE CASCADE
+);
+
+INSERT INTO card_table (id, board_id, card_name, card_content, revision, updated_at)
+SELECT l.id, b.id, l.card_name, l.card_content, l.revision, l.updated_at
+  FROM board_card_legacy l
+  JOIN team_table tm ON tm.team_name = l.team_name
+  JOIN board_table b ON b.team_id = tm.id AND b.board_name = l.board_name;
+
+DROP TABLE board_card_legacy;
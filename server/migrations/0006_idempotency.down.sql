@@ -0,0 +1,3 @@
+-- 0006 rollback
+
+DROP TABLE idempotency_table;
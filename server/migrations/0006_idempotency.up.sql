@@ -0,0 +1,16 @@
+-- 0006 : Idempotency-Key 처리 결과 (/add_task, /add_board, /add_member 재시도 중복 제거)
+--   (route, idem_key) 당 한 행. claim 은 쓰기와 같은 트랜잭션에서 INSERT 되어 함께 commit
+--   status NULL = 처리 중, 그 밖에는 첫 요청의 응답 (status, body) 을 그대로 재전송
+--   worker 가 여러 개여도 같은 key 는 PK 잠금 / 중복키로 한 번만 실행된다
+
+CREATE TABLE idempotency_table (
+    route               VARCHAR(64)         NOT NULL,
+    idem_key            VARCHAR(255)        NOT NULL,
+    fingerprint         CHAR(64)            NOT NULL,
+    status              SMALLINT UNSIGNED   NULL,
+    body                MEDIUMTEXT          NULL,
+    created_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP,
+    expires_at          TIMESTAMP           NOT NULL,
+    PRIMARY KEY (route, idem_key),
+    INDEX ix_idempotency_expires    (expires_at)
+);
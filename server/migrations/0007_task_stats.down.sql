@@ -0,0 +1,3 @@
+-- 0007 rollback
+
+DROP TABLE task_stats_table;
@@ -0,0 +1,18 @@
+-- 0007 : 팀별 할 일 통계 요약 (/task_stats)
+--   (team_id, task_state, task_end) 마다 할 일 수. 쓰기 트랜잭션 안에서 증분 갱신 (rds.py 3‑1)
+--   상태별 개수 = task_state 별 합, 기한 지남 / 임박 = 오늘 날짜 기준 task_end 범위 합
+--   → 조회 비용은 팀의 할 일 수가 아니라 서로 다른 (상태, 마감일) 수
+--   어긋나면 reconcile_task_stats_to_db (server 주기 작업) 가 task_table 기준으로 다시 만든다
+
+CREATE TABLE task_stats_table (
+    team_id             INT                 NOT NULL,
+    task_state          ENUM('TODO','DOING','DONE') NOT NULL,
+    task_end            DATE                NOT NULL,
+    task_count          INT                 NOT NULL            DEFAULT 0,
+    PRIMARY KEY (team_id, task_state, task_end),
+    CONSTRAINT fk_task_stats_team   FOREIGN KEY (team_id) REFERENCES team_table (id)
+);
+
+INSERT INTO task_stats_table (team_id, task_state, task_end, task_count)
+SELECT team_id, task_state, task_end, COUNT(*) FROM task_table
+ GROUP BY team_id, task_state, task_end;
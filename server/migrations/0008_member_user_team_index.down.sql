@@ -0,0 +1,5 @@
+-- 0008 rollback
+
+ALTER TABLE member_table
+    ADD INDEX ix_member_user        (user_email),
+    DROP INDEX ix_member_user_team;
@@ -0,0 +1,8 @@
+-- 0008 : 사용자 기준 할 일 조회 (load_user_task_from_db, /load_user_task) 용 인덱스
+--   member_table (user_email, team_id) → 사용자가 속한 팀 id 를 인덱스만 읽어서 (join 의 구동 쪽)
+--   팀마다 task_table 은 ix_task_team_end (team_id, task_end) 로, 개인 할 일은 ix_task_owner_end 로
+--   기존 ix_member_user (user_email) 는 이 인덱스의 접두어라 대체
+
+ALTER TABLE member_table
+    ADD INDEX ix_member_user_team   (user_email, team_id),
+    DROP INDEX ix_member_user;
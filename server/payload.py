@@ -0,0 +1,141 @@
+"""
+payload.py – load_* 응답 인코딩 (Accept / Accept-Encoding 협상)
+
+* 기본 : 지금과 같은 JSON ({"task": [[...], ...], "next": ...})
+  FastAPI jsonable_encoder 를 거치지 않고 rows(tuple) 를 바로 bytes 로 – orjson 이 있으면 orjson, 없으면 json.
+  date / datetime 은 isoformat (FastAPI 기본 출력과 같은 문자열)
+* Accept: application/vnd.planit.columnar+json → {"columns": [...], "rows": [[...]], ...}
+* Accept: application/msgpack                  → 같은 columnar 모양을 MessagePack 으로 (msgpack 설치 시)
+* Accept-Encoding 의 br / gzip 중 q 값이 높은 쪽으로, min_bytes 이상일 때만 압축 (br 은 brotli 설치 시)
+
+선택 패키지 : orjson, msgpack, brotli – 없으면 해당 경로만 빠진다.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 패키지
+    orjson = None
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+JSON = "application/json"
+COLUMNAR = "application/vnd.planit.columnar+json"
+MSGPACK = "application/msgpack"
+MSGPACK_ALIASES = (MSGPACK, "application/x-msgpack", "application/vnd.msgpack")
+
+
+def field_names(select_list: str) -> Tuple[str, ...]:
+    """rds 의 SELECT 목록 "t.id, tm.team_name, ..." → ("id", "team_name", ...)"""
+    return tuple(column.strip().rsplit(".", 1)[-1] for column in select_list.split(","))
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode()
+    raise TypeError(f"cannot encode {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+
+def _qvalues(header: str | None) -> Dict[str, float]:
+    """ "br;q=1.0, gzip;q=0.8, *;q=0" → {"br": 1.0, "gzip": 0.8, "*": 0.0} """
+    result: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        name, *params = part.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        result[name] = q
+    return result
+
+
+class PayloadEncoder:
+    def __init__(self, *, min_bytes: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.min_bytes = min_bytes
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    # ── 협상 ──
+    def media_type(self, accept: str | None) -> str:
+        """compact 형식은 명시적으로 요청하고 application/json 보다 q 가 낮지 않을 때만"""
+        q = _qvalues(accept)
+        floor = q.get(JSON, 0.0)
+        choices = [(q.get(COLUMNAR, 0.0), COLUMNAR)]
+        if msgpack is not None:
+            choices += [(q.get(alias, 0.0), MSGPACK) for alias in MSGPACK_ALIASES]
+        best_q, best = max(choices, key=lambda c: c[0])
+        return best if best_q > 0 and best_q >= floor else JSON
+
+    def content_coding(self, accept_encoding: str | None) -> str | None:
+        q = _qvalues(accept_encoding)
+        wildcard = q.get("*", 0.0)
+        choices = [(q.get("gzip", wildcard), 1, "gzip")]
+        if brotli is not None:
+            choices.append((q.get("br", wildcard), 2, "br"))  # 같은 q 면 br (더 작음)
+        best_q, _, best = max(choices)
+        return best if best_q > 0 else None
+
+    # ── 인코딩 ──
+    def encode(self, media: str, key: str, columns: Sequence[str], rows: Sequence[Any],
+               extra: Dict[str, Any]) -> bytes:
+        if media == JSON:
+            return dumps({key: rows, **extra})
+        document = {"columns": columns, "rows": rows, **extra}
+        if media == MSGPACK:
+            return msgpack.packb(document, default=_default, use_bin_type=True)
+        return dumps(document)
+
+    def compress(self, body: bytes, coding: str) -> bytes:
+        if coding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def render(self, key: str, columns: Sequence[str], rows: Sequence[Any], extra: Dict[str, Any], *,
+               accept: str | None, accept_encoding: str | None) -> Tuple[bytes, str, Dict[str, str]]:
+        """(body, media_type, headers)"""
+        media = self.media_type(accept)
+        body = self.encode(media, key, columns, rows, extra)
+        headers = {"Vary": "Accept, Accept-Encoding"}
+        coding = self.content_coding(accept_encoding) if len(body) >= self.min_bytes else None
+        if coding is not None:
+            body = self.compress(body, coding)
+            headers["Content-Encoding"] = coding
+        return body, media, headers
+
+
+__all__ = [
+    "PayloadEncoder", "field_names", "dumps",
+    "JSON", "COLUMNAR", "MSGPACK", "MSGPACK_ALIASES",
+]
@@ -0,0 +1,182 @@
+"""
+pool.py – Connection Pool for Planit (FastAPI)
+
+* 요청 단위 checkout : ``with pool.acquire() as (connection, cursor):``
+* min / max 크기 제한, 빈 커넥션이 없으면 timeout 까지 대기
+* borrow 시 health check (유휴 시간이 ping_interval 초과 → ping)
+* RDS failover / wait_timeout 로 끊긴 커넥션은 폐기 후 재연결
+* release 시 rollback → 열린 트랜잭션(스냅샷) 정리
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Iterator, Tuple
+
+import pymysql
+
+
+class PoolTimeout(RuntimeError):
+    """timeout 안에 커넥션을 빌리지 못함"""
+
+
+class PoolClosed(RuntimeError):
+    """close() 이후 acquire 호출"""
+
+
+class _Entry:
+    __slots__ = ("conn", "created", "last_used")
+
+    def __init__(self, conn: pymysql.Connection):
+        now = time.monotonic()
+        self.conn = conn
+        self.created = now
+        self.last_used = now
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        *,
+        connect: Callable[[], pymysql.Connection],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        recycle: float = 3600.0,
+        ping_interval: float = 30.0,
+        on_wait: Callable[[float], None] | None = None,
+        wrap_cursor: Callable[[Any], Any] | None = None,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"invalid pool size: min={min_size}, max={max_size}")
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_interval = ping_interval
+        self.on_wait = on_wait              # checkout 대기 시간(초) 관찰용
+        self.wrap_cursor = wrap_cursor      # cursor 계측 래퍼
+
+        self._idle: Deque[_Entry] = deque()
+        self._size = 0                      # idle + 대여 중
+        self._closed = False
+        self._cond = threading.Condition()
+
+        for _ in range(min_size):
+            self._idle.append(_Entry(self._connect()))
+            self._size += 1
+
+    # ── 상태 ──────────────────────────
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    # ── checkout ─────────────────────
+    @contextmanager
+    def acquire(self, cursorclass: Any = None) -> Iterator[Tuple[pymysql.Connection, Any]]:
+        started = time.monotonic()
+        entry = self._borrow()
+        if self.on_wait:
+            self.on_wait(time.monotonic() - started)
+        conn = entry.conn
+        cursor = conn.cursor(cursorclass) if cursorclass else conn.cursor()
+        if self.wrap_cursor:
+            cursor = self.wrap_cursor(cursor)
+        try:
+            yield conn, cursor
+        finally:
+            try:
+                cursor.close()
+            except pymysql.Error:
+                pass
+            self._release(entry)
+
+    def _borrow(self) -> _Entry:
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolClosed("connection pool is closed")
+                if self._idle:
+                    entry = self._idle.pop()            # LIFO → 최근 사용(따뜻한) 커넥션 우선
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    entry = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeout(
+                        f"no connection available within {self.timeout}s (max_size={self.max_size})"
+                    )
+                self._cond.wait(remaining)
+
+        # 네트워크 I/O 는 lock 밖에서
+        try:
+            if entry is None:
+                return _Entry(self._connect())
+            return self._check(entry)
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+    def _check(self, entry: _Entry) -> _Entry:
+        now = time.monotonic()
+        if self.recycle and now - entry.created > self.recycle:
+            self._discard(entry.conn)
+            return _Entry(self._connect())
+        if now - entry.last_used >= self.ping_interval:
+            try:
+                entry.conn.ping(reconnect=True)     # wait_timeout / failover 로 끊긴 경우 재연결
+            except pymysql.Error:
+                self._discard(entry.conn)
+                return _Entry(self._connect())
+        return entry
+
+    def _release(self, entry: _Entry) -> None:
+        conn = entry.conn
+        healthy = bool(conn.open)
+        if healthy:
+            try:
+                conn.rollback()                     # 커밋 안 된 작업 / REPEATABLE READ 스냅샷 정리
+            except pymysql.Error:
+                healthy = False
+        with self._cond:
+            if healthy and not self._closed:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            else:
+                self._size -= 1
+            self._cond.notify()
+        if not healthy or self._closed:
+            self._discard(conn)
+
+    @staticmethod
+    def _discard(conn: pymysql.Connection) -> None:
+        try:
+            conn.close()
+        except pymysql.Error:
+            pass
+
+    # ── 종료 ──────────────────────────
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._discard(entry.conn)
+
+
+__all__ = ["ConnectionPool", "PoolTimeout", "PoolClosed"]
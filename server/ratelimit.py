@@ -0,0 +1,194 @@
+"""
+ratelimit.py – Token-bucket rate limit + per-team concurrency cap (rds 호출 전에 HTTP middleware 에서)
+
+* key = user_email (요청 본문 / X-User-Email), 없으면 client IP
+* route 마다 예산 (초당 rate, burst) – 지정하지 않은 route 는 "*" 예산
+* team_name 별 동시 처리 요청 수 상한 → 한 팀의 폴링이 풀 커넥션을 모두 잡지 못하게
+* 초과 시 RateLimited(retry_after) → 서버가 429 + Retry-After
+
+저장소는 BucketStore 인터페이스 뒤에 있다.
+  MemoryBucketStore : 프로세스 로컬 (worker 별로 따로 센다 → 실제 한도는 WORKERS 배)
+  공유 저장소       : BucketStore 를 구현한 클래스를 RATE_LIMIT_STORE="module:Class" 로 지정
+                      (생성자 인자 없음, take / acquire / release 가 worker 간에 원자적이어야 함)
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, NamedTuple, Tuple
+
+from metrics import RATE_LIMITED
+
+
+class Budget(NamedTuple):
+    rate: float         # 초당 보충 token 수
+    burst: int          # bucket 크기 (연속으로 허용되는 요청 수)
+
+
+class RateLimited(Exception):
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def parse_budgets(spec: str) -> Dict[str, Budget]:
+    """ "/load_task=5:10,*=20:40" → {"/load_task": Budget(5, 10), "*": Budget(20, 40)} """
+    budgets: Dict[str, Budget] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        route, _, value = item.partition("=")
+        rate, _, burst = value.partition(":")
+        budgets[route.strip()] = Budget(float(rate), int(burst or max(1, math.ceil(float(rate)))))
+    return budgets
+
+
+# ────────────────────────────────
+# 0.  저장소
+# ────────────────────────────────
+
+
+class BucketStore(ABC):
+    @abstractmethod
+    async def take(self, key: str, budget: Budget) -> float:
+        """token 1개 사용. 허용이면 0, 아니면 다음 token 까지 남은 초"""
+
+    @abstractmethod
+    async def acquire(self, key: str, limit: int) -> bool:
+        """동시 처리 수 +1 (limit 초과면 늘리지 않고 False)"""
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """acquire 성공한 만큼 -1"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class MemoryBucketStore(BucketStore):
+    """event loop 한 곳에서만 접근 (await 없는 구간) → lock 불필요"""
+
+    def __init__(self, *, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: Dict[str, Tuple[float, float]] = {}      # key → (tokens, updated)
+        self._active: Dict[str, int] = {}
+
+    async def take(self, key: str, budget: Budget) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (budget.burst, now))
+        tokens = min(budget.burst, tokens + (now - updated) * budget.rate)
+        if tokens >= 1:
+            self._store(key, tokens - 1, now)
+            return 0.0
+        self._store(key, tokens, now)
+        return (1 - tokens) / budget.rate if budget.rate > 0 else 60.0
+
+    def _store(self, key: str, tokens: float, now: float) -> None:
+        if key not in self._buckets and len(self._buckets) >= self.max_keys:
+            # 가득 차면 60초 넘게 안 쓴 bucket 정리 (대개 다시 가득 찬 상태라 지워도 결과가 같다)
+            self._buckets = {k: v for k, v in self._buckets.items() if now - v[1] < 60}
+        self._buckets[key] = (tokens, now)
+
+    async def acquire(self, key: str, limit: int) -> bool:
+        active = self._active.get(key, 0)
+        if active >= limit:
+            return False
+        self._active[key] = active + 1
+        return True
+
+    async def release(self, key: str) -> None:
+        active = self._active.get(key, 0) - 1
+        if active > 0:
+            self._active[key] = active
+        else:
+            self._active.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"buckets": len(self._buckets), "active_teams": len(self._active),
+                "active_requests": sum(self._active.values())}
+
+
+def load_store(spec: str) -> BucketStore:
+    """ "memory" 또는 "package.module:ClassName" """
+    if spec in ("", "memory"):
+        return MemoryBucketStore()
+    module, _, name = spec.partition(":")
+    store = getattr(importlib.import_module(module), name)()
+    if not isinstance(store, BucketStore):
+        raise TypeError(f"{spec} is not a BucketStore")
+    return store
+
+
+# ────────────────────────────────
+# 1.  Limiter
+# ────────────────────────────────
+
+
+class RateLimiter:
+    def __init__(self, store: BucketStore | None = None, *, budgets: Dict[str, Budget] | None = None,
+                 team_concurrency: int = 0, trust_proxy: bool = False, enabled: bool = True):
+        self.store = store or MemoryBucketStore()
+        self.budgets = budgets or {}
+        self.team_concurrency = team_concurrency
+        self.trust_proxy = trust_proxy
+        self.enabled = enabled
+
+    def budget(self, route: str) -> Tuple[str, Budget | None]:
+        """(예산 이름, 예산) – 지정하지 않은 route 는 "*" 하나를 같이 쓴다 (key / metric 라벨 수 제한)"""
+        if route in self.budgets:
+            return route, self.budgets[route]
+        return "*", self.budgets.get("*")
+
+    def client(self, headers, host: str | None, body: Dict[str, Any]) -> str:
+        email = body.get("user_email") or headers.get("x-user-email")
+        if email:
+            return f"user:{email}"
+        if self.trust_proxy and headers.get("x-forwarded-for"):
+            return "ip:" + headers["x-forwarded-for"].split(",")[0].strip()
+        return f"ip:{host or '-'}"
+
+    async def check(self, route: str, client: str, team: str | None) -> str | None:
+        """
+        허용이면 release 해야 할 team key (없으면 None) 반환, 초과면 RateLimited.
+        team key 를 받았으면 요청이 끝난 뒤 반드시 release(team_key).
+        """
+        name, budget = self.budget(route)
+        if budget is not None:
+            wait = await self.store.take(f"{name}|{client}", budget)
+            if wait > 0:
+                RATE_LIMITED.inc(name, "rate")
+                raise RateLimited("rate", wait)
+        if self.team_concurrency <= 0 or not team:     # '' = 개인 할 일 (모든 사용자가 공유) → 제외
+            return None
+        key = f"team:{team}"
+        if not await self.store.acquire(key, self.team_concurrency):
+            RATE_LIMITED.inc(name, "team_concurrency")
+            raise RateLimited("team_concurrency", 1.0)
+        return key
+
+    async def release(self, key: str | None) -> None:
+        if key is not None:
+            await self.store.release(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"enabled": int(self.enabled), "team_concurrency": self.team_concurrency, **self.store.stats()}
+
+
+def json_fields(body: bytes) -> Dict[str, Any]:
+    """본문에서 user_email / team_name 만 쓰므로 실패하면 빈 dict (검증은 FastAPI 가)"""
+    if not body:
+        return {}
+    try:
+        value = json.loads(body)
+    except ValueError:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+__all__ = [
+    "Budget", "BucketStore", "MemoryBucketStore", "RateLimiter", "RateLimited",
+    "json_fields", "load_store", "parse_budgets",
+]
@@ -10,23 +10,43 @@ rds.py – Data Access Layer for Planit (FastAPI) 2025‑07‑14
     - team_name / user_email UNIQUE 해제
 * board_table
     - team_name UNIQUE 해제, 컬럼명 board_name 사용
+* team_table / card_table (migrations/0005)
+    - 팀 이름은 team_table 한 곳에, task / member / board 는 team_id 로 참조
+    - board_table = (team_id, board_name) 엔티티 + board_color, 카드는 card_table(board_id)
+    - 조회 결과 행 모양은 예전과 같음 (team_name / board_name 을 join 으로 채움)
 * member_table
     - user_owner → TINYINT(1)  (0=MEMBER, 1=OWNER)
     - team_name / user_email 단독 UNIQUE 삭제,
       대신 (team_name, user_email) 복합 UNIQUE
 * 나머지 테이블 구조는 유지
+
+SQL 텍스트는 statements.Statement 로 import 시점에 미리 만든다 (SQL_* 상수).
+table_name 인자는 statements.TABLES whitelist 에 있는 이름만 허용 → 그 밖은 ValueError.
+
+저장소는 storage backend (STORAGE_BACKEND=mysql | sqlite, storage.py) – 함수 이름 / 인자 / 반환은 같다.
+MySQL 전용 문법을 쓰는 문장은 sqlite= 로 SQLite 판을 같이 둔다.
 """
 
 from __future__ import annotations
 
+import json
 import os
-from typing import Any, Dict, List, Tuple
+from datetime import date, timedelta
+from functools import partial
+from itertools import product
+from typing import Any, Dict, Hashable, Iterator, List, Sequence, Tuple
 
 import pymysql
 from pymysql.cursors import DictCursor
 
 from dotenv import load_dotenv
 
+from cache import QueryCache
+from metrics import POOL_WAIT_SECONDS, InstrumentedCursor
+from pool import ConnectionPool
+from statements import Statement, use_dialect
+from storage import StorageBackend, load_backend
+
 # ────────────────────────────────
 # 0.  DB helpers
 # ────────────────────────────────
@@ -47,16 +67,31 @@ from dotenv import load_dotenv
 #     return conn, conn.cursor()
 
 
+# init_backend() 전에는 None → init_db / init_pool 이 처음 호출될 때 .env 로 정한다
+backend: StorageBackend | None = None
+
+
+def init_backend() -> StorageBackend:
+    """
+    .env 기반 storage backend (프로세스에서 한 번)
+      STORAGE_BACKEND    : mysql (기본, HOST / USER / PASSWORD / DATABASE) | sqlite
+      SQLITE_PATH        : sqlite 파일 경로 (WAL, 없으면 스키마 생성)
+    SQL_* 문장을 backend 방언으로 다시 compile 한 뒤 반환.
+    """
+    global backend
+    if backend is None:
+        load_dotenv()
+        selected = load_backend(os.getenv("STORAGE_BACKEND", "mysql"))
+        use_dialect(selected.dialect)
+        selected.prepare()
+        _team_ids.clear()                   # 팀 이름 → id 는 DB 별 (다른 파일 / 서버로 다시 정할 때)
+        backend = selected
+    return backend
+
+
 def init_db():     # Server DB
-    """환경 변수 기반 커넥션 + DictCursor 반환"""
-    load_dotenv()
-    conn = pymysql.connect(
-        host=os.environ.get("HOST"),
-        user=os.environ.get("USER"),
-        password=os.environ.get("PASSWORD"),
-        database=os.environ.get("DATABASE"),
-        charset="utf8mb4"
-    )
+    """환경 변수 기반 커넥션 + cursor 반환"""
+    conn = init_backend().connect()
     return conn, conn.cursor()
 
 
@@ -67,13 +102,262 @@ def close_db(*, connection, cursor):  # type: ignore[valid-type]
         connection and connection.close()
 
 
+def init_pool() -> ConnectionPool:
+    """
+    .env 기반 커넥션 풀 생성 (서버용)
+      POOL_MIN_SIZE / POOL_MAX_SIZE      : 풀 크기
+      POOL_TIMEOUT                       : checkout 대기 한도 (초)
+      POOL_RECYCLE                       : 커넥션 최대 수명 (초, wait_timeout 보다 짧게)
+      POOL_PING_INTERVAL                 : 이 시간 이상 놀던 커넥션은 borrow 시 ping
+    """
+    load_dotenv()
+    return ConnectionPool(
+        connect=init_backend().connect,
+        min_size=int(os.getenv("POOL_MIN_SIZE", 1)),
+        max_size=int(os.getenv("POOL_MAX_SIZE", 10)),
+        timeout=float(os.getenv("POOL_TIMEOUT", 10)),
+        recycle=float(os.getenv("POOL_RECYCLE", 3600)),
+        ping_interval=float(os.getenv("POOL_PING_INTERVAL", 30)),
+        on_wait=lambda seconds: POOL_WAIT_SECONDS.observe(value=seconds),
+        wrap_cursor=InstrumentedCursor,
+    )
+
+
+def close_pool(pool: ConnectionPool | None) -> None:
+    pool and pool.close()
+
+
+SQL_PING = Statement("SELECT 1")
+
+
+def ping_db(cursor) -> bool:
+    """readiness 확인용 – 테이블을 건드리지 않는 가장 가벼운 왕복"""
+    cursor.execute(SQL_PING.sql)
+    return cursor.fetchone() is not None
+
+
+# ────────────────────────────────
+# 0‑1.  Read cache (load_task / load_board / load_member)
+# ────────────────────────────────
+
+# init_cache() 전에는 비활성 → 스크립트에서 rds.* 직접 호출 시 항상 DB 조회
+cache = QueryCache()
+
+
+def init_cache() -> QueryCache:
+    """
+    .env 기반 캐시 설정 (서버 startup 에서 호출)
+      CACHE_TTL          : 초, 0 이면 비활성
+      CACHE_MAX_ENTRIES  : LRU 항목 수 상한
+      CACHE_MAX_BYTES    : 대략적인 메모리 상한
+    """
+    load_dotenv()
+    cache.configure(
+        ttl=float(os.getenv("CACHE_TTL", 5)),
+        max_entries=int(os.getenv("CACHE_MAX_ENTRIES", 2048)),
+        max_bytes=int(os.getenv("CACHE_MAX_BYTES", 32 << 20)),
+    )
+    return cache
+
+
+# 캐시 태그
+#   ("task", team) / ("task_owner", target, email) / ("task_email", email)
+#   ("board", team) / ("board", team, board) / ("board_team", team) – 팀 전체 board 조회
+#   ("member", team) / ("member_email", email) / ("member_all",)
+# 조회 조건뿐 아니라 결과 행의 team / email 도 태그로 달아서,
+# team 이나 user 단위로만 알 수 있는 쓰기(delete_team, delete_user)도 정확히 무효화한다.
+
+
+SQL_TASK_OWNERS = Statement(
+    "SELECT DISTINCT task_target, user_email FROM {table} WHERE {where}", table="task_table"
+)
+
+
+def _task_owners(cursor, table_name: str, where: str, params: Tuple[Any, ...]) -> List[Hashable]:
+    """UPDATE/DELETE 대상 행의 (task_target, user_email) 태그 – 캐시 활성 시에만 조회"""
+    if not cache.enabled:
+        return []
+    cursor.execute(SQL_TASK_OWNERS[table_name, where], params)
+    return [("task_owner", target, email) for target, email in cursor.fetchall()]
+
+
+# ────────────────────────────────
+# 0‑2.  Team / board entity (정수 id)
+# ────────────────────────────────
+
+# 팀 이름은 team_table 에만 있고, task / member / board 는 team_id, card 는 board_id 로 연결.
+# 클라이언트는 여전히 이름으로 요청하므로 이름 → id 를 한 번 찾아 프로세스 안에 보관한다.
+# team_table 행은 팀 삭제 후에도 남겨 두므로 (id 재사용 없음) 보관한 id 가 틀려지는 일은 없다.
+# 개인 할 일(team_name '')도 team_table 의 한 행.
+TEAM_TABLE = "team_table"
+BOARD_TABLE = "board_table"
+
+# 조회 결과 행은 예전 SELECT * 와 같은 열 순서 (클라이언트가 index 로 읽음)
+#   task : id, team_name, task_name, task_start, task_end, task_state, task_color, task_target, user_email, revision, updated_at
+#   card : id, team_name, board_name, board_color, card_name, card_content, revision, updated_at
+#   member : id, team_name, user_email, user_owner, revision, updated_at
+TASK_COLUMNS = (
+    "t.id, tm.team_name, t.task_name, t.task_start, t.task_end, t.task_state,"
+    " t.task_color, t.task_target, t.user_email, t.revision, t.updated_at"
+)
+CARD_COLUMNS = (
+    "t.id, tm.team_name, b.board_name, b.board_color, t.card_name, t.card_content, t.revision, t.updated_at"
+)
+MEMBER_COLUMNS = "t.id, tm.team_name, t.user_email, t.user_owner, t.revision, t.updated_at"
+
+# 행(별칭 t) → 팀(별칭 tm) 경로. tombstone / revision 처럼 팀 이름이 필요한 곳에서 사용
+TEAM_PATH = {
+    "task_table": f"JOIN {TEAM_TABLE} tm ON tm.id = t.team_id",
+    "member_table": f"JOIN {TEAM_TABLE} tm ON tm.id = t.team_id",
+    "card_table": f"JOIN {BOARD_TABLE} b ON b.id = t.board_id JOIN {TEAM_TABLE} tm ON tm.id = b.team_id",
+}
+# tombstone.table_name 은 클라이언트가 보는 이름 – 카드는 예전처럼 board_table
+TOMBSTONE_LABEL = {"task_table": "task_table", "member_table": "member_table", "card_table": "board_table"}
+
+SQL_TEAM_ID = Statement("SELECT id FROM {teams} WHERE team_name=%s", teams=TEAM_TABLE)
+# MySQL : LAST_INSERT_ID(id) → cursor.lastrowid,  SQLite : RETURNING id → cursor.lastrowid
+SQL_UPSERT_TEAM = Statement(
+    "INSERT INTO {teams} (team_name) VALUES (%s) ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)",
+    sqlite="INSERT INTO {teams} (team_name) VALUES (%s) ON CONFLICT (team_name) DO UPDATE SET id = id RETURNING id",
+    teams=TEAM_TABLE,
+)
+SQL_UPSERT_BOARD = Statement(
+    """
+    INSERT INTO {boards} (team_id, board_name, board_color, revision)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)
+    """,
+    sqlite="""
+    INSERT INTO {boards} (team_id, board_name, board_color, revision)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (team_id, board_name) DO UPDATE SET id = id RETURNING id
+    """,
+    boards=BOARD_TABLE,
+)
+
+_team_ids: Dict[str, int] = {}
+
+
+def _find_team(cursor, team_name: str) -> int:
+    """조회용 – 없는 팀이면 0 (어떤 행과도 맞지 않는 id)"""
+    team_id = _team_ids.get(team_name)
+    if team_id is None:
+        cursor.execute(SQL_TEAM_ID.sql, (team_name,))
+        rows = cursor.fetchall()
+        if not rows:
+            return 0
+        team_id = _team_ids[team_name] = rows[0][0]
+    return team_id
+
+
+def _ensure_team(connection, cursor, team_name: str) -> int:
+    """
+    쓰기용 – 없으면 만들고 바로 commit (뒤 작업이 rollback 돼도 보관한 id 가 사라지지 않게)
+    다른 쓰기보다 먼저 호출할 것.
+    """
+    team_id = _team_ids.get(team_name)
+    if team_id is None:
+        cursor.execute(SQL_UPSERT_TEAM.sql, (team_name,))
+        connection.commit()
+        team_id = _team_ids[team_name] = cursor.lastrowid
+    return team_id
+
+
+def _ensure_board(cursor, team_id: int, board_name: str, board_color: int, revision: int) -> int:
+    """board 엔티티 id (없으면 생성, 있으면 기존 색 유지)"""
+    cursor.execute(SQL_UPSERT_BOARD.sql, (team_id, board_name, board_color, revision))
+    return cursor.lastrowid
+
+
+# ────────────────────────────────
+# 0‑3.  Change tracking (delta sync)
+# ────────────────────────────────
+
+# 쓰기 트랜잭션마다 팀 revision 을 +1 하고, 바뀐 행에 그 값을 기록한다.
+# revision_table 행 잠금이 커밋까지 유지되므로 같은 팀의 revision 은 커밋 순서와 일치.
+REVISION_TABLE = "revision_table"
+TOMBSTONE_TABLE = "tombstone_table"
+
+SQL_BUMP_REVISION = Statement(
+    """
+    INSERT INTO {revision} (team_name, revision)
+    VALUES (%s, LAST_INSERT_ID(1))
+    ON DUPLICATE KEY UPDATE revision = LAST_INSERT_ID(revision + 1)
+    """,
+    sqlite="""
+    INSERT INTO {revision} (team_name, revision)
+    VALUES (%s, 1)
+    ON CONFLICT (team_name) DO UPDATE SET revision = revision + 1
+    RETURNING revision
+    """,
+    revision=REVISION_TABLE,
+)
+SQL_BUMP_REVISIONS = Statement(
+    """
+    INSERT INTO {revision} (team_name, revision)
+    SELECT DISTINCT tm.team_name, 1 FROM {table} t {path} WHERE {where}
+    ON DUPLICATE KEY UPDATE revision = {revision}.revision + 1
+    """,
+    sqlite="""
+    INSERT INTO {revision} (team_name, revision)
+    SELECT DISTINCT tm.team_name, 1 FROM {table} t {path} WHERE {where}
+    ON CONFLICT (team_name) DO UPDATE SET revision = {revision}.revision + 1
+    """,
+    table="task_table", revision=REVISION_TABLE,
+)
+SQL_TOMBSTONE_AT = Statement(
+    """
+    INSERT INTO {tombstone} (table_name, row_id, team_name, revision)
+    SELECT %s, t.id, tm.team_name, %s FROM {table} t {path} WHERE {where}
+    """,
+    table="task_table", tombstone=TOMBSTONE_TABLE,
+)
+SQL_TOMBSTONE_CURRENT = Statement(
+    """
+    INSERT INTO {tombstone} (table_name, row_id, team_name, revision)
+    SELECT %s, t.id, tm.team_name, r.revision
+      FROM {table} t {path} JOIN {revision} r ON r.team_name = tm.team_name
+     WHERE {where}
+    """,
+    table="task_table", tombstone=TOMBSTONE_TABLE, revision=REVISION_TABLE,
+)
+
+
+def _bump_revision(cursor, team_name: str) -> int:
+    """팀 하나의 revision +1 후 새 값 반환 (LAST_INSERT_ID(expr) → OK 패킷, 추가 왕복 없음 / SQLite 는 RETURNING)"""
+    cursor.execute(SQL_BUMP_REVISION.sql, (team_name,))
+    return cursor.lastrowid
+
+
+def _bump_revisions(cursor, table_name: str, where: str, params: Tuple[Any, ...]) -> None:
+    """where(별칭 t) 에 걸리는 행들이 속한 모든 팀의 revision +1 (delete_user 처럼 팀을 모르는 쓰기용)"""
+    cursor.execute(SQL_BUMP_REVISIONS[table_name, TEAM_PATH[table_name], where], params)
+
+
+def _tombstone(
+    cursor, table_name: str, where: str, params: Tuple[Any, ...], revision: int | None = None
+) -> None:
+    """
+    삭제 직전에 호출. where 는 별칭 t 기준 (예: "t.team_id=%s", 카드는 board 별칭 b 도 사용 가능).
+    revision 생략 시 각 행 팀의 현재 revision 사용 (_bump_revisions 이후).
+    """
+    path, label = TEAM_PATH[table_name], TOMBSTONE_LABEL[table_name]
+    if revision is not None:
+        cursor.execute(SQL_TOMBSTONE_AT[table_name, path, where], (label, revision, *params))
+    else:
+        cursor.execute(SQL_TOMBSTONE_CURRENT[table_name, path, where], (label, *params))
+
+
 # ────────────────────────────────
 # 1.  Setting
 # ────────────────────────────────
 
 
+SQL_LOAD_SETTING = Statement("SELECT kakao_key, google_key FROM {table} LIMIT 1", table="setting_table")
+
+
 def load_setting_from_db(*, cursor, table_name: str = "setting_table") -> Tuple[str, str]:
-    cursor.execute(f"SELECT kakao_key, google_key FROM {table_name} LIMIT 1")
+    cursor.execute(SQL_LOAD_SETTING[table_name])
     row = cursor.fetchone()
     if not row:
         raise RuntimeError("setting_table is empty")
@@ -84,6 +368,25 @@ def load_setting_from_db(*, cursor, table_name: str = "setting_table") -> Tuple[
 # 2.  User
 # ────────────────────────────────
 
+SQL_ADD_USER = Statement(
+    """
+    INSERT INTO {table} (user_email, user_nickname, user_image)
+    VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        user_nickname = VALUES(user_nickname),
+        user_image    = VALUES(user_image)
+    """,
+    sqlite="""
+    INSERT INTO {table} (user_email, user_nickname, user_image)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (user_email) DO UPDATE SET
+        user_nickname = excluded.user_nickname,
+        user_image    = excluded.user_image
+    """,
+    table="user_table",
+)
+SQL_LOAD_USER = Statement("SELECT * FROM {table} WHERE user_email=%s", table="user_table")
+
 
 def add_user_to_db(
     *,
@@ -94,55 +397,137 @@ def add_user_to_db(
     user_image: str,
     table_name: str = "user_table",
 ):
-    cursor.execute(
-        f"""
-        INSERT INTO {table_name} (user_email, user_nickname, user_image)
-        VALUES (%s, %s, %s)
-        ON DUPLICATE KEY UPDATE
-            user_nickname = VALUES(user_nickname),
-            user_image    = VALUES(user_image)
-        """,
-        (user_email, user_nickname, user_image),
-    )
+    cursor.execute(SQL_ADD_USER[table_name], (user_email, user_nickname, user_image))
     connection.commit()
 
 
 def load_user_from_db(
     *, cursor, user_email: str, table_name: str = "user_table"
 ) -> Dict[str, Any] | None:
-    cursor.execute(f"SELECT * FROM {table_name} WHERE user_email=%s", (user_email,))
+    cursor.execute(SQL_LOAD_USER[table_name], (user_email,))
     return cursor.fetchone()
 
 
-def delete_user_from_db(
-    *,
-    connection,
-    cursor,
-    user_email: str,
-    user_table: str = "user_table",
-    task_table: str = "task_table",
-    member_table: str = "member_table",
-):
-    
-    """
-    db유저 삭제시
-      1) member_table  팀 탈퇴
-      2) task_table    담당자 해제
-      3) user_table    삭제
-    """
-
-    cursor.execute(f"DELETE FROM {member_table} WHERE user_email=%s", (user_email,))
-    cursor.execute(
-        f"UPDATE {task_table} SET user_email='' WHERE user_email=%s", (user_email,)
-    )
-    cursor.execute(f"DELETE FROM {user_table} WHERE user_email=%s", (user_email,))
-    connection.commit()
+# delete_user_from_db → 10. Cascade delete
 
 
 # ────────────────────────────────
 # 3.  Task
 # ────────────────────────────────
 
+SQL_ADD_TASK = Statement(
+    """
+    INSERT INTO {table}
+        (team_id, task_name, task_start, task_end,
+         task_state, task_color, task_target, user_email, revision)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """,
+    table="task_table",
+)
+# {extra} = load_task 필터 조합 (hide_done / window_start / window_end / keyset) – 16가지 모두 미리 compile
+TASK_FILTERS = (
+    " AND task_state <> 'DONE'",
+    " AND task_end >= %s",
+    " AND task_start <= %s",
+    " AND (task_end > %s OR (task_end = %s AND id > %s))",
+)
+_TASK_EXTRAS = [
+    "".join(f for f, on in zip(TASK_FILTERS, flags) if on)
+    for flags in product((False, True), repeat=len(TASK_FILTERS))
+]
+# 필터는 task_table 만 보는 안쪽 SELECT 에 걸고, 팀 이름은 바깥에서 PK join 으로 붙인다
+SQL_LOAD_TASK = Statement(
+    "SELECT " + TASK_COLUMNS + """
+      FROM (SELECT * FROM {table}
+             WHERE (team_id=%s OR (task_target=%s AND user_email=%s)){extra}) t
+      JOIN {teams} tm ON tm.id = t.team_id
+    """,
+    table="task_table", teams=TEAM_TABLE,
+).warm(extra=_TASK_EXTRAS)
+SQL_LOAD_TASK_PAGE = Statement(
+    "SELECT " + TASK_COLUMNS + """
+      FROM (
+        (SELECT * FROM {table} WHERE team_id=%s{extra}
+          ORDER BY task_end, id LIMIT %s)
+        UNION
+        (SELECT * FROM {table} WHERE task_target=%s AND user_email=%s{extra}
+          ORDER BY task_end, id LIMIT %s)
+      ) t
+      JOIN {teams} tm ON tm.id = t.team_id
+     ORDER BY t.task_end, t.id LIMIT %s
+    """,
+    # SQLite 는 UNION 항목에 ORDER BY / LIMIT 을 직접 못 붙인다 → 서브쿼리로 한 번 감싼다
+    sqlite="SELECT " + TASK_COLUMNS + """
+      FROM (
+        SELECT * FROM (SELECT * FROM {table} WHERE team_id=%s{extra}
+                        ORDER BY task_end, id LIMIT %s)
+        UNION
+        SELECT * FROM (SELECT * FROM {table} WHERE task_target=%s AND user_email=%s{extra}
+                        ORDER BY task_end, id LIMIT %s)
+      ) t
+      JOIN {teams} tm ON tm.id = t.team_id
+     ORDER BY t.task_end, t.id LIMIT %s
+    """,
+    table="task_table", teams=TEAM_TABLE,
+).warm(extra=_TASK_EXTRAS)
+# 사용자 기준 (모든 팀) – member_table 로 사용자의 팀을 찾아 팀마다 (team_id, task_end) 인덱스 순서로 읽고
+# 개인 할 일 (task_target '') 은 (task_target, user_email, task_end) 인덱스로. 두 쪽 모두 LIMIT 후 UNION.
+# 조인 때문에 열 이름은 별칭 t 로 – {extra} 는 USER_TASK_FILTERS 조합 (32가지)
+USER_TASK_FILTERS = (
+    " AND t.task_state <> 'DONE'",
+    " AND t.task_end >= %s",
+    " AND t.task_start <= %s",
+    " AND (t.task_end > %s OR (t.task_end = %s AND t.id > %s))",
+    " AND t.user_email=%s",     # assigned_only – 팀 할 일 중 이 사용자가 담당인 것만
+)
+_USER_TASK_EXTRAS = [
+    "".join(f for f, on in zip(USER_TASK_FILTERS, flags) if on)
+    for flags in product((False, True), repeat=len(USER_TASK_FILTERS))
+]
+SQL_LOAD_USER_TASK_PAGE = Statement(
+    "SELECT " + TASK_COLUMNS + """
+      FROM (
+        (SELECT t.* FROM {members} m JOIN {table} t ON t.team_id = m.team_id
+          WHERE m.user_email=%s{extra}
+          ORDER BY t.task_end, t.id LIMIT %s)
+        UNION
+        (SELECT t.* FROM {table} t WHERE t.task_target='' AND t.user_email=%s{extra}
+          ORDER BY t.task_end, t.id LIMIT %s)
+      ) t
+      JOIN {teams} tm ON tm.id = t.team_id
+     ORDER BY t.task_end, t.id LIMIT %s
+    """,
+    sqlite="SELECT " + TASK_COLUMNS + """
+      FROM (
+        SELECT * FROM (SELECT t.* FROM {members} m JOIN {table} t ON t.team_id = m.team_id
+                        WHERE m.user_email=%s{extra}
+                        ORDER BY t.task_end, t.id LIMIT %s)
+        UNION
+        SELECT * FROM (SELECT t.* FROM {table} t WHERE t.task_target='' AND t.user_email=%s{extra}
+                        ORDER BY t.task_end, t.id LIMIT %s)
+      ) t
+      JOIN {teams} tm ON tm.id = t.team_id
+     ORDER BY t.task_end, t.id LIMIT %s
+    """,
+    table="task_table", members="member_table", teams=TEAM_TABLE,
+).warm(extra=_USER_TASK_EXTRAS)
+# 캐시 태그용 – 결과에 행이 없는 팀에 할 일이 추가돼도 무효화되도록 사용자의 팀을 모두 태그로
+SQL_USER_TEAMS = Statement(
+    "SELECT tm.team_name FROM {table} m JOIN {teams} tm ON tm.id = m.team_id WHERE m.user_email=%s",
+    table="member_table", teams=TEAM_TABLE,
+)
+SQL_DELETE_TEAM_TASK = Statement(
+    "DELETE FROM {table} WHERE team_id=%s AND task_name=%s", table="task_table"
+)
+SQL_DELETE_OWN_TASK = Statement(
+    "DELETE FROM {table} WHERE user_email=%s AND task_name=%s", table="task_table"
+)
+# {sets} = "task_state=%s" / "task_color=%s" / 둘 다 – 세 가지 모양뿐
+SQL_UPDATE_TASK = Statement(
+    "UPDATE {table} SET {sets}, revision=%s WHERE team_id=%s AND task_name=%s",
+    table="task_table",
+).warm(sets=["task_state=%s", "task_color=%s", "task_state=%s, task_color=%s"])
+
 
 def add_task_to_db(
     *,
@@ -158,15 +543,12 @@ def add_task_to_db(
     user_email: str,
     table_name: str = "task_table",
 ):
+    team_id = _ensure_team(connection, cursor, team_name)
+    revision = _bump_revision(cursor, team_name)
     cursor.execute(
-        f"""
-        INSERT INTO {table_name}
-            (team_name, task_name, task_start, task_end,
-             task_state, task_color, task_target, user_email)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """,
+        SQL_ADD_TASK[table_name],
         (
-            team_name,
+            team_id,
             task_name,
             task_start,
             task_end,
@@ -174,16 +556,14 @@ def add_task_to_db(
             task_color,
             task_target,
             user_email,
+            revision,
         ),
     )
+    cursor.execute(SQL_TASK_STATS_ADD.sql, (team_id, task_state, task_end, 1))
     connection.commit()
+    cache.invalidate(("task", team_name), ("task_owner", task_target, user_email))
 
 
-    """
-    팀 업무 + 개인 업무 한 번에 조회
-    hide_done=True ⇒ DONE 상태 제외
-    """
-
 def load_task_from_db(
     *,
     cursor,
@@ -191,16 +571,114 @@ def load_task_from_db(
     task_target: str,
     user_email: str,
     hide_done: bool = True,
+    window_start: str | None = None,    # YYYY-MM-DD, 이 날 이후에 끝나는 할 일
+    window_end: str | None = None,      # YYYY-MM-DD, 이 날 이전에 시작하는 할 일
+    after_end: str | None = None,       # keyset cursor = 직전 페이지 마지막 행의 (task_end, id)
+    after_id: int | None = None,
+    limit: int | None = None,
     table_name: str = "task_table",
 ) -> List[Dict[str, Any]]:
-    sql = f"""
-        SELECT * FROM {table_name}
-        WHERE (team_name=%s OR (task_target=%s AND user_email=%s))
     """
+    팀 업무 + 개인 업무 조회
+      hide_done=False ⇒ DONE 포함 (보관함)
+      limit 지정 시 (task_end, id) 순 keyset 페이지 – 팀 / 개인 조건을 각각 인덱스 순서로
+      읽어 UNION 하므로 팀이 오래돼도 페이지당 읽는 행 수는 limit 의 2배 이내
+    """
+    key = ("task", table_name, team_name, task_target, user_email, hide_done,
+           window_start, window_end, after_end, after_id, limit)
+    hit, rows = cache.get(key)
+    if hit:
+        return rows
+
+    hide, start, end, keyset = TASK_FILTERS
+    extra = ""
+    params: List[Any] = []
     if hide_done:
-        sql += " AND task_state <> 'DONE'"
-    cursor.execute(sql, (team_name, task_target, user_email))
-    return cursor.fetchall()
+        extra += hide
+    if window_start:
+        extra += start
+        params.append(window_start)
+    if window_end:
+        extra += end
+        params.append(window_end)
+    if after_end is not None:
+        extra += keyset
+        params += [after_end, after_end, after_id or 0]
+
+    team_id = _find_team(cursor, team_name)
+    if limit is None:
+        sql = SQL_LOAD_TASK[table_name, extra]
+        args: List[Any] = [team_id, task_target, user_email, *params]
+    else:
+        sql = SQL_LOAD_TASK_PAGE[table_name, extra]
+        args = [team_id, *params, limit, task_target, user_email, *params, limit, limit]
+
+    cursor.execute(sql, args)
+    rows = cursor.fetchall()
+    tags: List[Hashable] = [
+        ("task", team_name), ("task_owner", task_target, user_email), ("task_email", user_email),
+    ]
+    for row in rows:  # id, team_name, ..., task_target, user_email
+        tags += [("task", row[1]), ("task_email", row[8])]
+    cache.set(key, rows, tags)
+    return rows
+
+
+def load_user_task_from_db(
+    *,
+    cursor,
+    user_email: str,
+    assigned_only: bool = False,        # True = 팀 할 일 중 user_email 담당만 (개인 할 일은 항상 포함)
+    hide_done: bool = True,
+    window_start: str | None = None,
+    window_end: str | None = None,
+    after_end: str | None = None,       # keyset cursor = 직전 페이지 마지막 행의 (task_end, id)
+    after_id: int | None = None,
+    limit: int = 100,
+    table_name: str = "task_table",
+) -> List[Tuple[Any, ...]]:
+    """
+    사용자가 속한 모든 팀 (member_table) 의 할 일 + 개인 할 일을 (task_end, id) 순으로 한 페이지.
+    팀마다 /load_task 를 부르던 것을 쿼리 하나로. 행 모양은 load_task_from_db 와 같다.
+    팀 쪽은 사용자 팀들의 조건 맞는 행을 모아 정렬하므로 기간 필터를 같이 쓰는 것이 좋다.
+    """
+    key = ("user_task", table_name, user_email, assigned_only, hide_done,
+           window_start, window_end, after_end, after_id, limit)
+    hit, rows = cache.get(key)
+    if hit:
+        return rows
+
+    hide, start, end, keyset, assigned = USER_TASK_FILTERS
+    extra = ""
+    params: List[Any] = []
+    if hide_done:
+        extra += hide
+    if window_start:
+        extra += start
+        params.append(window_start)
+    if window_end:
+        extra += end
+        params.append(window_end)
+    if after_end is not None:
+        extra += keyset
+        params += [after_end, after_end, after_id or 0]
+    if assigned_only:
+        extra += assigned
+        params.append(user_email)
+
+    cursor.execute(SQL_USER_TEAMS.sql, (user_email,))
+    tags: List[Hashable] = [("task", team) for (team,) in cursor.fetchall()]
+    cursor.execute(
+        SQL_LOAD_USER_TASK_PAGE[table_name, extra],
+        (user_email, *params, limit, user_email, *params, limit, limit),
+    )
+    rows = cursor.fetchall()
+    # 팀 가입 / 탈퇴, 개인 할 일 추가 / 삭제, 사용자 삭제
+    tags += [("member_email", user_email), ("task_owner", "", user_email), ("task_email", user_email)]
+    for row in rows:
+        tags += [("task", row[1]), ("task_email", row[8])]
+    cache.set(key, rows, tags)
+    return rows
 
 
 def delete_task_from_db(
@@ -212,20 +690,25 @@ def delete_task_from_db(
     user_email: str | None = None,
     table_name: str = "task_table",
 ) -> None:
-    """  
-      팀 단위 삭제 → team_name+task_name 전달  
+    """
+      팀 단위 삭제 → team_name+task_name 전달
       개인 할 일 삭제 → user_email+task_name 전달
     """
     if team_name:
-        cursor.execute(
-            f"DELETE FROM {table_name} WHERE team_name=%s AND task_name=%s",
-            (team_name, task_name),
-        )
+        team_id = _find_team(cursor, team_name)
+        revision = _bump_revision(cursor, team_name)
+        _tombstone(cursor, table_name, "t.team_id=%s AND t.task_name=%s", (team_id, task_name), revision)
+        _task_stats(cursor, table_name, "t.team_id=%s AND t.task_name=%s", (team_id, task_name), -1)
+        cursor.execute(SQL_DELETE_TEAM_TASK[table_name], (team_id, task_name))
+        tag = ("task", team_name)
     else:
-        cursor.execute(
-            f"DELETE FROM {table_name} WHERE user_email=%s AND task_name=%s",
-            (user_email, task_name),
-        )
+        _bump_revisions(cursor, table_name, "t.user_email=%s AND t.task_name=%s", (user_email, task_name))
+        _tombstone(cursor, table_name, "t.user_email=%s AND t.task_name=%s", (user_email, task_name))
+        _task_stats(cursor, table_name, "t.user_email=%s AND t.task_name=%s", (user_email, task_name), -1)
+        cursor.execute(SQL_DELETE_OWN_TASK[table_name], (user_email, task_name))
+        tag = ("task_email", user_email)
+    connection.commit()
+    cache.invalidate(tag)
 
 
 # ────────────────────────────────
@@ -255,14 +738,287 @@ def update_task_to_db(
         params.append(task_color)
     if not sets:
         return  # 변경할 값 없음
-    params.extend([team_name, task_name])
-    sql = f"UPDATE {table_name} SET {', '.join(sets)} WHERE team_name=%s AND task_name=%s"
-    cursor.execute(sql, params)
+    team_id = _find_team(cursor, team_name)
+    params.append(_bump_revision(cursor, team_name))
+    params.extend([team_id, task_name])
+    # 상태 변경은 DONE 숨김 여부가 바뀌므로 개인 조회(task_target, user_email) 항목도 무효화
+    owners = (
+        _task_owners(cursor, table_name, "team_id=%s AND task_name=%s", (team_id, task_name))
+        if task_state is not None else []
+    )
+    if task_state is not None:      # 통계는 상태만 본다 (색 변경은 그대로)
+        _task_stats(cursor, table_name, "t.team_id=%s AND t.task_name=%s", (team_id, task_name), -1)
+    cursor.execute(SQL_UPDATE_TASK[table_name, ", ".join(sets)], params)
+    if task_state is not None:
+        _task_stats(cursor, table_name, "t.team_id=%s AND t.task_name=%s", (team_id, task_name), +1)
     connection.commit()
+    cache.invalidate(("task", team_name), *owners)
+
+
+# ────────────────────────────────
+# 3‑1.  Task stats (팀별 요약 – /task_stats)
+# ────────────────────────────────
+
+# task_stats_table = (team_id, task_state, task_end) 마다 할 일 수 (migrations/0007).
+# task_table 을 바꾸는 쓰기가 같은 트랜잭션 안에서 증분 갱신 → commit 된 할 일과 함께 움직인다.
+#   추가             : 넣은 값으로 +1 (배치 create 는 모아서 executemany)
+#   상태 변경 / 삭제 : 바꾸기 전 행을 GROUP BY 로 -n, 상태 변경은 바꾼 뒤 +n (where 는 _tombstone 과 같은 조각)
+#   팀 삭제          : 마지막 트랜잭션에서 팀의 통계 행을 모두 삭제
+# 색 변경 / 담당자 해제는 (상태, 마감일) 이 그대로라 손대지 않는다.
+# 기한 지남 / 임박은 날짜에 따라 바뀌므로 저장하지 않고 조회할 때 task_end 범위로 합산
+# → 조회 비용은 팀의 할 일 수가 아니라 서로 다른 (상태, 마감일) 수.
+# 증분 갱신을 거치지 않은 쓰기 (수동 SQL, 중단된 팀 삭제 …) 는 reconcile_task_stats_to_db 가 바로잡는다.
+TASK_STATS_TABLE = "task_stats_table"
+TASK_STATES = ("TODO", "DOING", "DONE")
+
+SQL_TASK_STATS_ADD = Statement(
+    """
+    INSERT INTO {stats} (team_id, task_state, task_end, task_count)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE task_count = task_count + VALUES(task_count)
+    """,
+    sqlite="""
+    INSERT INTO {stats} (team_id, task_state, task_end, task_count)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (team_id, task_state, task_end) DO UPDATE SET task_count = task_count + excluded.task_count
+    """,
+    stats=TASK_STATS_TABLE,
+)
+SQL_TASK_STATS_DELTA = Statement(
+    """
+    INSERT INTO {stats} (team_id, task_state, task_end, task_count)
+    SELECT t.team_id, t.task_state, t.task_end, %s * COUNT(*) FROM {table} t WHERE {where}
+     GROUP BY t.team_id, t.task_state, t.task_end
+    ON DUPLICATE KEY UPDATE task_count = {stats}.task_count + VALUES(task_count)
+    """,
+    sqlite="""
+    INSERT INTO {stats} (team_id, task_state, task_end, task_count)
+    SELECT t.team_id, t.task_state, t.task_end, %s * COUNT(*) FROM {table} t WHERE {where}
+     GROUP BY t.team_id, t.task_state, t.task_end
+    ON CONFLICT (team_id, task_state, task_end) DO UPDATE SET task_count = {stats}.task_count + excluded.task_count
+    """,
+    table="task_table", stats=TASK_STATS_TABLE,
+)
+SQL_LOAD_TASK_STATS = Statement(
+    """
+    SELECT task_state, SUM(task_count),
+           SUM(CASE WHEN task_state <> 'DONE' AND task_end < %s THEN task_count ELSE 0 END),
+           SUM(CASE WHEN task_state <> 'DONE' AND task_end >= %s AND task_end <= %s THEN task_count ELSE 0 END)
+      FROM {stats}
+     WHERE team_id=%s
+     GROUP BY task_state
+    """,
+    stats=TASK_STATS_TABLE,
+)
+SQL_TEAMS = Statement("SELECT id, team_name FROM {teams} ORDER BY id", teams=TEAM_TABLE)
+# 값은 그대로, 팀 revision 행 잠금만 – 같은 팀 쓰기 (모두 _bump_revision 으로 이 행을 잠근다) 와 직렬화
+SQL_LOCK_REVISION = Statement(
+    "UPDATE {revision} SET revision = revision WHERE team_name=%s", revision=REVISION_TABLE
+)
+SQL_TASK_STATS_STORED = Statement(
+    "SELECT task_state, task_end, task_count FROM {stats} WHERE team_id=%s", stats=TASK_STATS_TABLE
+)
+SQL_TASK_STATS_ACTUAL = Statement(
+    "SELECT task_state, task_end, COUNT(*) FROM {table} WHERE team_id=%s GROUP BY task_state, task_end",
+    table="task_table",
+)
+SQL_TASK_STATS_CLEAR = Statement("DELETE FROM {stats} WHERE team_id=%s", stats=TASK_STATS_TABLE)
+SQL_TASK_STATS_REBUILD = Statement(
+    """
+    INSERT INTO {stats} (team_id, task_state, task_end, task_count)
+    SELECT team_id, task_state, task_end, COUNT(*) FROM {table}
+     WHERE team_id=%s
+     GROUP BY team_id, task_state, task_end
+    """,
+    table="task_table", stats=TASK_STATS_TABLE,
+)
+
+
+def _task_stats(cursor, table_name: str, where: str, params: Tuple[Any, ...], sign: int) -> None:
+    """where(별칭 t) 에 걸리는 할 일을 통계에 sign(+1 / -1) 만큼 반영 – 삭제 / 상태 변경과 같은 트랜잭션에서"""
+    cursor.execute(SQL_TASK_STATS_DELTA[table_name, where], (sign, *params))
+
+
+def _add_task_stats(cursor, counts: Dict[Tuple[Any, ...], int]) -> None:
+    """counts = {(team_id, task_state, task_end): 추가한 할 일 수}"""
+    cursor.executemany(SQL_TASK_STATS_ADD.sql, [(*key, n) for key, n in counts.items()])
+
+
+def load_task_stats_from_db(
+    *,
+    cursor,
+    team_name: str,
+    today: str | None = None,       # YYYY-MM-DD, 생략 시 서버 날짜 (클라이언트 시간대 기준이면 직접 전달)
+    due_days: int = 7,
+) -> Dict[str, Any]:
+    """
+    팀 할 일 통계 (DONE 포함)
+      state    : 상태별 개수
+      overdue  : DONE 이 아니고 task_end < today
+      due_soon : DONE 이 아니고 today <= task_end <= today + due_days
+    날짜 형식이 틀리면 ValueError
+    """
+    start = date.fromisoformat(today) if today else date.today()
+    until = start + timedelta(days=due_days)
+    key = ("task_stats", team_name, start, due_days)
+    hit, stats = cache.get(key)
+    if hit:
+        return stats
+
+    cursor.execute(SQL_LOAD_TASK_STATS.sql, (start, start, until, _find_team(cursor, team_name)))
+    state = dict.fromkeys(TASK_STATES, 0)
+    overdue = due_soon = 0
+    for task_state, count, late, soon in cursor.fetchall():
+        state[task_state] = int(count or 0)
+        overdue += int(late or 0)
+        due_soon += int(soon or 0)
+    stats = {
+        "team_name": team_name,
+        "total": sum(state.values()),
+        "state": state,
+        "overdue": overdue,
+        "due_soon": due_soon,
+        "today": start.isoformat(),
+        "due_until": until.isoformat(),
+    }
+    cache.set(key, stats, [("task", team_name)])
+    return stats
+
+
+def reconcile_task_stats_to_db(
+    *,
+    connection,
+    cursor,
+    team_name: str | None = None,       # None = 모든 팀
+    table_name: str = "task_table",
+) -> Dict[str, int]:
+    """
+    통계를 task_table 과 비교해 다르면 그 팀 것만 다시 만든다 (팀마다 한 트랜잭션).
+    팀 revision 행을 잠근 뒤 세므로 그 사이 같은 팀 쓰기는 기다렸다가 증분 갱신.
+    0 이 된 행도 이때 정리. 반환 {"teams": 확인한 팀 수, "fixed": 어긋나 있던 팀 수}
+    """
+    if team_name is None:
+        cursor.execute(SQL_TEAMS.sql)
+        teams = cursor.fetchall()
+    else:
+        teams = [(_find_team(cursor, team_name), team_name)]
+    connection.commit()                 # 팀마다 새 스냅샷 (잠근 뒤 첫 SELECT 에서)
+
+    fixed = 0
+    for team_id, name in teams:
+        if not team_id:
+            continue
+        try:
+            cursor.execute(SQL_LOCK_REVISION.sql, (name,))
+            cursor.execute(SQL_TASK_STATS_STORED.sql, (team_id,))
+            stored = {(task_state, task_end): n for task_state, task_end, n in cursor.fetchall()}
+            cursor.execute(SQL_TASK_STATS_ACTUAL[table_name], (team_id,))
+            actual = {(task_state, task_end): n for task_state, task_end, n in cursor.fetchall()}
+            drift = {k: n for k, n in stored.items() if n} != actual
+            if drift or len(stored) != len(actual):
+                cursor.execute(SQL_TASK_STATS_CLEAR.sql, (team_id,))
+                cursor.execute(SQL_TASK_STATS_REBUILD[table_name], (team_id,))
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+        if drift:
+            fixed += 1
+            cache.invalidate(("task", name))
+    return {"teams": len(teams), "fixed": fixed}
 # ────────────────────────────────
 # 4.  Board (Kanban)
 # ────────────────────────────────
 
+# board_table = (team_id, board_name) 엔티티, board_color 는 여기 한 곳에만.
+# card_table  = board_id 로 묶인 카드 (예전 board_table 의 행, id 유지)
+# 함수의 table_name 은 card_table. 조회 결과는 예전 board_table 행 모양 그대로 (CARD_COLUMNS)
+
+SQL_ADD_CARD = Statement(
+    """
+    INSERT INTO {table} (board_id, card_name, card_content, revision)
+    VALUES (%s, %s, %s, %s)
+    """,
+    table="card_table",
+)
+# 배치 create 용 – board_id 를 이름으로 찾는다 (board 는 같은 트랜잭션 앞 step 에서 upsert)
+SQL_ADD_CARD_BY_NAME = Statement(
+    """
+    INSERT INTO {table} (board_id, card_name, card_content, revision)
+    SELECT b.id, %s, %s, %s FROM {boards} b WHERE b.team_id=%s AND b.board_name=%s
+    """,
+    table="card_table", boards=BOARD_TABLE,
+)
+SQL_LOAD_BOARD = Statement(
+    "SELECT " + CARD_COLUMNS + """
+      FROM {boards} b
+      JOIN {table} t ON t.board_id = b.id
+      JOIN {teams} tm ON tm.id = b.team_id
+     WHERE b.team_id=%s AND b.board_name=%s
+    """,
+    table="card_table", boards=BOARD_TABLE, teams=TEAM_TABLE,
+)
+# 카드는 FK ON DELETE CASCADE 로 함께 삭제
+SQL_DELETE_BOARD = Statement(
+    "DELETE FROM {boards} WHERE team_id=%s AND board_name=%s", boards=BOARD_TABLE
+)
+# 색 변경은 board 한 행 + sync 가 보도록 그 board 카드들의 revision
+SQL_UPDATE_BOARD_COLOR = Statement(
+    """
+    UPDATE {boards} b LEFT JOIN {table} t ON t.board_id = b.id
+       SET b.board_color=%s, b.revision=%s, t.revision=%s
+     WHERE b.team_id=%s AND b.board_name=%s
+    """,
+    # SQLite 는 UPDATE 한 문장에 테이블 하나 → 두 문장 (같은 파라미터, 번호로 참조)
+    sqlite="""
+    UPDATE {boards} SET board_color=?1, revision=?2 WHERE team_id=?4 AND board_name=?5;
+    UPDATE {table} SET revision=?3
+     WHERE board_id = (SELECT id FROM {boards} WHERE team_id=?4 AND board_name=?5)
+    """,
+    table="card_table", boards=BOARD_TABLE,
+)
+SQL_DELETE_CARD = Statement(
+    """
+    DELETE t FROM {table} t JOIN {boards} b ON b.id = t.board_id
+     WHERE b.team_id=%s AND b.board_name=%s AND t.card_name=%s
+    """,
+    sqlite="""
+    DELETE FROM {table}
+     WHERE board_id = (SELECT id FROM {boards} WHERE team_id=%s AND board_name=%s) AND card_name=%s
+    """,
+    table="card_table", boards=BOARD_TABLE,
+)
+SQL_UPDATE_CARD = Statement(
+    """
+    UPDATE {table} t JOIN {boards} b ON b.id = t.board_id
+       SET t.card_content=%s, t.revision=%s
+     WHERE b.team_id=%s AND b.board_name=%s AND t.card_name=%s
+    """,
+    sqlite="""
+    UPDATE {table} SET card_content=%s, revision=%s
+     WHERE board_id = (SELECT id FROM {boards} WHERE team_id=%s AND board_name=%s) AND card_name=%s
+    """,
+    table="card_table", boards=BOARD_TABLE,
+)
+# 다른 board 로 이동 (+ 선택적으로 내용 변경) – {sets} = "" / ", card_content=%s"
+# (새 board 는 같은 트랜잭션 앞에서 _ensure_board 로 만들어 둔다)
+SQL_MOVE_CARD = Statement(
+    """
+    UPDATE {table} t
+      JOIN {boards} b  ON b.id = t.board_id
+      JOIN {boards} nb ON nb.team_id = b.team_id AND nb.board_name = %s
+       SET t.board_id = nb.id{sets}, t.revision=%s
+     WHERE b.team_id=%s AND b.board_name=%s AND t.card_name=%s
+    """,
+    sqlite="""
+    UPDATE {table}
+       SET board_id = (SELECT nb.id FROM {boards} b JOIN {boards} nb ON nb.team_id = b.team_id
+                        WHERE b.id = {table}.board_id AND nb.board_name = %s){sets}, revision=%s
+     WHERE board_id = (SELECT id FROM {boards} WHERE team_id=%s AND board_name=%s) AND card_name=%s
+    """,
+    table="card_table", boards=BOARD_TABLE,
+).warm(sets=["", ", card_content=%s"])
+
 
 def add_board_to_db(
     *,
@@ -273,17 +1029,14 @@ def add_board_to_db(
     card_name: str,
     card_content: str,
     board_color: int,
-    table_name: str = "board_table",
+    table_name: str = "card_table",
 ):
-    cursor.execute(
-        f"""
-        INSERT INTO {table_name}
-            (team_name, board_name, card_name, card_content, board_color)
-        VALUES (%s, %s, %s, %s, %s)
-        """,
-        (team_name, board_name, card_name, card_content, board_color),
-    )
+    team_id = _ensure_team(connection, cursor, team_name)
+    revision = _bump_revision(cursor, team_name)
+    board_id = _ensure_board(cursor, team_id, board_name, board_color, revision)
+    cursor.execute(SQL_ADD_CARD[table_name], (board_id, card_name, card_content, revision))
     connection.commit()
+    cache.invalidate(("board", team_name, board_name), ("board_team", team_name))
 
 
 def load_board_from_db(
@@ -291,13 +1044,16 @@ def load_board_from_db(
     cursor,
     team_name: str,
     board_name: str,
-    table_name: str = "board_table",
+    table_name: str = "card_table",
 ) -> List[Dict[str, Any]]:
-    cursor.execute(
-        f"SELECT * FROM {table_name} WHERE team_name=%s AND board_name=%s",
-        (team_name, board_name),
-    )
-    return cursor.fetchall()
+    key = ("board", table_name, team_name, board_name)
+    hit, rows = cache.get(key)
+    if hit:
+        return rows
+    cursor.execute(SQL_LOAD_BOARD[table_name], (_find_team(cursor, team_name), board_name))
+    rows = cursor.fetchall()
+    cache.set(key, rows, [("board", team_name), ("board", team_name, board_name)])
+    return rows
 
 
 def delete_board_from_db(
@@ -306,13 +1062,14 @@ def delete_board_from_db(
     cursor,
     team_name: str,
     board_name: str,
-    table_name: str = "board_table",
+    table_name: str = "card_table",
 ):
-    cursor.execute(
-        f"DELETE FROM {table_name} WHERE team_name=%s AND board_name=%s",
-        (team_name, board_name),
-    )
+    team_id = _find_team(cursor, team_name)
+    revision = _bump_revision(cursor, team_name)
+    _tombstone(cursor, table_name, "b.team_id=%s AND b.board_name=%s", (team_id, board_name), revision)
+    cursor.execute(SQL_DELETE_BOARD.sql, (team_id, board_name))
     connection.commit()
+    cache.invalidate(("board", team_name, board_name), ("board_team", team_name))
 
 def update_board_to_db(
     *,
@@ -321,16 +1078,18 @@ def update_board_to_db(
     team_name: str,
     board_name: str,
     board_color: int,
-    table_name: str = "board_table",
+    table_name: str = "card_table",
 ) -> None:
     """
     칸반 컬럼(board)의 색상만 변경.
     """
+    team_id = _find_team(cursor, team_name)
+    revision = _bump_revision(cursor, team_name)
     cursor.execute(
-        f"UPDATE {table_name} SET board_color=%s WHERE team_name=%s AND board_name=%s",
-        (board_color, team_name, board_name),
+        SQL_UPDATE_BOARD_COLOR[table_name], (board_color, revision, revision, team_id, board_name)
     )
     connection.commit()
+    cache.invalidate(("board", team_name, board_name), ("board_team", team_name))
 
 
 def delete_card_from_db(
@@ -340,27 +1099,78 @@ def delete_card_from_db(
     team_name: str,
     board_name: str,
     card_name: str,
-    table_name: str = "board_table",
+    table_name: str = "card_table",
 ):
-    cursor.execute(
-        f"""
-        DELETE FROM {table_name}
-         WHERE team_name=%s AND board_name=%s AND card_name=%s
-        """,
-        (team_name, board_name, card_name),
+    team_id = _find_team(cursor, team_name)
+    revision = _bump_revision(cursor, team_name)
+    _tombstone(
+        cursor, table_name, "b.team_id=%s AND b.board_name=%s AND t.card_name=%s",
+        (team_id, board_name, card_name), revision,
     )
+    cursor.execute(SQL_DELETE_CARD[table_name], (team_id, board_name, card_name))
     connection.commit()
+    cache.invalidate(("board", team_name, board_name), ("board_team", team_name))
 
 
 # ────────────────────────────────
 # 5.  Member
 # ────────────────────────────────
 
+SQL_ADD_MEMBER = Statement(
+    """
+    INSERT INTO {table} (team_id, user_email, user_owner, revision)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        user_owner = VALUES(user_owner),
+        revision   = VALUES(revision)
+    """,
+    sqlite="""
+    INSERT INTO {table} (team_id, user_email, user_owner, revision)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (team_id, user_email) DO UPDATE SET
+        user_owner = excluded.user_owner,
+        revision   = excluded.revision
+    """,
+    table="member_table",
+)
+# {where} = 팀 / 사용자 / 둘 다 / 전체
+SQL_LOAD_MEMBER = Statement(
+    "SELECT " + MEMBER_COLUMNS + " FROM {table} t JOIN {teams} tm ON tm.id = t.team_id{where}",
+    table="member_table", teams=TEAM_TABLE,
+).warm(where=["", " WHERE t.team_id=%s", " WHERE t.user_email=%s", " WHERE t.team_id=%s AND t.user_email=%s"])
+SQL_UPDATE_MEMBER = Statement(
+    """
+    UPDATE {table}
+       SET user_owner=%s, revision=%s
+     WHERE team_id=%s AND user_email=%s
+    """,
+    table="member_table",
+)
+SQL_DELETE_MEMBER = Statement(
+    "DELETE FROM {table} WHERE team_id=%s AND user_email=%s", table="member_table"
+)
+
+
+def _invalidate_member(team_name: str | None, user_email: str | None) -> None:
+    cache.invalidate(("member", team_name), ("member_email", user_email), ("member_all",))
 
-def _owner_to_int(val: bool | int) -> int:
+
+def _owner_to_int(val: bool | int | str | None) -> int:
+    if isinstance(val, str):  # 클라이언트는 "true" / "false" 문자열로 보냄
+        return int(val.strip().lower() in ("1", "true", "owner"))
     return int(bool(val))
 
 
+def _member_where(cursor, team_name: str | None, user_email: str | None) -> Tuple[str, Tuple[Any, ...]]:
+    if team_name and user_email:
+        return " WHERE t.team_id=%s AND t.user_email=%s", (_find_team(cursor, team_name), user_email)
+    if team_name:
+        return " WHERE t.team_id=%s", (_find_team(cursor, team_name),)
+    if user_email:
+        return " WHERE t.user_email=%s", (user_email,)
+    return "", ()
+
+
 def add_member_to_db(
     *,
     connection,
@@ -370,15 +1180,13 @@ def add_member_to_db(
     is_owner: bool = False,
     table_name: str = "member_table",
 ):
+    team_id = _ensure_team(connection, cursor, team_name)
+    revision = _bump_revision(cursor, team_name)
     cursor.execute(
-        f"""
-        INSERT INTO {table_name} (team_name, user_email, user_owner)
-        VALUES (%s, %s, %s)
-        ON DUPLICATE KEY UPDATE user_owner = VALUES(user_owner)
-        """,
-        (team_name, user_email, _owner_to_int(is_owner)),
+        SQL_ADD_MEMBER[table_name], (team_id, user_email, _owner_to_int(is_owner), revision)
     )
     connection.commit()
+    _invalidate_member(team_name, user_email)
 
 
 def load_member_from_db(
@@ -388,23 +1196,18 @@ def load_member_from_db(
     user_email: str | None = None,
     table_name: str = "member_table",
 ) -> List[Dict[str, Any]]:
-    if team_name and not user_email:
-        cursor.execute(
-            f"SELECT * FROM {table_name} WHERE team_name=%s", (team_name,)
-        )
-    elif user_email and not team_name:
-        cursor.execute(
-            f"SELECT * FROM {table_name} WHERE user_email=%s", (user_email,)
-        )
-    elif team_name and user_email:
-        cursor.execute(
-            f"""SELECT * FROM {table_name}
-                 WHERE team_name=%s AND user_email=%s""",
-            (team_name, user_email),
-        )
-    else:
-        cursor.execute(f"SELECT * FROM {table_name}")
-    return cursor.fetchall()
+    key = ("member", table_name, team_name, user_email)
+    hit, rows = cache.get(key)
+    if hit:
+        return rows
+    where, params = _member_where(cursor, team_name, user_email)
+    cursor.execute(SQL_LOAD_MEMBER[table_name, where], params)
+    rows = cursor.fetchall()
+    tags: List[Hashable] = [("member", team_name), ("member_email", user_email), ("member_all",)]
+    for row in rows:  # id, team_name, user_email, user_owner
+        tags += [("member", row[1]), ("member_email", row[2])]
+    cache.set(key, rows, tags)
+    return rows
 
 
 def update_member_to_db(
@@ -416,15 +1219,13 @@ def update_member_to_db(
     is_owner: bool,
     table_name: str = "member_table",
 ):
+    team_id = _find_team(cursor, team_name)
+    revision = _bump_revision(cursor, team_name)
     cursor.execute(
-        f"""
-        UPDATE {table_name}
-           SET user_owner=%s
-         WHERE team_name=%s AND user_email=%s
-        """,
-        (_owner_to_int(is_owner), team_name, user_email),
+        SQL_UPDATE_MEMBER[table_name], (_owner_to_int(is_owner), revision, team_id, user_email)
     )
     connection.commit()
+    _invalidate_member(team_name, user_email)
 
 
 def delete_member_from_db(
@@ -435,11 +1236,587 @@ def delete_member_from_db(
     user_email: str,
     table_name: str = "member_table",
 ):
-    cursor.execute(
-        f"DELETE FROM {table_name} WHERE team_name=%s AND user_email=%s",
-        (team_name, user_email),
+    team_id = _find_team(cursor, team_name)
+    revision = _bump_revision(cursor, team_name)
+    _tombstone(cursor, table_name, "t.team_id=%s AND t.user_email=%s", (team_id, user_email), revision)
+    cursor.execute(SQL_DELETE_MEMBER[table_name], (team_id, user_email))
+    connection.commit()
+    _invalidate_member(team_name, user_email)
+
+
+# delete_team_from_db → 10. Cascade delete
+
+
+# ────────────────────────────────
+# 6.  Team snapshot (task + board + member)
+# ────────────────────────────────
+
+SQL_LOAD_TEAM_BOARDS = Statement(
+    "SELECT " + CARD_COLUMNS + """
+      FROM {boards} b
+      JOIN {table} t ON t.board_id = b.id
+      JOIN {teams} tm ON tm.id = b.team_id
+     WHERE b.team_id=%s
+     ORDER BY b.board_name, t.id
+    """,
+    table="card_table", boards=BOARD_TABLE, teams=TEAM_TABLE,
+)
+
+
+def _load_team_boards(*, cursor, team_name: str, table_name: str) -> List[Tuple[Any, ...]]:
+    key = ("board_team", table_name, team_name)
+    hit, rows = cache.get(key)
+    if hit:
+        return rows
+    cursor.execute(SQL_LOAD_TEAM_BOARDS[table_name], (_find_team(cursor, team_name),))
+    rows = cursor.fetchall()
+    cache.set(key, rows, [("board", team_name), ("board_team", team_name)])
+    return rows
+
+
+def load_team_snapshot_from_db(
+    *,
+    cursor,
+    team_name: str,
+    task_target: str,
+    user_email: str,
+    hide_done: bool = True,
+    task_table: str = "task_table",
+    card_table: str = "card_table",
+    member_table: str = "member_table",
+) -> Dict[str, Any]:
+    """
+    팀 화면 최초 진입용 – 커넥션 1개로 task / board 전체 / member 를 한 번에 조회.
+    board 는 board_name 단위로 묶어서 반환 (card 행은 /load_board 와 같은 형태)
+      {"task": [...], "board": [{"board_name", "board_color", "card": [...]}], "member": [...]}
+    """
+    task = load_task_from_db(
+        cursor=cursor,
+        team_name=team_name,
+        task_target=task_target,
+        user_email=user_email,
+        hide_done=hide_done,
+        table_name=task_table,
     )
+    board: Dict[str, Dict[str, Any]] = {}
+    for row in _load_team_boards(cursor=cursor, team_name=team_name, table_name=card_table):
+        # id, team_name, board_name, board_color, card_name, card_content
+        group = board.setdefault(row[2], {"board_name": row[2], "board_color": row[3], "card": []})
+        group["card"].append(row)
+    member = load_member_from_db(cursor=cursor, team_name=team_name, table_name=member_table)
+    return {"task": task, "board": list(board.values()), "member": member}
+
+
+# ────────────────────────────────
+# 7.  Batch (task / card) – 배치 1개 = 트랜잭션 1개
+# ────────────────────────────────
+
+
+def _require(op: Dict[str, Any], index: int, *fields: str) -> None:
+    missing = [f for f in fields if op.get(f) is None]
+    if missing:
+        raise ValueError(f"operations[{index}] ({op.get('op')}): missing {', '.join(missing)}")
+
+
+# step = (kind, sql, params)
+#   "many" : executemany(sql, params 행 목록) – 항목마다 결과 1
+#   "one"  : execute(sql, params)            – 항목 결과 = rowcount
+#   "call" : sql 자리에 callable (revision / tombstone 보조 작업, 결과 없음)
+Step = Tuple[str, Any, Any]
+
+
+def _append_step(steps: List[Step], kind: str, sql: Any, params: Any = None) -> None:
+    if kind == "many" and steps and steps[-1][0] == "many" and steps[-1][1] == sql:
+        steps[-1][2].append(params)
+    elif kind == "many":
+        steps.append(("many", sql, [params]))
+    else:
+        steps.append((kind, sql, params))
+
+
+def _run_batch(connection, cursor, teams: set, build) -> List[int]:
+    """
+    teams 의 revision 을 (정렬 순서로 잠가 교착 방지) 올린 뒤 build(revs) 로 만든 step 실행.
+    연속된 create 는 executemany → pymysql 이 multi-row INSERT 한 문장으로 합쳐 보냄.
+    하나라도 실패하면 전체 rollback 후 예외 전파 (all-or-nothing).
+    """
+    affected: List[int] = []
+    try:
+        revs = {team: _bump_revision(cursor, team) for team in sorted(teams)}
+        for kind, sql, params in build(revs):
+            if kind == "many":
+                cursor.executemany(sql, params)
+                affected.extend([1] * len(params))
+            elif kind == "call":
+                sql()
+            else:
+                affected.append(cursor.execute(sql, params))
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    return affected
+
+
+def batch_tasks_to_db(
+    *,
+    connection,
+    cursor,
+    operations: List[Dict[str, Any]],
+    table_name: str = "task_table",
+) -> List[Dict[str, Any]]:
+    """
+    operations: [{"op": "create" | "update" | "delete", ...add/update/delete_task_to_db 인자}]
+    반환: 항목별 {"index", "op", "affected"}
+    검증 실패 → ValueError (DB 는 건드리지 않음)
+    """
+    teams: set = set()
+    for i, op in enumerate(operations):
+        kind = op.get("op")
+        if kind == "create":
+            _require(op, i, "team_name", "task_name", "task_start", "task_end", "task_target", "user_email")
+        elif kind == "update":
+            _require(op, i, "team_name", "task_name")
+            if op.get("task_state") is None and op.get("task_color") is None:
+                raise ValueError(f"operations[{i}] (update): nothing to update")
+        elif kind == "delete":
+            _require(op, i, "task_name")
+            if not op.get("team_name"):
+                _require(op, i, "user_email")
+                continue
+        else:
+            raise ValueError(f"operations[{i}]: unknown op {kind!r}")
+        teams.add(op["team_name"])
+
+    # 팀 id 는 배치 트랜잭션 밖에서 (생성 시 바로 commit) 먼저 확보
+    ids = {team: _ensure_team(connection, cursor, team) for team in sorted(teams)}
+    tags: List[Hashable] = []
+    for op in operations:
+        if op["op"] == "create":
+            tags += [("task", op["team_name"]), ("task_owner", op["task_target"], op["user_email"])]
+        elif op["op"] == "update":
+            if op.get("task_state") is not None:
+                tags += _task_owners(
+                    cursor, table_name, "team_id=%s AND task_name=%s",
+                    (ids[op["team_name"]], op["task_name"]),
+                )
+            tags.append(("task", op["team_name"]))
+        elif op.get("team_name"):
+            tags.append(("task", op["team_name"]))
+        else:
+            tags.append(("task_email", op["user_email"]))
+
+    def build(revs: Dict[str, int]) -> List[Step]:
+        steps: List[Step] = []
+        created: Dict[Tuple[Any, ...], int] = {}      # 연속된 create 의 통계 +1 – 다음 update / delete 전에 반영
+
+        def flush_created() -> None:
+            if created:
+                _append_step(steps, "call", partial(_add_task_stats, cursor, dict(created)))
+                created.clear()
+
+        for op in operations:
+            kind = op["op"]
+            if kind == "create":
+                row = (ids[op["team_name"]], op["task_name"], op["task_start"], op["task_end"],
+                       op.get("task_state") or "TODO", op.get("task_color") or 0,
+                       op["task_target"], op["user_email"], revs[op["team_name"]])
+                _append_step(steps, "many", SQL_ADD_TASK[table_name], row)
+                stat = (row[0], row[4], row[3])
+                created[stat] = created.get(stat, 0) + 1
+                continue
+            flush_created()
+            if kind == "update":
+                sets, params = [], []
+                for column in ("task_state", "task_color"):
+                    if op.get(column) is not None:
+                        sets.append(f"{column}=%s")
+                        params.append(op[column])
+                key = (ids[op["team_name"]], op["task_name"])
+                stats = op.get("task_state") is not None
+                if stats:
+                    _append_step(steps, "call", partial(
+                        _task_stats, cursor, table_name, "t.team_id=%s AND t.task_name=%s", key, -1,
+                    ))
+                _append_step(
+                    steps, "one",
+                    SQL_UPDATE_TASK[table_name, ", ".join(sets)],
+                    (*params, revs[op["team_name"]], *key),
+                )
+                if stats:
+                    _append_step(steps, "call", partial(
+                        _task_stats, cursor, table_name, "t.team_id=%s AND t.task_name=%s", key, +1,
+                    ))
+            elif op.get("team_name"):
+                key = (ids[op["team_name"]], op["task_name"])
+                _append_step(steps, "call", partial(
+                    _tombstone, cursor, table_name, "t.team_id=%s AND t.task_name=%s",
+                    key, revs[op["team_name"]],
+                ))
+                _append_step(steps, "call", partial(
+                    _task_stats, cursor, table_name, "t.team_id=%s AND t.task_name=%s", key, -1,
+                ))
+                _append_step(steps, "one", SQL_DELETE_TEAM_TASK[table_name], key)
+            else:
+                key = (op["user_email"], op["task_name"])
+                _append_step(steps, "call", partial(
+                    _bump_revisions, cursor, table_name, "t.user_email=%s AND t.task_name=%s", key,
+                ))
+                _append_step(steps, "call", partial(
+                    _tombstone, cursor, table_name, "t.user_email=%s AND t.task_name=%s", key,
+                ))
+                _append_step(steps, "call", partial(
+                    _task_stats, cursor, table_name, "t.user_email=%s AND t.task_name=%s", key, -1,
+                ))
+                _append_step(steps, "one", SQL_DELETE_OWN_TASK[table_name], key)
+        flush_created()
+        return steps
+
+    affected = _run_batch(connection, cursor, teams, build)
+    cache.invalidate(*tags)
+    return [
+        {"index": i, "op": op["op"], "affected": n}
+        for i, (op, n) in enumerate(zip(operations, affected))
+    ]
+
+
+def batch_cards_to_db(
+    *,
+    connection,
+    cursor,
+    operations: List[Dict[str, Any]],
+    table_name: str = "card_table",
+) -> List[Dict[str, Any]]:
+    """
+    operations: [{"op": "create" | "update" | "delete", team_name, board_name, card_name, ...}]
+      create : card_content, board_color
+      update : card_content 변경 및/또는 new_board_name 으로 다른 board 로 이동
+      delete : 카드 1장 삭제
+    반환: 항목별 {"index", "op", "affected"}
+    """
+    teams: set = set()
+    tags: List[Hashable] = []
+    for i, op in enumerate(operations):
+        kind = op.get("op")
+        _require(op, i, "team_name", "board_name", "card_name")
+        team_name, board_name = op["team_name"], op["board_name"]
+        tags += [("board", team_name, board_name), ("board_team", team_name)]
+        if kind == "create":
+            _require(op, i, "card_content")
+        elif kind == "update":
+            if op.get("card_content") is None and op.get("new_board_name") is None:
+                raise ValueError(f"operations[{i}] (update): nothing to update")
+            if op.get("new_board_name") is not None:
+                tags.append(("board", team_name, op["new_board_name"]))
+        elif kind != "delete":
+            raise ValueError(f"operations[{i}]: unknown op {kind!r}")
+        teams.add(team_name)
+
+    ids = {team: _ensure_team(connection, cursor, team) for team in sorted(teams)}
+
+    def build(revs: Dict[str, int]) -> List[Step]:
+        steps: List[Step] = []
+        for op in operations:
+            kind = op["op"]
+            team_id, revision = ids[op["team_name"]], revs[op["team_name"]]
+            key = (team_id, op["board_name"], op["card_name"])
+            if kind == "create":
+                # board 는 "call" (결과 없음), card INSERT 는 board_id 를 서브쿼리로 찾는다
+                _append_step(steps, "call", partial(
+                    _ensure_board, cursor, team_id, op["board_name"], op.get("board_color") or 0, revision,
+                ))
+                _append_step(steps, "one", SQL_ADD_CARD_BY_NAME[table_name],
+                             (op["card_name"], op["card_content"], revision, team_id, op["board_name"]))
+            elif kind == "update" and op.get("new_board_name") is not None:
+                _append_step(steps, "call", partial(
+                    _ensure_board, cursor, team_id, op["new_board_name"], op.get("board_color") or 0, revision,
+                ))
+                content = op.get("card_content")
+                _append_step(
+                    steps, "one",
+                    SQL_MOVE_CARD[table_name, "" if content is None else ", card_content=%s"],
+                    (op["new_board_name"], *(() if content is None else (content,)), revision, *key),
+                )
+            elif kind == "update":
+                _append_step(steps, "one", SQL_UPDATE_CARD[table_name], (op["card_content"], revision, *key))
+            else:
+                _append_step(steps, "call", partial(
+                    _tombstone, cursor, table_name,
+                    "b.team_id=%s AND b.board_name=%s AND t.card_name=%s", key, revision,
+                ))
+                _append_step(steps, "one", SQL_DELETE_CARD[table_name], key)
+        return steps
+
+    affected = _run_batch(connection, cursor, teams, build)
+    cache.invalidate(*tags)
+    return [
+        {"index": i, "op": op["op"], "affected": n}
+        for i, (op, n) in enumerate(zip(operations, affected))
+    ]
+
+
+# ────────────────────────────────
+# 8.  Delta sync
+# ────────────────────────────────
+
+SQL_TEAM_REVISION = Statement(
+    "SELECT revision, pruned_revision FROM {revision} WHERE team_name=%s", revision=REVISION_TABLE
+)
+SQL_CHANGED_TASKS = Statement(
+    "SELECT " + TASK_COLUMNS + """
+      FROM {table} t JOIN {teams} tm ON tm.id = t.team_id
+     WHERE t.team_id=%s AND t.revision > %s AND t.revision <= %s{extra}
+    """,
+    table="task_table", teams=TEAM_TABLE,
+).warm(extra=["", " AND t.user_email=%s"])
+SQL_CHANGED_CARDS = Statement(
+    "SELECT " + CARD_COLUMNS + """
+      FROM {boards} b
+      JOIN {table} t ON t.board_id = b.id
+      JOIN {teams} tm ON tm.id = b.team_id
+     WHERE b.team_id=%s AND t.revision > %s AND t.revision <= %s
+    """,
+    table="card_table", boards=BOARD_TABLE, teams=TEAM_TABLE,
+)
+SQL_CHANGED_MEMBERS = Statement(
+    "SELECT " + MEMBER_COLUMNS + """
+      FROM {table} t JOIN {teams} tm ON tm.id = t.team_id
+     WHERE t.team_id=%s AND t.revision > %s AND t.revision <= %s
+    """,
+    table="member_table", teams=TEAM_TABLE,
+)
+SQL_TOMBSTONES_SINCE = Statement(
+    """
+    SELECT table_name, row_id, revision FROM {tombstone}
+     WHERE team_name=%s AND revision > %s AND revision <= %s
+     ORDER BY revision
+    """,
+    tombstone=TOMBSTONE_TABLE,
+)
+SQL_MARK_PRUNED = Statement(
+    """
+    UPDATE {revision} r
+      JOIN (SELECT team_name, MAX(revision) AS max_revision
+              FROM {tombstone}
+             WHERE deleted_at < NOW() - INTERVAL %s DAY
+             GROUP BY team_name) p ON p.team_name = r.team_name
+       SET r.pruned_revision = GREATEST(r.pruned_revision, p.max_revision)
+    """,
+    sqlite="""
+    UPDATE {revision}
+       SET pruned_revision = MAX(pruned_revision, p.max_revision)
+      FROM (SELECT team_name, MAX(revision) AS max_revision
+              FROM {tombstone}
+             WHERE deleted_at < datetime('now', '-' || %s || ' days')
+             GROUP BY team_name) p
+     WHERE p.team_name = {revision}.team_name
+    """,
+    revision=REVISION_TABLE, tombstone=TOMBSTONE_TABLE,
+)
+SQL_PRUNE_TOMBSTONES = Statement(
+    "DELETE FROM {tombstone} WHERE deleted_at < NOW() - INTERVAL %s DAY",
+    sqlite="DELETE FROM {tombstone} WHERE deleted_at < datetime('now', '-' || %s || ' days')",
+    tombstone=TOMBSTONE_TABLE,
+)
+
+
+def sync_team_from_db(
+    *,
+    cursor,
+    team_name: str,
+    since: int = 0,
+    user_email: str | None = None,
+    task_table: str = "task_table",
+    card_table: str = "card_table",
+    member_table: str = "member_table",
+) -> Dict[str, Any]:
+    """
+    since(클라이언트가 마지막으로 받은 revision) 이후 바뀐 행 + 삭제 목록.
+      since <= 0 또는 tombstone 이 이미 정리된 구간이면 reset=True 로 전체 행을 보낸다.
+      team_name='' (개인 할 일) 은 user_email 의 할 일만.
+    반환 {"revision", "reset", "task", "board", "member", "deleted": [(table_name, row_id, revision)]}
+    """
+    team_id = _find_team(cursor, team_name)
+    # 첫 SELECT 에서 스냅샷이 잡히므로 revision 을 먼저 읽어 상한으로 사용
+    cursor.execute(SQL_TEAM_REVISION.sql, (team_name,))
+    revision, pruned = cursor.fetchone() or (0, 0)
+    reset = since <= 0 or since < pruned
+    lower = -1 if reset else since
+
+    def changed(sql: str, extra_params: Tuple[Any, ...] = ()):
+        cursor.execute(sql, (team_id, lower, revision, *extra_params))
+        return cursor.fetchall()
+
+    personal = team_name == ""
+    deleted: Tuple[Any, ...] = ()
+    if not reset:
+        cursor.execute(SQL_TOMBSTONES_SINCE.sql, (team_name, lower, revision))
+        deleted = cursor.fetchall()
+    return {
+        "revision": revision,
+        "reset": reset,
+        "task": changed(
+            SQL_CHANGED_TASKS[task_table, " AND t.user_email=%s" if personal else ""],
+            (user_email,) if personal else (),
+        ),
+        "board": changed(SQL_CHANGED_CARDS[card_table]),
+        "member": changed(SQL_CHANGED_MEMBERS[member_table]),
+        "deleted": deleted,
+    }
+
+
+def prune_tombstones_from_db(*, connection, cursor, older_than_days: int = 30) -> int:
+    """
+    오래된 tombstone 정리. 정리된 구간의 revision 을 pruned_revision 에 남겨
+    그보다 오래된 cursor 로 sync 하면 reset 되도록 한다.
+    """
+    cursor.execute(SQL_MARK_PRUNED.sql, (older_than_days,))
+    removed = cursor.execute(SQL_PRUNE_TOMBSTONES.sql, (older_than_days,))
     connection.commit()
+    return removed
+
+
+# ────────────────────────────────
+# 9.  Streaming (SSCursor) – fetchall 없이 batch 단위로 yield
+# ────────────────────────────────
+
+# cursor 는 pymysql.cursors.SSCursor (unbuffered) 여야 메모리가 batch_size 로 제한된다.
+# 스트림이 끝날 때까지 커넥션을 점유하므로 AsyncDB.stream 으로만 호출할 것. (캐시 미사용)
+
+
+def _stream(cursor, sql: str, params: Tuple[Any, ...], batch_size: int) -> Iterator[Sequence[Any]]:
+    cursor.execute(sql, params)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
+
+
+def stream_member_from_db(
+    *,
+    cursor,
+    team_name: str | None = None,
+    user_email: str | None = None,
+    batch_size: int = 500,
+    table_name: str = "member_table",
+) -> Iterator[Sequence[Any]]:
+    where, params = _member_where(cursor, team_name, user_email)
+    return _stream(cursor, SQL_LOAD_MEMBER[table_name, where], params, batch_size)
+
+
+def stream_task_from_db(
+    *,
+    cursor,
+    team_name: str,
+    task_target: str,
+    user_email: str,
+    hide_done: bool = True,
+    batch_size: int = 500,
+    table_name: str = "task_table",
+) -> Iterator[Sequence[Any]]:
+    sql = SQL_LOAD_TASK[table_name, TASK_FILTERS[0] if hide_done else ""]
+    return _stream(cursor, sql, (_find_team(cursor, team_name), task_target, user_email), batch_size)
+
+
+# ────────────────────────────────
+# 10.  Cascade delete (team / user) – chunk 단위 commit
+# ────────────────────────────────
+
+# 큰 팀을 DELETE 한 문장으로 지우면 끝날 때까지 인덱스 범위 잠금이 유지되어 그 팀의 쓰기가 모두 멈춘다.
+# chunk_size 행씩 지우고 바로 commit → 잠금은 chunk 하나 분량만 짧게 잡힌다.
+# 모든 단계가 "남은 행" 기준이라 중간에 실패 / 중단돼도 다시 호출하면 이어서 진행 (idempotent).
+#   job_id : chunk 마다 같은 트랜잭션 안에서 cascade_job_table 진행 상황 갱신 (background 실행용)
+#   stop   : chunk 사이마다 확인, True 면 CascadeInterrupted (shutdown 시 남은 작업은 재실행으로)
+# 카드는 board 행을 지울 때 FK ON DELETE CASCADE 로 함께 지워지지만, board 하나에 카드가 많을 수
+# 있으므로 카드를 먼저 chunk 로 지운다. team_table 행은 남겨 둔다 (id 재사용 방지, 0‑2 참고).
+
+CASCADE_JOB_TABLE = "cascade_job_table"
+CASCADE_CHUNK_SIZE = 1000
+
+
+class CascadeInterrupted(RuntimeError):
+    """stop() 으로 중단 – 남은 행은 같은 삭제를 다시 호출하면 이어서 지운다"""
+
+
+# SQLite 는 DELETE / UPDATE … LIMIT 이 없다 (컴파일 옵션) → id IN (SELECT … LIMIT) 로
+SQL_DELETE_TEAM_CHUNK = Statement(
+    "DELETE FROM {table} WHERE team_id=%s LIMIT %s",
+    sqlite="DELETE FROM {table} WHERE id IN (SELECT id FROM {table} WHERE team_id=%s LIMIT %s)",
+    table="member_table",
+)
+SQL_DELETE_TEAM_CARDS_CHUNK = Statement(
+    "DELETE FROM {table} WHERE board_id IN (SELECT id FROM {boards} WHERE team_id=%s) LIMIT %s",
+    sqlite="""
+    DELETE FROM {table} WHERE id IN (
+        SELECT id FROM {table} WHERE board_id IN (SELECT id FROM {boards} WHERE team_id=%s) LIMIT %s)
+    """,
+    table="card_table", boards=BOARD_TABLE,
+)
+SQL_DELETE_EMAIL_CHUNK = Statement(
+    "DELETE FROM {table} WHERE user_email=%s LIMIT %s",
+    sqlite="DELETE FROM {table} WHERE id IN (SELECT id FROM {table} WHERE user_email=%s LIMIT %s)",
+    table="member_table",
+)
+SQL_DELETE_USER = Statement("DELETE FROM {table} WHERE user_email=%s", table="user_table")
+# revision 은 chunk 마다 _bump_revisions 로 올린 값 → 중간에 sync 한 클라이언트도 다음 chunk 를 받는다
+SQL_UNASSIGN_TASK_CHUNK = Statement(
+    """
+    UPDATE {table}
+       SET user_email='',
+           revision=COALESCE((SELECT r.revision
+                                FROM {teams} tm JOIN {revision} r ON r.team_name = tm.team_name
+                               WHERE tm.id = {table}.team_id), 0)
+     WHERE user_email=%s
+     LIMIT %s
+    """,
+    sqlite="""
+    UPDATE {table}
+       SET user_email='',
+           revision=COALESCE((SELECT r.revision
+                                FROM {teams} tm JOIN {revision} r ON r.team_name = tm.team_name
+                               WHERE tm.id = {table}.team_id), 0)
+     WHERE id IN (SELECT id FROM {table} WHERE user_email=%s LIMIT %s)
+    """,
+    table="task_table", teams=TEAM_TABLE, revision=REVISION_TABLE,
+)
+SQL_TOMBSTONE_TEAM = Statement(
+    """
+    INSERT INTO {tombstone} (table_name, row_id, team_name, revision)
+    VALUES ('*', 0, %s, %s)
+    """,
+    tombstone=TOMBSTONE_TABLE,
+)
+SQL_CREATE_JOB = Statement("INSERT INTO {jobs} (kind, target) VALUES (%s, %s)", jobs=CASCADE_JOB_TABLE)
+SQL_JOB_PROGRESS = Statement(
+    "UPDATE {jobs} SET state='running', deleted=deleted + %s WHERE id=%s", jobs=CASCADE_JOB_TABLE
+)
+SQL_JOB_FINISH = Statement("UPDATE {jobs} SET state=%s, error=%s WHERE id=%s", jobs=CASCADE_JOB_TABLE)
+SQL_LOAD_JOB = Statement(
+    "SELECT id, kind, target, state, deleted, error, created_at, updated_at FROM {jobs} WHERE id=%s",
+    jobs=CASCADE_JOB_TABLE,
+)
+
+
+def _delete_in_chunks(
+    connection, cursor, sql: str, key: Any, *,
+    chunk_size: int, job_id: int | None, stop, tags: Sequence[Hashable], before=None,
+) -> int:
+    """sql (… LIMIT %s) 를 걸리는 행이 없을 때까지 반복, chunk 마다 commit"""
+    total = 0
+    while True:
+        if stop is not None and stop():
+            raise CascadeInterrupted(f"stopped after {total} rows")
+        if before is not None:
+            before()
+        n = cursor.execute(sql, (key, chunk_size))
+        if job_id is not None:
+            cursor.execute(SQL_JOB_PROGRESS.sql, (n, job_id))
+        connection.commit()
+        cache.invalidate(*tags)
+        total += n
+        if n < chunk_size:
+            return total
 
 
 def delete_team_from_db(
@@ -447,29 +1824,440 @@ def delete_team_from_db(
     connection,
     cursor,
     team_name: str,
+    chunk_size: int = CASCADE_CHUNK_SIZE,
+    job_id: int | None = None,
+    stop=None,
     member_table: str = "member_table",
     task_table: str = "task_table",
-    board_table: str = "board_table",
-):
-    cursor.execute(f"DELETE FROM {member_table} WHERE team_name=%s", (team_name,))
-    cursor.execute(f"DELETE FROM {task_table} WHERE team_name=%s", (team_name,))
-    cursor.execute(f"DELETE FROM {board_table} WHERE team_name=%s", (team_name,))
+    card_table: str = "card_table",
+) -> Dict[str, int]:
+    """
+    팀 삭제 : member → task → card → board 순서로 chunk 삭제 (member 먼저 → 팀 목록에서 바로 사라짐)
+    task_stats_table 은 chunk 삭제 전에 비워 둔다 (중간에 멈춰도 지운 할 일이 통계에 남지 않게,
+    남은 할 일은 다시 삭제하거나 reconcile 이 채운다)
+    마지막 트랜잭션에서 revision +1 과 table_name='*' tombstone 한 줄 → sync 클라이언트는 reset
+    없는 팀이면 아무것도 쓰지 않는다 (job 만 done)
+    반환 {"member": n, "task": n, "board": n(카드), "board_entity": n}
+    """
+    deleted = dict.fromkeys(("member", "task", "board", "board_entity"), 0)
+    team_id = _find_team(cursor, team_name)
+    if not team_id:
+        if job_id is not None:
+            cursor.execute(SQL_JOB_FINISH.sql, ("done", None, job_id))
+        connection.commit()
+        return deleted
+    cursor.execute(SQL_TASK_STATS_CLEAR.sql, (team_id,))
+    connection.commit()
+    cache.invalidate(("task", team_name))
+    board_tags = [("board", team_name), ("board_team", team_name)]
+    for name, sql, tags in (
+        ("member", SQL_DELETE_TEAM_CHUNK[member_table], [("member", team_name), ("member_all",)]),
+        ("task", SQL_DELETE_TEAM_CHUNK[task_table], [("task", team_name)]),
+        ("board", SQL_DELETE_TEAM_CARDS_CHUNK[card_table], board_tags),
+        ("board_entity", SQL_DELETE_TEAM_CHUNK[BOARD_TABLE], board_tags),
+    ):
+        deleted[name] = _delete_in_chunks(
+            connection, cursor, sql, team_id,
+            chunk_size=chunk_size, job_id=job_id, stop=stop, tags=tags,
+        )
+    revision = _bump_revision(cursor, team_name)
+    cursor.execute(SQL_TOMBSTONE_TEAM.sql, (team_name, revision))
+    cursor.execute(SQL_TASK_STATS_CLEAR.sql, (team_id,))      # 삭제 중에 추가됐다 지워진 할 일 몫 (남은 차이는 reconcile)
+    if job_id is not None:
+        cursor.execute(SQL_JOB_FINISH.sql, ("done", None, job_id))
+    connection.commit()
+    cache.invalidate(("task", team_name))
+    return deleted
+
+
+def delete_user_from_db(
+    *,
+    connection,
+    cursor,
+    user_email: str,
+    chunk_size: int = CASCADE_CHUNK_SIZE,
+    job_id: int | None = None,
+    stop=None,
+    user_table: str = "user_table",
+    task_table: str = "task_table",
+    member_table: str = "member_table",
+) -> Dict[str, int]:
+    """
+    db유저 삭제시
+      1) member_table  팀 탈퇴 (팀 수만큼이라 한 트랜잭션, 팀별 tombstone)
+      2) task_table    담당자 해제 (chunk 마다 해당 팀 revision +1)
+      3) user_table    삭제
+    반환 {"member": n, "task": n, "user": n}
+    """
+    _bump_revisions(cursor, member_table, "t.user_email=%s", (user_email,))
+    _tombstone(cursor, member_table, "t.user_email=%s", (user_email,))
+    deleted = {"member": _delete_in_chunks(
+        connection, cursor, SQL_DELETE_EMAIL_CHUNK[member_table], user_email,
+        chunk_size=chunk_size, job_id=job_id, stop=None,
+        tags=[("member_email", user_email), ("member_all",)],
+    )}
+    deleted["task"] = _delete_in_chunks(
+        connection, cursor, SQL_UNASSIGN_TASK_CHUNK[task_table], user_email,
+        chunk_size=chunk_size, job_id=job_id, stop=stop,
+        tags=[("task_email", user_email), ("task_email", "")],
+        before=partial(_bump_revisions, cursor, task_table, "t.user_email=%s", (user_email,)),
+    )
+    deleted["user"] = cursor.execute(SQL_DELETE_USER[user_table], (user_email,))
+    if job_id is not None:
+        cursor.execute(SQL_JOB_FINISH.sql, ("done", None, job_id))
+    connection.commit()
+    return deleted
+
+
+def create_cascade_job_to_db(*, connection, cursor, kind: str, target: str) -> int:
+    cursor.execute(SQL_CREATE_JOB.sql, (kind, target))
+    connection.commit()
+    return cursor.lastrowid
+
+
+def finish_cascade_job_to_db(*, connection, cursor, job_id: int, error: str | None = None) -> None:
+    cursor.execute(SQL_JOB_FINISH.sql, ("failed" if error else "done", error, job_id))
+    connection.commit()
+
+
+def load_cascade_job_from_db(*, cursor, job_id: int) -> Dict[str, Any] | None:
+    cursor.execute(SQL_LOAD_JOB.sql, (job_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return dict(zip(("id", "kind", "target", "state", "deleted", "error", "created_at", "updated_at"), row))
+
+
+# ────────────────────────────────
+# 11.  Idempotency (Idempotency-Key) – 재시도 요청 중복 제거
+# ────────────────────────────────
+
+# (route, idem_key) claim 행을 쓰기와 같은 트랜잭션에서 INSERT → 쓰기가 commit 되면 claim 도 함께 남는다.
+# 다른 worker 가 같은 key 로 동시에 들어오면 PK 잠금에서 기다렸다가 중복키로 실패 → 저장된 결과를 돌려준다.
+# (_ensure_team 처럼 중간에 commit 하는 함수는 claim 이 먼저 보일 수 있음 → status NULL = 처리 중)
+IDEMPOTENCY_TABLE = "idempotency_table"
+DUPLICATE_KEY = 1062
+
+SQL_EXPIRE_KEY = Statement(
+    "DELETE FROM {table} WHERE route=%s AND idem_key=%s AND expires_at <= NOW()",
+    sqlite="DELETE FROM {table} WHERE route=%s AND idem_key=%s AND expires_at <= datetime('now')",
+    table=IDEMPOTENCY_TABLE,
+)
+SQL_CLAIM_KEY = Statement(
+    """
+    INSERT INTO {table} (route, idem_key, fingerprint, expires_at)
+    VALUES (%s, %s, %s, NOW() + INTERVAL %s SECOND)
+    """,
+    sqlite="""
+    INSERT INTO {table} (route, idem_key, fingerprint, expires_at)
+    VALUES (%s, %s, %s, datetime('now', '+' || %s || ' seconds'))
+    """,
+    table=IDEMPOTENCY_TABLE,
+)
+SQL_LOAD_KEY = Statement(
+    "SELECT fingerprint, status, body FROM {table} WHERE route=%s AND idem_key=%s", table=IDEMPOTENCY_TABLE
+)
+SQL_SAVE_KEY = Statement(
+    "UPDATE {table} SET status=%s, body=%s WHERE route=%s AND idem_key=%s", table=IDEMPOTENCY_TABLE
+)
+SQL_RELEASE_KEY = Statement("DELETE FROM {table} WHERE route=%s AND idem_key=%s", table=IDEMPOTENCY_TABLE)
+SQL_PRUNE_KEYS = Statement(
+    "DELETE FROM {table} WHERE expires_at <= NOW() LIMIT %s",
+    sqlite="""
+    DELETE FROM {table} WHERE (route, idem_key) IN (
+        SELECT route, idem_key FROM {table} WHERE expires_at <= datetime('now') LIMIT %s)
+    """,
+    table=IDEMPOTENCY_TABLE,
+)
+
+
+def run_idempotent_to_db(
+    *,
+    connection,
+    cursor,
+    route: str,
+    idem_key: str,
+    fingerprint: str,
+    ttl: int,
+    func,
+    kwargs: Dict[str, Any],
+    table_name: str = IDEMPOTENCY_TABLE,
+) -> Tuple[bool, str, int | None, str | None]:
+    """
+    같은 (route, idem_key) 의 func 를 한 번만 실행.
+    반환 (replayed, fingerprint, status, body)
+      replayed=False : 이번에 func 실행, body = 결과 JSON (status 200)
+      replayed=True  : 저장된 결과 – status None 이면 다른 요청이 아직 처리 중
+    fingerprint 비교 (같은 key 로 다른 요청) 는 호출하는 쪽에서.
+    """
+    key = (route, idem_key)
+    cursor.execute(SQL_EXPIRE_KEY[table_name], key)
+    try:
+        cursor.execute(SQL_CLAIM_KEY[table_name], (*key, fingerprint, ttl))
+    except pymysql.err.IntegrityError as exc:
+        if exc.args[0] != DUPLICATE_KEY:
+            raise
+        connection.rollback()                       # 새 트랜잭션 → 먼저 commit 된 claim 이 보인다
+        cursor.execute(SQL_LOAD_KEY[table_name], key)
+        row = cursor.fetchone()
+        connection.commit()
+        if row is None:                             # 그 사이 만료 / 실패로 지워짐 → 처리 중으로 보고 재시도 유도
+            return True, fingerprint, None, None
+        return (True, *row)
+
+    try:
+        result = func(connection=connection, cursor=cursor, **kwargs)   # func 의 commit 에 claim 포함
+    except BaseException:
+        connection.rollback()
+        cursor.execute(SQL_RELEASE_KEY[table_name], key)  # 중간 commit 으로 남은 claim 정리 → 재시도 가능
+        connection.commit()
+        raise
+    body = json.dumps(result, default=str, ensure_ascii=False)
+    cursor.execute(SQL_SAVE_KEY[table_name], (200, body, *key))
+    connection.commit()
+    return False, fingerprint, 200, body
+
+
+def prune_idempotency_from_db(
+    *, connection, cursor, limit: int = 1000, table_name: str = IDEMPOTENCY_TABLE
+) -> int:
+    """만료된 key 정리 (limit 행씩)"""
+    removed = cursor.execute(SQL_PRUNE_KEYS[table_name], (limit,))
     connection.commit()
+    return removed
+
+
+# ────────────────────────────────
+# 12.  Write-behind flush (task_color / board_color)
+# ────────────────────────────────
+
+# writebehind.WriteBehindQueue 가 모아 둔 색 변경을 한 트랜잭션으로 적용.
+# 결과는 항목마다 update_task_to_db(task_color=…) / update_board_to_db 를 부른 것과 같지만
+# 팀 revision 은 트랜잭션당 한 번만 올라가고 commit 도 한 번.
+
+
+def flush_colors_to_db(
+    *,
+    connection,
+    cursor,
+    task_colors: Sequence[Tuple[str, str, Any]] = (),     # (team_name, task_name, task_color)
+    board_colors: Sequence[Tuple[str, str, Any]] = (),    # (team_name, board_name, board_color)
+    task_table: str = "task_table",
+    card_table: str = "card_table",
+) -> int:
+    """반환 = UPDATE rowcount 합계 (참고용 – 그 사이 삭제된 task / board 는 0)"""
+    teams = {team for team, _, _ in task_colors} | {team for team, _, _ in board_colors}
+    if not teams:
+        return 0
+    ids = {team: _find_team(cursor, team) for team in teams}
+    tags: List[Hashable] = [("task", team) for team in {team for team, _, _ in task_colors}]
+    for team, board, _ in board_colors:
+        tags += [("board", team, board), ("board_team", team)]
+
+    def build(revs: Dict[str, int]) -> List[Step]:
+        steps: List[Step] = []
+        for team, task_name, color in task_colors:
+            _append_step(steps, "one", SQL_UPDATE_TASK[task_table, "task_color=%s"],
+                         (color, revs[team], ids[team], task_name))
+        for team, board_name, color in board_colors:
+            _append_step(steps, "one", SQL_UPDATE_BOARD_COLOR[card_table],
+                         (color, revs[team], revs[team], ids[team], board_name))
+        return steps
+
+    affected = _run_batch(connection, cursor, teams, build)
+    cache.invalidate(*tags)
+    return sum(affected)
+
+
+# ────────────────────────────────
+# 13.  Team export / import (/export_team, /import_team archive)
+# ────────────────────────────────
+
+# archive = NDJSON 한 줄에 한 행 (id / revision / team_id 없이 이름으로 – 다른 환경 / 다른 팀 이름으로 복원 가능)
+#   {"kind": "team", "format": "planit-team", "version": 1, "team_name": …, "revision": …}
+#   {"kind": "member" | "board" | "card" | "task", EXPORT_FIELDS[kind] …}
+#   {"kind": "end", "count": {kind: 행 수}}   – 없으면 잘린 archive
+# export : SSCursor 로 kind 마다 batch_size 행씩, 한 read 트랜잭션 (같은 시점의 팀)
+# import : 같은 kind 의 행 batch 하나 = 트랜잭션 하나 (multi-row INSERT, revision +1)
+#          → 행 수와 상관없이 잠금 / undo 는 batch 하나 분량. 줄 단위 검증은 archive.py
+EXPORT_FORMAT = "planit-team"
+EXPORT_VERSION = 1
+EXPORT_FIELDS = {
+    "member": ("user_email", "user_owner"),
+    "board": ("board_name", "board_color"),
+    "card": ("board_name", "card_name", "card_content"),
+    "task": ("task_name", "task_start", "task_end", "task_state", "task_color", "task_target", "user_email"),
+}
+
+
+class TeamNotEmpty(RuntimeError):
+    """import 대상 팀에 이미 행이 있음 (replace=True 면 먼저 지우고 import)"""
+
+
+# MySQL : 첫 SELECT 전에 스냅샷 고정 (kind 사이에 들어온 쓰기는 보이지 않음),  SQLite : read 트랜잭션 (WAL)
+SQL_EXPORT_BEGIN = Statement("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY", sqlite="BEGIN")
+SQL_EXPORT_MEMBERS = Statement(
+    "SELECT user_email, user_owner FROM {table} WHERE team_id=%s ORDER BY id", table="member_table"
+)
+SQL_EXPORT_BOARDS = Statement(
+    "SELECT board_name, board_color FROM {boards} WHERE team_id=%s ORDER BY id", boards=BOARD_TABLE
+)
+SQL_EXPORT_CARDS = Statement(
+    """
+    SELECT b.board_name, t.card_name, t.card_content
+      FROM {boards} b JOIN {table} t ON t.board_id = b.id
+     WHERE b.team_id=%s
+     ORDER BY t.id
+    """,
+    table="card_table", boards=BOARD_TABLE,
+)
+SQL_EXPORT_TASKS = Statement(
+    """
+    SELECT task_name, task_start, task_end, task_state, task_color, task_target, user_email
+      FROM {table} WHERE team_id=%s ORDER BY id
+    """,
+    table="task_table",
+)
+SQL_TEAM_HAS_ROWS = Statement("SELECT 1 FROM {table} WHERE team_id=%s LIMIT 1", table="task_table")
+
+
+def export_team_from_db(
+    *,
+    cursor,
+    team_name: str,
+    batch_size: int = 500,
+    task_table: str = "task_table",
+    card_table: str = "card_table",
+    member_table: str = "member_table",
+) -> Iterator[List[Dict[str, Any]]]:
+    """archive 줄 (dict) 을 batch 단위로 – AsyncDB.stream 으로 호출 (SSCursor, 캐시 미사용)"""
+    cursor.execute(SQL_EXPORT_BEGIN.sql)
+    team_id = _find_team(cursor, team_name)
+    cursor.execute(SQL_TEAM_REVISION.sql, (team_name,))
+    rows = cursor.fetchall()
+    yield [{"kind": "team", "format": EXPORT_FORMAT, "version": EXPORT_VERSION,
+            "team_name": team_name, "revision": rows[0][0] if rows else 0}]
+
+    count: Dict[str, int] = {}
+    for kind, sql in (
+        ("member", SQL_EXPORT_MEMBERS[member_table]),
+        ("board", SQL_EXPORT_BOARDS.sql),
+        ("card", SQL_EXPORT_CARDS[card_table]),
+        ("task", SQL_EXPORT_TASKS[task_table]),
+    ):
+        fields = EXPORT_FIELDS[kind]
+        count[kind] = 0
+        for rows in _stream(cursor, sql, (team_id,), batch_size):
+            count[kind] += len(rows)
+            yield [{"kind": kind, **dict(zip(fields, row))} for row in rows]
+    yield [{"kind": "end", "count": count}]
+
+
+def begin_team_import_to_db(
+    *,
+    connection,
+    cursor,
+    team_name: str,
+    replace: bool = False,
+    task_table: str = "task_table",
+    card_table: str = "card_table",
+    member_table: str = "member_table",
+) -> Dict[str, int] | None:
+    """
+    import 전에 한 번. 팀에 행이 있으면 TeamNotEmpty,
+    replace=True 면 delete_team_from_db 로 먼저 비운다 (반환 = 지운 행 수, sync 클라이언트는 reset).
+    """
+    if replace:
+        return delete_team_from_db(
+            connection=connection, cursor=cursor, team_name=team_name,
+            task_table=task_table, card_table=card_table, member_table=member_table,
+        )
+    team_id = _find_team(cursor, team_name)
+    if team_id:
+        for table_name in (member_table, BOARD_TABLE, task_table):
+            cursor.execute(SQL_TEAM_HAS_ROWS[table_name], (team_id,))
+            if cursor.fetchall():
+                raise TeamNotEmpty(f"team {team_name!r} already has {table_name} rows")
+    return None
+
+
+def import_team_rows_to_db(
+    *,
+    connection,
+    cursor,
+    team_name: str,
+    kind: str,
+    rows: Sequence[Dict[str, Any]],     # EXPORT_FIELDS[kind] 키 (archive.py 에서 검증)
+    task_table: str = "task_table",
+    card_table: str = "card_table",
+    member_table: str = "member_table",
+) -> int:
+    """같은 kind 의 행 batch 하나를 한 트랜잭션으로 (카드의 board 는 없으면 색 0 으로 생성)"""
+    team_id = _ensure_team(connection, cursor, team_name)
+    tags: List[Hashable] = []
+    try:
+        revision = _bump_revision(cursor, team_name)
+        if kind == "member":
+            cursor.executemany(SQL_ADD_MEMBER[member_table], [
+                (team_id, row["user_email"], _owner_to_int(row.get("user_owner")), revision) for row in rows
+            ])
+            tags += [("member", team_name), ("member_all",)]
+            tags += [("member_email", row["user_email"]) for row in rows]
+        elif kind in ("board", "card"):
+            boards: Dict[str, int] = {}
+            for row in rows:
+                if row["board_name"] not in boards:
+                    boards[row["board_name"]] = _ensure_board(
+                        cursor, team_id, row["board_name"], row.get("board_color") or 0, revision,
+                    )
+            if kind == "card":
+                cursor.executemany(SQL_ADD_CARD[card_table], [
+                    (boards[row["board_name"]], row["card_name"], row["card_content"], revision) for row in rows
+                ])
+            tags += [("board", team_name), ("board_team", team_name)]
+            tags += [("board", team_name, board_name) for board_name in boards]
+        elif kind == "task":
+            values = [
+                (team_id, row["task_name"], row["task_start"], row["task_end"],
+                 row.get("task_state") or "TODO", row.get("task_color") or 0,
+                 row["task_target"], row["user_email"], revision)
+                for row in rows
+            ]
+            cursor.executemany(SQL_ADD_TASK[task_table], values)
+            counts: Dict[Tuple[Any, ...], int] = {}
+            for value in values:
+                stat = (value[0], value[4], value[3])     # (team_id, task_state, task_end)
+                counts[stat] = counts.get(stat, 0) + 1
+            _add_task_stats(cursor, counts)
+            tags.append(("task", team_name))
+            tags += {("task_owner", value[6], value[7]) for value in values}
+        else:
+            raise ValueError(f"unknown archive kind: {kind!r}")
+        connection.commit()
+    except BaseException:
+        connection.rollback()
+        raise
+    cache.invalidate(*tags)
+    return len(rows)
 
 
 # ────────────────────────────────
-# 6.  public export list
+# 14.  public export list
 # ────────────────────────────────
 
 __all__ = [
     # connection
-    "init_db","close_db",
+    "init_backend","init_db","close_db","init_pool","close_pool","ping_db",
+    # cache
+    "cache","init_cache",
     # setting
     "load_setting_from_db",
     # user
     "add_user_to_db","load_user_from_db","delete_user_from_db",
     # task
-    "add_task_to_db","load_task_from_db","delete_task_from_db",
+    "add_task_to_db","load_task_from_db","load_user_task_from_db","delete_task_from_db",
+    # task stats
+    "load_task_stats_from_db","reconcile_task_stats_to_db",
     # board
     "add_board_to_db","load_board_from_db","delete_board_from_db","delete_card_from_db",
     # member
@@ -477,4 +2265,23 @@ __all__ = [
     "delete_member_from_db","delete_team_from_db",
     #update_task_to_db(...), update_board_to_db(...) 추가
     "update_task_to_db","update_board_to_db",
+    # snapshot
+    "load_team_snapshot_from_db",
+    # batch
+    "batch_tasks_to_db","batch_cards_to_db",
+    # delta sync
+    "sync_team_from_db","prune_tombstones_from_db",
+    # streaming
+    "stream_member_from_db","stream_task_from_db",
+    # cascade
+    "CascadeInterrupted","create_cascade_job_to_db","finish_cascade_job_to_db","load_cascade_job_from_db",
+    # idempotency
+    "run_idempotent_to_db","prune_idempotency_from_db",
+    # write-behind
+    "flush_colors_to_db",
+    # team archive
+    "EXPORT_FORMAT","EXPORT_VERSION","EXPORT_FIELDS","TeamNotEmpty",
+    "export_team_from_db","begin_team_import_to_db","import_team_rows_to_db",
+    # 조회 결과 열 순서
+    "TASK_COLUMNS","CARD_COLUMNS","MEMBER_COLUMNS",
 ]
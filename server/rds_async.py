@@ -0,0 +1,101 @@
+"""
+rds_async.py – Async wrapper for rds.py (FastAPI)
+
+rds.py 의 동기 함수를 전용 thread pool 에서 실행해서 event loop 를 막지 않는다.
+worker thread 가 커넥션 풀에서 커넥션을 빌리고, 함수 시그니처에 맞춰
+connection / cursor 를 채워 넣는다.
+
+    db   = AsyncDB(pool)
+    TASK = await db.call(load_task_from_db, team_name="...", ...)
+
+스크립트에서는 기존처럼 rds.* 를 직접 호출하면 된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterator
+
+from pymysql.cursors import SSCursor
+
+from metrics import DB_CALL_SECONDS, query_label
+from pool import ConnectionPool, PoolTimeout
+
+
+@lru_cache(maxsize=None)
+def _wants_connection(func: Callable[..., Any]) -> bool:
+    return "connection" in inspect.signature(func).parameters
+
+
+class AsyncDB:
+    def __init__(self, pool: ConnectionPool, *, max_workers: int | None = None, max_streams: int | None = None):
+        self.pool = pool
+        # 풀 크기만큼만 thread 를 두면 thread 가 커넥션을 기다리며 놀지 않는다
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or pool.max_size,
+            thread_name_prefix="rds",
+        )
+        # stream 은 이 executor 밖 (Starlette thread pool) 에서 응답이 끝날 때까지 커넥션을 잡는다
+        # → 동시 stream 수를 묶어 두지 않으면 stream 이 풀을 다 가져가 call 이 PoolTimeout 난다 (기본 풀의 절반)
+        self.max_streams = max_streams or max(1, pool.max_size // 2)
+        self._streams = threading.BoundedSemaphore(self.max_streams)
+
+    async def call(self, func: Callable[..., Any], /, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(self._run, func, kwargs))
+
+    def _run(self, func: Callable[..., Any], kwargs: Dict[str, Any]) -> Any:
+        token = query_label.set(func.__name__)
+        started = time.perf_counter()
+        try:
+            with self.pool.acquire() as (connection, cursor):
+                if _wants_connection(func):
+                    kwargs["connection"] = connection
+                return func(cursor=cursor, **kwargs)
+        finally:
+            DB_CALL_SECONDS.observe(func.__name__, value=time.perf_counter() - started)
+            query_label.reset(token)
+
+    def stream(self, func: Callable[..., Any], /, **kwargs: Any) -> Iterator[Any]:
+        """
+        stream_*_from_db 용 동기 generator – SSCursor 커넥션을 끝까지 점유하며 batch 를 넘긴다.
+        StreamingResponse 가 thread pool 에서 한 batch 씩 꺼내므로 event loop 는 막히지 않고,
+        클라이언트가 끊기면 generator 가 닫히면서 커넥션이 풀로 돌아간다.
+
+        next() 는 매번 다른 thread / context 에서 불리므로 query_label 은 batch 를 꺼낼 때마다
+        설정 / 복원한다 (generator 전체를 감싸면 다른 context 에서 reset 하게 된다).
+        DB_CALL_SECONDS 는 _run 처럼 풀 대기부터 커넥션 반환까지 – 클라이언트가 받는 속도도 포함.
+        동시 stream 이 max_streams 개면 풀 timeout 만큼 자리를 기다린 뒤 PoolTimeout.
+        """
+        started = time.perf_counter()
+        if not self._streams.acquire(timeout=self.pool.timeout):
+            raise PoolTimeout(f"no stream slot within {self.pool.timeout}s (max_streams={self.max_streams})")
+        try:
+            with self.pool.acquire(SSCursor) as (connection, cursor):
+                batches = func(cursor=cursor, **kwargs)
+                try:
+                    while True:
+                        token = query_label.set(func.__name__)
+                        try:
+                            batch = next(batches, None)
+                        finally:
+                            query_label.reset(token)
+                        if batch is None:
+                            return
+                        yield batch
+                finally:
+                    batches.close()
+        finally:
+            self._streams.release()
+            DB_CALL_SECONDS.observe(func.__name__, value=time.perf_counter() - started)
+
+    def close(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+__all__ = ["AsyncDB"]
@@ -1,21 +1,75 @@
 # %%
 # .py3127_env\Scripts\activate
 # pip install uvicorn fastapi
+from os             import getenv
+from logging        import getLogger
+from hmac           import compare_digest
 from uvicorn        import run
-from fastapi        import FastAPI
-from typing         import Optional
+from asyncio        import CancelledError, create_task, get_running_loop, sleep, wait, wait_for
+from signal         import SIGTERM, getsignal, signal
+from threading      import current_thread, main_thread
+from dotenv         import load_dotenv
+from time           import perf_counter
+from math           import ceil
+from fastapi        import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing         import List, Optional
+from urllib.parse   import quote
 from pydantic       import BaseModel
-from rds            import (init_db,                    load_user_from_db,          load_task_from_db,          load_board_from_db,         load_member_from_db,
-                            close_db,                   add_user_to_db,             add_task_to_db,             add_board_to_db,            add_member_to_db,
+from rds            import (init_pool,                  load_user_from_db,          load_task_from_db,          load_board_from_db,         load_member_from_db,
+                            close_pool,                 add_user_to_db,             add_task_to_db,             add_board_to_db,            add_member_to_db,
                             load_setting_from_db,       delete_user_from_db,        delete_task_from_db,        delete_board_from_db,       delete_team_from_db,
-                                                                                    update_task_to_db,          delete_card_from_db,        delete_member_from_db,
-                                                                                                                update_board_to_db,         update_member_to_db)
+                            init_cache,                 ping_db,                    update_task_to_db,          delete_card_from_db,        delete_member_from_db,
+                            cache,                      load_team_snapshot_from_db, batch_tasks_to_db,          update_board_to_db,         update_member_to_db,
+                                                                                    batch_cards_to_db,          sync_team_from_db,
+                                                                                    stream_task_from_db,        stream_member_from_db,
+                                                                                    load_task_stats_from_db,    reconcile_task_stats_to_db,
+                                                                                    load_user_task_from_db,
+                                                                                    export_team_from_db,        TeamNotEmpty,
+                            create_cascade_job_to_db,   finish_cascade_job_to_db,   load_cascade_job_from_db,
+                            TASK_COLUMNS,               CARD_COLUMNS,               MEMBER_COLUMNS)
+from rds_async      import AsyncDB
+from events         import EventHub, load_broker
+from metrics        import REGISTRY, HTTP_REQUEST_SECONDS, COMPONENT_STATS, TASK_STATS_RECONCILED
+from streaming      import json_array, ndjson, wants_ndjson, NDJSON, gzip_chunks, ndjson_records
+from settings       import SettingsCache
+from idempotency    import IdempotencyStore, IdempotencyConflict, IdempotencyMismatch, MAX_KEY_LENGTH
+from ratelimit      import RateLimiter, RateLimited, json_fields, load_store, parse_budgets
+from payload        import PayloadEncoder, field_names
+from writebehind    import WriteBehindQueue, TASK, BOARD
+from archive        import ArchiveError, import_archive
 
 # - - - 임시 선언하기 - - - #
-KAKAO                       = None
-GOOGLE                      = None
-connection                  = None
-cursor                      = None
+log                         = getLogger("planit.server")
+pool                        = None
+db                          = None
+hub                         = EventHub()                    # startup 에서 EVENT_BROKER 로 broker 선택
+settings                    = SettingsCache(lambda: db.call(load_setting_from_db,
+                                                            table_name = "setting_table"))
+idempotency                 = IdempotencyStore(lambda function, /, **kwargs: db.call(function, **kwargs))
+writes                      = WriteBehindQueue(lambda function, /, **kwargs: db.call(function, **kwargs))
+TASK_PAGE_MAX               = 500                           # /load_task, /load_user_task limit 상한
+STREAM_BATCH_SIZE           = 500                           # /stream_* 한 번에 fetch 하는 행 수
+                                                            # 동시 stream (/stream_*, /export_team) 은 STREAM_CONCURRENCY 개까지
+                                                            # (.env, 기본 POOL_MAX_SIZE // 2) – 나머지 커넥션은 db.call 몫
+READY                       = False                         # startup 완료 → /readyz 통과, SIGTERM → 다시 False
+DRAINING                    = False                         # shutdown 시작 → 새 요청 503
+INFLIGHT                    = 0                             # 처리 중인 HTTP 요청 수 (body 를 다 보낼 때까지)
+HEALTH_PATHS                = ("/healthz", "/readyz")
+RATE_LIMIT_EXEMPT           = HEALTH_PATHS + ("/metrics",)
+RAW_BODY_PATHS              = ("/import_team",)             # body 가 JSON 이 아닌 업로드 스트림 (미리 읽지 않음)
+RATE_LIMIT_ROUTES           = ("/load_task=5:20,/load_board=5:20,/load_member=5:20,/sync=5:20,"   # route=초당:burst
+                               "/load_team_snapshot=2:10,/stream_task=1:5,/stream_member=1:5,*=20:40")
+limiter                     = RateLimiter(enabled=False)    # startup 에서 .env 로 설정
+encoder                     = PayloadEncoder()
+TASK_FIELDS                 = field_names(TASK_COLUMNS)     # columnar / msgpack 응답의 columns
+CARD_FIELDS                 = field_names(CARD_COLUMNS)
+MEMBER_FIELDS               = field_names(MEMBER_COLUMNS)
+CASCADES                    = set()                         # background 로 실행 중인 팀 / 사용자 삭제
+CASCADE_STOP                = False                         # shutdown 대기 시간 초과 → chunk 사이에서 중단
+STATS_DUE_DAYS_MAX          = 366                           # /task_stats due_days 상한
+STATS_RECONCILER            = None                          # task_stats_table 주기 보정 작업
+IMPORT_BATCH_SIZE           = 1000                          # /import_team 트랜잭션 하나에 넣는 행 수
 app                         = FastAPI()
 
 # - - - UserManagementRequest 선언하기 - - - #
@@ -23,6 +77,7 @@ class UserManagementRequest(BaseModel):
     user_email:         Optional[str] = None
     user_nickname:      Optional[str] = None
     user_image:         Optional[str] = None
+    background:         bool          = False       # /delete_user : True 면 202 + job_id (/cascade_job 으로 확인)
 
 # - - - TaskManagementRequest 선언하기 - - - #
 class TaskManagementRequest(BaseModel):
@@ -34,6 +89,12 @@ class TaskManagementRequest(BaseModel):
     task_color:         Optional[str] = None
     task_target:        Optional[str] = None        # 개인, 할 일 소유 조건 1 (1/2)
     user_email:         Optional[str] = None        # 개인, 할 일 소유 조건 2 (2/2)
+    hide_done:          bool          = True        # False = 보관함 (DONE 포함)
+    window_start:       Optional[str] = None        # 기간 필터 (캘린더 화면)
+    window_end:         Optional[str] = None
+    after_end:          Optional[str] = None        # 페이지 cursor = 응답의 next
+    after_id:           Optional[int] = None
+    limit:              Optional[int] = None        # 생략 시 전체 (기존 동작)
 
 # - - - BoardManagementRequest 선언하기 - - - #
 class BoardManagementRequest(BaseModel):
@@ -43,210 +104,792 @@ class BoardManagementRequest(BaseModel):
     card_name:          Optional[str] = None
     card_content:       Optional[str] = None
 
+# - - - BatchRequest 선언하기 - - - # op = "create" | "update" | "delete"
+class TaskOperation(TaskManagementRequest):
+    op:                 str
+
+class CardOperation(BoardManagementRequest):
+    op:                 str
+    new_board_name:     Optional[str] = None        # update 시 다른 board 로 이동
+
+class TaskBatchRequest(BaseModel):
+    operations:         List[TaskOperation]
+
+class CardBatchRequest(BaseModel):
+    operations:         List[CardOperation]
+
+# - - - SyncRequest 선언하기 - - - #
+class SyncRequest(BaseModel):
+    team_name:          str
+    since:              int = 0                     # 마지막으로 받은 revision (0 = 전체)
+    user_email:         Optional[str] = None        # team_name == '' (개인 할 일) 일 때
+
+# - - - UserTaskRequest 선언하기 - - - # 사용자가 속한 모든 팀 + 개인 할 일
+class UserTaskRequest(BaseModel):
+    user_email:         str
+    assigned_only:      bool          = False       # True = 팀 할 일 중 user_email 담당만
+    hide_done:          bool          = True
+    window_start:       Optional[str] = None        # YYYY-MM-DD, 이 날 이후에 끝나는 할 일
+    window_end:         Optional[str] = None        # YYYY-MM-DD, 이 날 이전에 시작하는 할 일
+    after_end:          Optional[str] = None        # 직전 응답의 next.after_end
+    after_id:           Optional[int] = None        # 직전 응답의 next.after_id
+    limit:              int           = 100
+
+# - - - TaskStatsRequest 선언하기 - - - #
+class TaskStatsRequest(BaseModel):
+    team_name:          str
+    today:              Optional[str] = None        # YYYY-MM-DD (클라이언트 날짜, 생략 시 서버 날짜)
+    due_days:           int           = 7           # due_soon = 오늘부터 며칠 안에 끝나는 할 일
+
+# - - - TeamExportRequest 선언하기 - - - #
+class TeamExportRequest(BaseModel):
+    team_name:          str
+    gzip:               bool          = False       # True = .ndjson.gz 파일로
+
 # - - - MemberManagementRequest 선언하기 - - - #
 class MemberManagementRequest(BaseModel):
     team_name:      Optional[str] = None
     user_email:     Optional[str] = None
     user_owner:     Optional[str] = None
+    background:     bool          = False           # /delete_team : True 면 202 + job_id (/cascade_job 으로 확인)
 
 # - - - startup 구축하기 - - - #
 @app.on_event("startup")
 async def startup_event():
-    global KAKAO, GOOGLE, connection, cursor
+    global pool, db, READY, DRAINING, CASCADE_STOP, STATS_RECONCILER
+    DRAINING     = False                            # 같은 프로세스에서 다시 시작할 때 (테스트 / benchmark)
+    CASCADE_STOP = False
+    
+    pool = init_pool()
+    db   = AsyncDB(pool, max_streams=int(getenv("STREAM_CONCURRENCY", 0)) or None)   # 0 = 풀의 절반
+    init_cache()
+    hub.broker = load_broker(getenv("EVENT_BROKER", "local"))   # WORKERS>1 = events:UnixSocketBroker 등 공유 broker
+    await hub.start()
+    
+    settings.interval = float(getenv("SETTING_REFRESH_SECONDS", 60))
+    await settings.start()
+    
+    idempotency.configure(ttl            = float(getenv("IDEMPOTENCY_TTL", 86400)),
+                          max_entries    = int(getenv("IDEMPOTENCY_MAX_ENTRIES", 10000)),
+                          shared         = getenv("IDEMPOTENCY_SHARED", "1") == "1",       # 0 = 메모리만 (WORKERS=1 전용)
+                          prune_interval = float(getenv("IDEMPOTENCY_PRUNE_SECONDS", 600)))
+    await idempotency.start()
+    
+    limiter.store            = load_store(getenv("RATE_LIMIT_STORE", "memory"))   # "module:Class" = 공유 저장소
+    limiter.budgets          = parse_budgets(getenv("RATE_LIMIT_ROUTES", RATE_LIMIT_ROUTES))
+    limiter.team_concurrency = int(getenv("TEAM_CONCURRENCY", 4))                 # 0 = 제한 없음
+    limiter.trust_proxy      = getenv("RATE_LIMIT_TRUST_PROXY", "0") == "1"       # X-Forwarded-For 사용 (ALB 뒤)
+    limiter.enabled          = getenv("RATE_LIMIT", "1") == "1"
+    
+    encoder.min_bytes        = int(getenv("COMPRESS_MIN_BYTES", 1024))            # 이보다 작으면 압축 안 함
+    encoder.gzip_level       = int(getenv("GZIP_LEVEL", 6))
+    encoder.brotli_quality   = int(getenv("BROTLI_QUALITY", 4))
+    
+    writes.configure(enabled     = getenv("WRITE_BEHIND", "0") == "1",                 # 색 변경만 모아서 나중에 commit
+                     interval    = float(getenv("WRITE_BEHIND_INTERVAL", 0.2)),
+                     max_pending = int(getenv("WRITE_BEHIND_MAX_PENDING", 10000)),
+                     batch_size  = int(getenv("WRITE_BEHIND_BATCH_SIZE", 500)))
+    await writes.start()
+    
+    INTERVAL = float(getenv("TASK_STATS_RECONCILE_SECONDS", 3600))                # 0 = 끔 (다른 worker / cron 이 담당)
+    if INTERVAL > 0:
+        STATS_RECONCILER = create_task(reconcile_task_stats(INTERVAL))
+    
+    FORWARD = getsignal(SIGTERM)                    # uvicorn 으로 실행하면 Server.handle_exit
+    if current_thread() is main_thread() and callable(FORWARD):
+        signal(SIGTERM, drain_on_sigterm(get_running_loop(), FORWARD, float(getenv("DRAIN_DELAY", 5))))
+    
+    READY = True
+
+# - - - SIGTERM 구축하기 - - - # uvicorn 은 SIGTERM 을 받으면 바로 listener 를 닫는다 → 그 전에 DRAIN_DELAY 초 동안
+#                               /readyz 만 503 으로 두고 (요청은 계속 처리) LB 가 이 worker 를 먼저 빼게 한 뒤 넘긴다
+def drain_on_sigterm(loop, forward, delay):
+    def on_sigterm(signum, frame):
+        global READY
+        if not READY or delay <= 0:                 # 두 번째 SIGTERM / 지연 없음 → 바로 uvicorn 종료 절차
+            forward(signum, frame)
+            return
+        READY = False
+        log.info("SIGTERM: readiness off, stopping in %.1fs", delay)
+        loop.call_soon_threadsafe(loop.call_later, delay, forward, signum, frame)
+    
+    return on_sigterm
+
+# - - - 응답 끝 구축하기 - - - # call_next 는 body 를 보내기 전에 돌아온다 (StreamingResponse 는 body 가 곧 DB 작업)
+#                               → done() 은 body 를 다 보냈거나 실패 / 끊긴 뒤에 한 번
+async def call_until_sent(request: Request, call_next, done):
+    try:
+        RESPONSE = await call_next(request)
+    except BaseException:
+        await done()
+        raise
+    BODY = RESPONSE.body_iterator
+    
+    async def body():
+        try:
+            async for CHUNK in BODY:
+                yield CHUNK
+        finally:
+            await done()
+    
+    RESPONSE.body_iterator = body()
+    return RESPONSE
+
+# - - - draining 구축하기 - - - # shutdown 중에는 새 요청을 받지 않고, 처리 중인 요청 (stream 은 body 끝까지) 수를 센다
+@app.middleware("http")
+async def drain_requests(request: Request, call_next):
+    global INFLIGHT
+    if DRAINING and request.url.path not in HEALTH_PATHS:
+        return Response(status_code=503, headers={"Connection": "close", "Retry-After": "1"})
+    
+    async def finished():
+        global INFLIGHT
+        INFLIGHT -= 1
+    
+    INFLIGHT += 1
+    return await call_until_sent(request, call_next, finished)
+
+# - - - rate limit 구축하기 - - - # rds 호출 전에 사용자(IP)별 token bucket + 팀별 동시 처리 수 상한 → 429 + Retry-After
+@app.middleware("http")
+async def rate_limit(request: Request, call_next):
+    if not limiter.enabled or request.url.path in RATE_LIMIT_EXEMPT:
+        return await call_next(request)
+    
+    if request.url.path in RAW_BODY_PATHS:          # 업로드는 스트림 그대로 핸들러로 (팀은 query string)
+        FIELDS = dict(request.query_params)
+    else:
+        FIELDS = json_fields(await request.body()) if request.method == "POST" else {}   # body 는 캐시되어 핸들러에서 다시 읽힘
+    CLIENT = limiter.client(request.headers, request.client and request.client.host, FIELDS)
+    try:
+        TEAM = await limiter.check(request.url.path, CLIENT, FIELDS.get("team_name"))
+    except RateLimited as exc:
+        return JSONResponse(status_code = 429,
+                            content     = {"detail": "too many requests", "reason": exc.reason},
+                            headers     = {"Retry-After": str(max(1, ceil(exc.retry_after)))})
+    
+    async def finished():                           # stream 응답은 body 를 다 보낸 뒤에 팀 슬롯 반환
+        await limiter.release(TEAM)
+    
+    return await call_until_sent(request, call_next, finished)
+
+# - - - /healthz 구축하기 - - - # liveness : 프로세스(event loop)가 응답하는지만 확인
+@app.get("/healthz")
+async def healthz():
+    return {"status": "ok"}
+
+# - - - /readyz 구축하기 - - - # readiness : startup 완료 + draining 아님 + DB 왕복 (SELECT 1)
+@app.get("/readyz")
+async def readyz():
+    if not READY or DRAINING:
+        return Response(status_code=503, content=b'{"status":"unavailable"}', media_type="application/json")
+    try:
+        await wait_for(db.call(ping_db), timeout=float(getenv("READY_TIMEOUT", 2)))
+    except Exception:
+        return Response(status_code=503, content=b'{"status":"db_unreachable"}', media_type="application/json")
+    
+    return {"status": "ready"}
+
+# - - - metrics 구축하기 - - - # route 별 지연 + /metrics (Prometheus text)
+@app.middleware("http")
+async def observe_latency(request: Request, call_next):
+    started = perf_counter()
+    status  = 500
+    try:
+        response = await call_next(request)
+        status   = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(request.method,
+                                     getattr(route, "path", "unmatched"),       # 매칭 실패 경로는 한 라벨로 (cardinality 제한)
+                                     str(status),
+                                     value = perf_counter() - started)
+
+def collect_component_stats():
+    for component, stats in (("cache",       cache.stats()),
+                             ("events",      hub.stats()),
+                             ("idempotency", idempotency.stats()),
+                             ("writebehind", writes.stats()),
+                             ("ratelimit",   limiter.stats())):
+        for stat, value in stats.items():
+            COMPONENT_STATS.set(component, stat, value=float(value))
+    if pool is not None:
+        COMPONENT_STATS.set("pool", "size", value=pool.size)
+        COMPONENT_STATS.set("pool", "idle", value=pool.idle)
+
+REGISTRY.add_collector(collect_component_stats)
+
+@app.get("/metrics")
+async def metrics():
+    return Response(content=REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+# - - - notify 구축하기 - - - # 쓰기 후 팀 구독자에게 변경 알림 (클라이언트는 /sync 로 받아감)
+async def notify(team_name, table, op, **key):
+    await hub.publish(team_name, {"type": "change", "table": table, "op": op, **key})
+
+# - - - /ws/{team_name} 구축하기 - - - #
+@app.websocket("/ws/{team_name}")
+async def subscribe(websocket: WebSocket, team_name: str):
+    await websocket.accept()
+    sub     = hub.subscribe(team_name)
     
-    connection, cursor = init_db()
+    async def sender():
+        while True:
+            await websocket.send_json(await sub.get())
     
-    KAKAO, GOOGLE = load_setting_from_db(cursor         = cursor,
-                                         table_name     = "setting_table")
+    SENDER  = create_task(sender())
+    try:
+        while True:                                 # 클라이언트 메시지는 무시, 연결 종료 감지용
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        SENDER.cancel()
+        hub.unsubscribe(sub)
+        try:
+            await SENDER
+        except (CancelledError, Exception):
+            pass
 
-# - - - /load_setting 구축하기 - - - #
+# - - - /event_stats 구축하기 - - - #
+@app.get("/event_stats")
+async def event_stats():
+    return hub.stats()
+
+# - - - /load_setting 구축하기 - - - # 미리 만든 bytes + ETag, If-None-Match 일치 시 304
 @app.post("/load_setting")
-async def load_setting():
-    return {"kakao": KAKAO, "google": GOOGLE}
+async def load_setting(raw: Request):
+    SNAPSHOT = settings.snapshot
+    HEADERS  = {"ETag": SNAPSHOT.etag, "Cache-Control": "no-cache"}
+    if raw.headers.get("if-none-match") == SNAPSHOT.etag:
+        return Response(status_code=304, headers=HEADERS)
+    
+    return Response(content=SNAPSHOT.body, media_type="application/json", headers=HEADERS)
+
+# - - - /reload_setting 구축하기 - - - # 키 회전 후 즉시 반영 (X-Admin-Token == ADMIN_TOKEN)
+@app.post("/reload_setting")
+async def reload_setting(raw: Request):
+    TOKEN = getenv("ADMIN_TOKEN")
+    if not TOKEN or not compare_digest(raw.headers.get("x-admin-token", ""), TOKEN):
+        raise HTTPException(status_code=403, detail="forbidden")
+    
+    CHANGED = await settings.refresh()
+    
+    return {"changed": CHANGED, **settings.info()}
+
+# - - - /cache_stats 구축하기 - - - #
+@app.get("/cache_stats")
+async def cache_stats():
+    return cache.stats()
 
 # - - - /load_user 구축하기 - - - #
 @app.post("/load_user")
 async def load_user(request: UserManagementRequest):
-    USER = load_user_from_db(cursor         = cursor,
-                             user_email     = request.user_email,
-                             table_name     = "user_table")
+    USER = await db.call(load_user_from_db,
+                         user_email     = request.user_email,
+                         table_name     = "user_table")
     
     return {"user": USER}
 
+# - - - 응답 인코딩 구축하기 - - - # Accept → JSON / columnar / msgpack, Accept-Encoding → br / gzip (jsonable_encoder 생략)
+def encoded(raw: Request, key, fields, rows, **extra):
+    BODY, MEDIA, HEADERS = encoder.render(key, fields, rows, extra,
+                                          accept          = raw.headers.get("accept"),
+                                          accept_encoding = raw.headers.get("accept-encoding"))
+    return Response(content=BODY, media_type=MEDIA, headers=HEADERS)
+
 # - - - /load_task 구축하기 - - - #
 @app.post("/load_task")
-async def load_task(request: TaskManagementRequest):
-    TASK = load_task_from_db(cursor             = cursor,
-                             team_name          = request.team_name,        # 팀, 할 일 소유 조건 1 (1/1)
-                             task_target        = request.task_target,      # 개인, 할 일 소유 조건 1 (1/2)
-                             user_email         = request.user_email,       # 개인, 할 일 소유 조건 2 (2/2)
-                             table_name         = "task_table")
+async def load_task(request: TaskManagementRequest, raw: Request):
+    LIMIT = None if request.limit is None else max(1, min(request.limit, TASK_PAGE_MAX))
+    TASK = await db.call(load_task_from_db,
+                         team_name          = request.team_name,        # 팀, 할 일 소유 조건 1 (1/1)
+                         task_target        = request.task_target,      # 개인, 할 일 소유 조건 1 (1/2)
+                         user_email         = request.user_email,       # 개인, 할 일 소유 조건 2 (2/2)
+                         hide_done          = request.hide_done,
+                         window_start       = request.window_start,
+                         window_end         = request.window_end,
+                         after_end          = request.after_end,
+                         after_id           = request.after_id,
+                         limit              = LIMIT,
+                         table_name         = "task_table")
+    TASK = writes.overlay_tasks(TASK)                               # flush 전 색 변경 반영
+    
+    NEXT = None
+    if LIMIT is not None and len(TASK) == LIMIT:                    # 마지막 행의 (task_end, id)
+        NEXT = {"after_end": str(TASK[-1][4]), "after_id": TASK[-1][0]}
+    
+    return encoded(raw, "task", TASK_FIELDS, TASK, next=NEXT)
+
+# - - - /load_user_task 구축하기 - - - # 팀마다 /load_task 를 부르지 않고 한 번에 (항상 keyset 페이지)
+@app.post("/load_user_task")
+async def load_user_task(request: UserTaskRequest, raw: Request):
+    if not request.user_email:
+        raise HTTPException(status_code=400, detail="user_email is required")
+    LIMIT = max(1, min(request.limit, TASK_PAGE_MAX))
+    TASK = await db.call(load_user_task_from_db,
+                         user_email         = request.user_email,
+                         assigned_only      = request.assigned_only,
+                         hide_done          = request.hide_done,
+                         window_start       = request.window_start,
+                         window_end         = request.window_end,
+                         after_end          = request.after_end,
+                         after_id           = request.after_id,
+                         limit              = LIMIT,
+                         table_name         = "task_table")
+    TASK = writes.overlay_tasks(TASK)
+    
+    NEXT = None
+    if len(TASK) == LIMIT:
+        NEXT = {"after_end": str(TASK[-1][4]), "after_id": TASK[-1][0]}
     
-    return {"task": TASK}
+    return encoded(raw, "task", TASK_FIELDS, TASK, next=NEXT)
 
 # - - - /load_board 구축하기 - - - #
 @app.post("/load_board")
-async def load_board(request: BoardManagementRequest):
-    BOARD = load_board_from_db(cursor           = cursor,
-                               team_name        = request.team_name,
-                               board_name       = request.board_name,
-                               table_name       = "board_table")
+async def load_board(request: BoardManagementRequest, raw: Request):
+    BOARD = await db.call(load_board_from_db,
+                          team_name        = request.team_name,
+                          board_name       = request.board_name,
+                          table_name       = "card_table")
+    BOARD = writes.overlay_cards(BOARD)
     
-    return {"board": BOARD}
+    return encoded(raw, "board", CARD_FIELDS, BOARD)
 
 # - - - /load_member 구축하기 - - - #
 @app.post("/load_member")
-async def load_member(request: MemberManagementRequest):
-    MEMBER = load_member_from_db(cursor         = cursor,
-                                 team_name      = request.team_name,
-                                 table_name     = "member_table")
+async def load_member(request: MemberManagementRequest, raw: Request):
+    MEMBER = await db.call(load_member_from_db,
+                           team_name      = request.team_name,
+                           table_name     = "member_table")
     
-    return {"member": MEMBER}
+    return encoded(raw, "member", MEMBER_FIELDS, MEMBER)
+
+# - - - stream 구축하기 - - - # Accept: application/x-ndjson 이면 NDJSON, 아니면 {"<key>": [...]}
+def stream_response(raw: Request, key, batches):
+    if wants_ndjson(raw.headers.get("accept")):
+        return StreamingResponse(ndjson(batches), media_type=NDJSON)
+    return StreamingResponse(json_array(key, batches), media_type="application/json")
+
+# - - - /stream_member 구축하기 - - - #
+@app.post("/stream_member")
+async def stream_member(request: MemberManagementRequest, raw: Request):
+    BATCHES = db.stream(stream_member_from_db,
+                        team_name      = request.team_name,
+                        user_email     = request.user_email,
+                        batch_size     = STREAM_BATCH_SIZE,
+                        table_name     = "member_table")
+    
+    return stream_response(raw, "member", BATCHES)
+
+# - - - /stream_task 구축하기 - - - #
+@app.post("/stream_task")
+async def stream_task(request: TaskManagementRequest, raw: Request):
+    BATCHES = db.stream(stream_task_from_db,
+                        team_name          = request.team_name,
+                        task_target        = request.task_target,
+                        user_email         = request.user_email,
+                        hide_done          = request.hide_done,
+                        batch_size         = STREAM_BATCH_SIZE,
+                        table_name         = "task_table")
+    
+    return stream_response(raw, "task", writes.overlay_batches(BATCHES))
+
+# - - - /load_team_snapshot 구축하기 - - - #
+@app.post("/load_team_snapshot")
+async def load_team_snapshot(request: TaskManagementRequest):
+    SNAPSHOT = await db.call(load_team_snapshot_from_db,
+                             team_name          = request.team_name,
+                             task_target        = request.task_target,      # 개인 할 일 포함 조건 (load_task 와 동일)
+                             user_email         = request.user_email,
+                             task_table         = "task_table",
+                             card_table         = "card_table",
+                             member_table       = "member_table")
+    
+    return writes.overlay_snapshot(request.team_name, SNAPSHOT)
+
+# - - - /sync 구축하기 - - - #
+@app.post("/sync")
+async def sync(request: SyncRequest):
+    CHANGES = await db.call(sync_team_from_db,
+                            team_name          = request.team_name,
+                            since              = request.since,
+                            user_email         = request.user_email,
+                            task_table         = "task_table",
+                            card_table         = "card_table",
+                            member_table       = "member_table")
+    CHANGES["task"]  = writes.overlay_tasks(CHANGES["task"])
+    CHANGES["board"] = writes.overlay_cards(CHANGES["board"])
+    
+    return CHANGES
+
+# - - - /task_stats 구축하기 - - - # 대시보드 숫자 (상태별 / 기한 지남 / 임박) – task_stats_table 요약만 읽는다
+@app.post("/task_stats")
+async def task_stats(request: TaskStatsRequest):
+    if not request.team_name:                       # 개인 할 일 ('') 은 모든 사용자 것이 한 팀으로 묶여 있음
+        raise HTTPException(status_code=400, detail="team_name is required")
+    try:
+        STATS = await db.call(load_task_stats_from_db,
+                              team_name      = request.team_name,
+                              today          = request.today,
+                              due_days       = max(0, min(request.due_days, STATS_DUE_DAYS_MAX)))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="today must be YYYY-MM-DD")
+    
+    return STATS
+
+async def reconcile_task_stats(interval):
+    while True:                                     # 증분 갱신이 놓친 차이 (수동 SQL, 중단된 삭제 …) 보정
+        await sleep(interval)
+        try:
+            RESULT = await db.call(reconcile_task_stats_to_db, table_name="task_table")
+        except Exception:
+            log.exception("task stats reconcile failed")
+            continue
+        TASK_STATS_RECONCILED.inc("checked", amount=RESULT["teams"])
+        if RESULT["fixed"]:
+            TASK_STATS_RECONCILED.inc("fixed", amount=RESULT["fixed"])
+            log.warning("task stats reconcile fixed %d of %d teams", RESULT["fixed"], RESULT["teams"])
 
 # - - - /add_user 구축하기 - - - #
 @app.post("/add_user")
 async def add_user(request: UserManagementRequest):
-    add_user_to_db(connection           = connection,
-                   cursor               = cursor,
-                   user_email           = request.user_email,
-                   user_nickname        = request.user_nickname,
-                   user_image           = request.user_image,
-                   table_name           = "user_table")
+    await db.call(add_user_to_db,
+                  user_email           = request.user_email,
+                  user_nickname        = request.user_nickname,
+                  user_image           = request.user_image,
+                  table_name           = "user_table")
+
+# - - - idempotency 구축하기 - - - # Idempotency-Key 헤더가 있으면 같은 key 재시도에 첫 응답을 그대로 (DB 쓰기 없음)
+async def write_once(raw: Request, request: BaseModel, func, **kwargs):
+    KEY = raw.headers.get("idempotency-key")
+    if KEY is None:
+        await db.call(func, **kwargs)
+        return None
+    if not KEY or len(KEY) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Idempotency-Key must be 1..{MAX_KEY_LENGTH} characters")
+    
+    try:
+        REPLAYED, RECORD = await idempotency.run(raw.url.path, KEY, dict(request), func, **kwargs)
+    except IdempotencyConflict as exc:
+        raise HTTPException(status_code=409, detail=str(exc), headers={"Retry-After": "1"})
+    except IdempotencyMismatch as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    
+    if REPLAYED:                                    # 호출한 쪽은 notify 없이 이 응답을 그대로 반환
+        return Response(content=RECORD.body, status_code=RECORD.status, media_type="application/json",
+                        headers={"Idempotent-Replayed": "true"})
+    return None
 
 # - - - /add_task 구축하기 - - - #
 @app.post("/add_task")
-async def add_task(request: TaskManagementRequest):
-    add_task_to_db(connection       = connection,
-                   cursor           = cursor,
-                   team_name        = request.team_name,
-                   task_name        = request.task_name,
-                   task_start       = request.task_start,
-                   task_end         = request.task_end,
-                   task_state       = request.task_state,
-                   task_target      = request.task_target,
-                   user_email       = request.user_email,
-                   table_name       = "task_table")
+async def add_task(request: TaskManagementRequest, raw: Request):
+    REPLAY = await write_once(raw, request, add_task_to_db,
+                  team_name        = request.team_name,
+                  task_name        = request.task_name,
+                  task_start       = request.task_start,
+                  task_end         = request.task_end,
+                  task_state       = request.task_state,
+                  task_color       = request.task_color,
+                  task_target      = request.task_target,
+                  user_email       = request.user_email,
+                  table_name       = "task_table")
+    if REPLAY is not None:
+        return REPLAY
+    
+    await notify(request.team_name, "task", "add", task_name=request.task_name)
 
 # - - - /update_task 구축하기 - - - #
 @app.post("/update_task")
 async def update_task(request: TaskManagementRequest):
-    update_task_to_db(connection        = connection,
-                      cursor            = cursor,
+    if writes.enabled and request.task_state is None and request.task_color is not None:   # 색만 → write-behind
+        try:
+            writes.put(TASK, request.team_name, request.task_name, request.task_color)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="task_color must be an integer")
+    else:
+        if request.task_color is not None:          # 예약된 예전 색이 이 값을 덮어쓰지 않게
+            await writes.forget(TASK, request.team_name, request.task_name)
+        await db.call(update_task_to_db,
                       team_name         = request.team_name,
                       task_name         = request.task_name,
                       task_state        = request.task_state,
                       task_color        = request.task_color,
                       table_name        = "task_table")
+    
+    await notify(request.team_name, "task", "update", task_name=request.task_name)
 
 # - - - /add_board 구축하기 - - - #
 @app.post("/add_board")
-async def add_board(request: BoardManagementRequest):
-    add_board_to_db(connection          = connection,
-                    cursor              = cursor,
-                    team_name           = request.team_name,
-                    board_name          = request.board_name,
-                    board_color         = request.board_color,
-                    card_name           = request.card_name,
-                    card_content        = request.card_content,
-                    table_name          = "board_table")
+async def add_board(request: BoardManagementRequest, raw: Request):
+    REPLAY = await write_once(raw, request, add_board_to_db,
+                  team_name           = request.team_name,
+                  board_name          = request.board_name,
+                  board_color         = request.board_color,
+                  card_name           = request.card_name,
+                  card_content        = request.card_content,
+                  table_name          = "card_table")
+    if REPLAY is not None:
+        return REPLAY
+    
+    await notify(request.team_name, "card", "add", board_name=request.board_name, card_name=request.card_name)
 
 # - - - /add_member 구축하기 - - - #
 @app.post("/add_member")
-async def add_member(request: MemberManagementRequest):
-    add_member_to_db(connection     = connection,
-                     cursor         = cursor,
-                     team_name      = request.team_name,
-                     user_email     = request.user_email,
-                     user_owner     = request.user_owner,
-                     table_name     = "member_table")
+async def add_member(request: MemberManagementRequest, raw: Request):
+    REPLAY = await write_once(raw, request, add_member_to_db,
+                  team_name      = request.team_name,
+                  user_email     = request.user_email,
+                  is_owner       = request.user_owner,
+                  table_name     = "member_table")
+    if REPLAY is not None:
+        return REPLAY
+    
+    await notify(request.team_name, "member", "add", user_email=request.user_email)
+
+# - - - /batch_tasks 구축하기 - - - #
+@app.post("/batch_tasks")
+async def batch_tasks(request: TaskBatchRequest):
+    for op in request.operations:                   # 색을 바꾸거나 지우는 항목의 예약된 색 변경은 버림
+        if op.op == "delete" or op.task_color is not None:
+            await writes.forget(TASK, op.team_name, op.task_name)
+    try:
+        RESULT = await db.call(batch_tasks_to_db,
+                               operations     = [dict(op) for op in request.operations],
+                               table_name     = "task_table")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    for team_name in {op.team_name for op in request.operations}:
+        await notify(team_name, "task", "batch")
+    
+    return {"result": RESULT}
+
+# - - - /batch_cards 구축하기 - - - #
+@app.post("/batch_cards")
+async def batch_cards(request: CardBatchRequest):
+    try:
+        RESULT = await db.call(batch_cards_to_db,
+                               operations     = [dict(op) for op in request.operations],
+                               table_name     = "card_table")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    for team_name in {op.team_name for op in request.operations}:
+        await notify(team_name, "card", "batch")
+    
+    return {"result": RESULT}
+
+# - - - cascade 구축하기 - - - # 팀 / 사용자 삭제를 background 로 실행, 진행 상황은 cascade_job_table
+async def start_cascade(kind, target, func, kwargs, after=None):
+    JOB_ID  = await db.call(create_cascade_job_to_db, kind=kind, target=target)
+    TASK    = create_task(run_cascade(JOB_ID, func, kwargs, after))
+    CASCADES.add(TASK)
+    TASK.add_done_callback(CASCADES.discard)
+    
+    return JSONResponse(status_code=202, content={"job_id": JOB_ID, "state": "queued"})
+
+async def run_cascade(job_id, func, kwargs, after):
+    try:
+        DELETED = await db.call(func, job_id=job_id, stop=lambda: CASCADE_STOP, **kwargs)
+    except Exception as error:                      # 남은 행은 같은 삭제를 다시 요청하면 이어서 지운다
+        await db.call(finish_cascade_job_to_db, job_id=job_id, error=repr(error)[:1000])
+        return
+    if after is not None:
+        await after(DELETED)
+
+# - - - /cascade_job/{job_id} 구축하기 - - - #
+@app.get("/cascade_job/{job_id}")
+async def cascade_job(job_id: int):
+    JOB = await db.call(load_cascade_job_from_db, job_id=job_id)
+    if JOB is None:
+        raise HTTPException(status_code=404, detail="job not found")
+    
+    return JOB
 
 # - - - /delete_user 구축하기 - - - #
 @app.post("/delete_user")
 async def delete_user(request: UserManagementRequest):
-    delete_user_from_db(connection          = connection,
-                        cursor              = cursor,
-                        user_email          = request.user_email,
-                        table_name_1        = "user_table",             # 탈퇴하기로서 데이터를 삭제할 때,
-                        table_name_2        = "task_table",             # 만약 task_target != ''이면 삭제 안 함 (팀 데이터 보존, 직접 터치하여 user_email = task_target으로 삭제)
-                        table_name_3        = "member_table")           # 만약 user_owner == 'true'이면 자동 팀장 인계
+    KWARGS = dict(user_email          = request.user_email,
+                  user_table          = "user_table",             # 탈퇴하기로서 데이터를 삭제할 때,
+                  task_table          = "task_table",             # 만약 task_target != ''이면 삭제 안 함 (팀 데이터 보존, 직접 터치하여 user_email = task_target으로 삭제)
+                  member_table        = "member_table")           # 만약 user_owner == 'true'이면 자동 팀장 인계
+    if request.background:
+        return await start_cascade("user", request.user_email, delete_user_from_db, KWARGS)
+    
+    return {"deleted": await db.call(delete_user_from_db, **KWARGS)}
 
 # - - - /delete_task 구축하기 - - - #
 @app.post("/delete_task")
 async def delete_task(request: TaskManagementRequest):
-    delete_task_from_db(connection      = connection,
-                        cursor          = cursor,
-                        team_name       = request.team_name,        # 팀 단위 할 일을 삭제할 때.
-                        task_name       = request.task_name,
-                        user_email      = request.user_email,       # 개인 단위 할 일을 삭제할 때.
-                        table_name      = "task_table")
+    await writes.forget(TASK, request.team_name, request.task_name)
+    await db.call(delete_task_from_db,
+                  team_name       = request.team_name,        # 팀 단위 할 일을 삭제할 때.
+                  task_name       = request.task_name,
+                  user_email      = request.user_email,       # 개인 단위 할 일을 삭제할 때.
+                  table_name      = "task_table")
+    
+    await notify(request.team_name, "task", "delete", task_name=request.task_name)
 
 # - - - /delete_board 구축하기 - - - #
 @app.post("/delete_board")
 async def delete_board(request: BoardManagementRequest):
-    delete_board_from_db(connection     = connection,
-                         cursor         = cursor,
-                         team_name      = request.team_name,
-                         board_name     = request.board_name,
-                         table_name     = "board_table")
+    await writes.forget(BOARD, request.team_name, request.board_name)
+    await db.call(delete_board_from_db,
+                  team_name      = request.team_name,
+                  board_name     = request.board_name,
+                  table_name     = "card_table")
+    
+    await notify(request.team_name, "board", "delete", board_name=request.board_name)
 
 # - - - /delete_card 구축하기 - - - #
 @app.post("/delete_card")
 async def delete_card(request: BoardManagementRequest):
-    delete_card_from_db(connection      = connection,
-                        cursor          = cursor,
-                        team_name       = request.team_name,
-                        board_name      = request.board_name,
-                        card_name       = request.card_name,
-                        table_name      = "board_table")
+    await db.call(delete_card_from_db,
+                  team_name       = request.team_name,
+                  board_name      = request.board_name,
+                  card_name       = request.card_name,
+                  table_name      = "card_table")
+    
+    await notify(request.team_name, "card", "delete", board_name=request.board_name, card_name=request.card_name)
 
 # - - - /update_board 구축하기 - - - #
 @app.post("/update_board")
 async def update_board(request: BoardManagementRequest):
-    update_board_to_db(connection       = connection,
-                       cursor           = cursor,
-                       team_name        = request.team_name,
-                       board_name       = request.board_name,
-                       board_color      = request.board_color,
-                       table_name       = "board_table")
+    if writes.enabled:                              # 색 변경뿐 → write-behind
+        try:
+            writes.put(BOARD, request.team_name, request.board_name, request.board_color)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="board_color must be an integer")
+    else:
+        await db.call(update_board_to_db,
+                      team_name        = request.team_name,
+                      board_name       = request.board_name,
+                      board_color      = request.board_color,
+                      table_name       = "card_table")
+    
+    await notify(request.team_name, "board", "update", board_name=request.board_name)
 
 # - - - /delete_team 구축하기 - - - #
 @app.post("/delete_team")
 async def delete_team(request: MemberManagementRequest):
-    delete_team_from_db(connection          = connection,
-                        cursor              = cursor,
-                        team_name           = request.team_name,
-                        table_name_1        = "task_table",
-                        table_name_2        = "board_table",
-                        table_name_3        = "member_table")
+    KWARGS = dict(team_name           = request.team_name,
+                  task_table          = "task_table",
+                  card_table          = "card_table",
+                  member_table        = "member_table")
+    await writes.forget(None, request.team_name)
+    
+    async def announce(DELETED):
+        if any(DELETED.values()):                   # 없는 팀 → 바뀐 것이 없으니 알리지 않음
+            await notify(request.team_name, "team", "delete")
+    
+    if request.background:
+        return await start_cascade("team", request.team_name, delete_team_from_db, KWARGS, after=announce)
+    
+    DELETED = await db.call(delete_team_from_db, **KWARGS)
+    
+    await announce(DELETED)
+    
+    return {"deleted": DELETED}
+
+# - - - /export_team 구축하기 - - - # 팀 전체 (member / board / card / task) 를 NDJSON archive 로 스트리밍
+@app.post("/export_team")
+async def export_team(request: TeamExportRequest):
+    if not request.team_name:
+        raise HTTPException(status_code=400, detail="team_name is required")
+    await writes.flush()                            # 아직 DB 에 없는 색 변경도 archive 에 포함
+    
+    BATCHES = db.stream(export_team_from_db,
+                        team_name          = request.team_name,
+                        batch_size         = STREAM_BATCH_SIZE,
+                        task_table         = "task_table",
+                        card_table         = "card_table",
+                        member_table       = "member_table")
+    BODY, MEDIA, NAME = ndjson(BATCHES), NDJSON, f"{request.team_name}.ndjson"
+    if request.gzip:
+        BODY, MEDIA, NAME = gzip_chunks(BODY, encoder.gzip_level), "application/gzip", NAME + ".gz"
+    
+    return StreamingResponse(BODY, media_type=MEDIA,
+                             headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(NAME)}"})
+
+# - - - /import_team 구축하기 - - - # body = /export_team archive (gzip 이어도 됨), ?team_name= 으로 다른 팀 이름에 복원
+@app.post("/import_team")
+async def import_team(raw: Request, team_name: Optional[str] = None, replace: bool = False):
+    try:
+        RESULT = await import_archive(db.call, ndjson_records(raw.stream()),
+                                      team_name  = team_name,
+                                      replace    = replace,                 # True = 기존 팀 데이터를 지우고 복원
+                                      batch_size = IMPORT_BATCH_SIZE,
+                                      before     = lambda team: writes.forget(None, team))
+    except TeamNotEmpty as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    except ArchiveError as exc:
+        raise HTTPException(status_code=400, detail={"error": str(exc), "imported": exc.imported})
+    
+    await notify(RESULT["team_name"], "team", "import")
+    
+    return RESULT
 
 # - - - /delete_member 구축하기 - - - #
 @app.post("/delete_member")
 async def delete_member(request: MemberManagementRequest):
-    delete_member_from_db(connection        = connection,
-                          cursor            = cursor,
-                          user_email        = request.user_email,
-                          table_name        = "member_table")
+    await db.call(delete_member_from_db,
+                  team_name         = request.team_name,
+                  user_email        = request.user_email,
+                  table_name        = "member_table")
+    
+    await notify(request.team_name, "member", "delete", user_email=request.user_email)
 
 # - - - /update_member 구축하기 - - - #
 @app.post("/update_member")
 async def update_member(request: MemberManagementRequest):
-    update_member_to_db(connection      = connection,
-                        cursor          = cursor,
-                        team_name       = request.team_name,
-                        user_owner      = request.user_owner,
-                        table_name      = "member_table")
+    await db.call(update_member_to_db,
+                  team_name       = request.team_name,
+                  user_email      = request.user_email,
+                  is_owner        = request.user_owner,
+                  table_name      = "member_table")
+    
+    await notify(request.team_name, "member", "update", user_email=request.user_email)
 
 # - - - shutdown 구축하기 - - - #
 @app.on_event("shutdown")
 async def shutdown_event():
-    close_db(connection     = connection,
-             cursor         = cursor)
+    global READY, DRAINING, CASCADE_STOP, STATS_RECONCILER
+    READY    = False
+    DRAINING = True
+    
+    # uvicorn 은 여기 오기 전에 listener 를 닫고 열린 연결을 timeout_graceful_shutdown (= DRAIN_TIMEOUT) 동안 기다렸다.
+    # LB 에서 빠지는 것은 SIGTERM 직후 /readyz 503 (drain_on_sigterm) 이 담당하고, 아래 대기는 그 뒤에도 남은
+    # 요청 (끊긴 stream body 정리 등) 과 background 삭제를 위한 안전망 – 대개 바로 지나간다.
+    DEADLINE = perf_counter() + float(getenv("DRAIN_TIMEOUT", 30))
+    while INFLIGHT and perf_counter() < DEADLINE:   # 처리 중인 요청이 끝날 때까지 대기
+        await sleep(0.05)
+    if CASCADES:                                    # background 삭제도 남은 시간만큼 기다린 뒤 chunk 사이에서 중단
+        await wait(CASCADES, timeout=max(DEADLINE - perf_counter(), 0.1))
+        CASCADE_STOP = True
+    if CASCADES:
+        await wait(CASCADES)
+    
+    await writes.stop()                             # 모아 둔 색 변경 flush (풀을 닫기 전에)
+    if STATS_RECONCILER is not None:
+        STATS_RECONCILER.cancel()
+        await wait([STATS_RECONCILER])
+        STATS_RECONCILER = None                     # 다음 startup 이 끈 채로 시작해도 지난 loop 의 task 를 기다리지 않게
+    await settings.stop()
+    await idempotency.stop()
+    await hub.close()
+    db and db.close()                               # executor 가 실행 중인 쿼리를 마칠 때까지 대기
+    close_pool(pool)
 
 # - - - server 실행하기 - - - #
+# WORKERS > 1 이면 프로세스마다 server.py 를 새로 import → 풀 / 캐시 / settings / metrics 는 worker 별
 if __name__ == "__main__":
-    run(              "server:app",
-        host        = "0.0.0.0",
-        port        = 8000,
-        reload      = False)
+    load_dotenv()
+    run(                            "server:app",
+        host                      = "0.0.0.0",
+        port                      = 8000,
+        workers                   = int(getenv("WORKERS", 1)),
+        timeout_graceful_shutdown = int(getenv("DRAIN_TIMEOUT", 30)),
+        reload                    = False)
 
 # %%
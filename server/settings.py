@@ -0,0 +1,89 @@
+"""
+settings.py – Cached, hot-reloadable settings for /load_setting
+
+* setting_table 내용을 미리 JSON bytes + ETag 로 만들어 두고 그대로 응답
+* 주기적(interval) 또는 관리자 요청으로 다시 읽어, 내용이 바뀐 경우에만 교체 (version +1)
+* 교체는 Snapshot 객체 하나를 바꿔 끼우는 방식 → 읽는 쪽은 lock 없이 항상 일관된 값
+* 다시 읽기에 실패하면 기존 값을 유지 (키 회전 중 DB 장애로 서비스가 멈추지 않도록)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Tuple
+
+log = logging.getLogger("planit.settings")
+
+Loader = Callable[[], Awaitable[Tuple[str, str]]]
+
+
+class Snapshot(NamedTuple):
+    version: int
+    body: bytes
+    etag: str
+    loaded_at: float
+
+
+def _encode(kakao: str, google: str) -> Tuple[bytes, str]:
+    body = json.dumps({"kakao": kakao, "google": google}, separators=(",", ":")).encode()
+    return body, '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+
+
+class SettingsCache:
+    def __init__(self, loader: Loader, *, interval: float = 60.0):
+        self._loader = loader
+        self.interval = interval
+        self.snapshot: Snapshot | None = None
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    async def refresh(self) -> bool:
+        """다시 읽어서 바뀌었으면 교체 후 True"""
+        async with self._lock:                      # 동시 refresh 로 version 이 꼬이지 않게
+            kakao, google = await self._loader()
+            body, etag = _encode(kakao, google)
+            current = self.snapshot
+            if current is not None and current.etag == etag:
+                return False
+            version = current.version + 1 if current else 1
+            self.snapshot = Snapshot(version, body, etag, time.time())
+            log.info("settings reloaded: version=%s etag=%s", version, etag)
+            return True
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except Exception:
+                log.exception("settings refresh failed; keeping version %s",
+                              self.snapshot and self.snapshot.version)
+
+    async def start(self) -> None:
+        await self.refresh()                        # 최초 1회는 실패 시 startup 실패
+        if self.interval > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def info(self) -> Dict[str, Any]:
+        snap = self.snapshot
+        return {
+            "version": snap.version if snap else 0,
+            "etag": snap.etag if snap else None,
+            "loaded_at": snap.loaded_at if snap else None,
+        }
+
+
+__all__ = ["SettingsCache", "Snapshot"]
@@ -0,0 +1,188 @@
+-- - - - SQLite 스키마 (STORAGE_BACKEND=sqlite) - - - --
+-- mysql.txt + migrations 0001–0008 을 적용한 MySQL 스키마와 같은 테이블 / 컬럼 / 인덱스 이름.
+-- sqlite_backend.SQLiteBackend.prepare() 가 서버 시작 시 실행 (IF NOT EXISTS → 여러 번 실행해도 그대로).
+-- 스키마를 바꾸면 migrations/ 의 MySQL 변경과 이 파일을 함께 고칠 것.
+--
+-- MySQL 과 다른 점
+--   AUTO_INCREMENT              → INTEGER PRIMARY KEY AUTOINCREMENT (삭제된 id 재사용 없음 – tombstone row_id)
+--   ENUM                        → TEXT + CHECK
+--   ON UPDATE CURRENT_TIMESTAMP → AFTER UPDATE OF <데이터 컬럼> trigger (upsert 의 id = id 는 제외)
+--   PK 로 찾는 작은 테이블      → WITHOUT ROWID (InnoDB 처럼 PK 순서로 저장)
+--   날짜 / 시각                 → ISO 문자열 ('YYYY-MM-DD', 'YYYY-MM-DD HH:MM:SS[.fff]', UTC)
+
+-- - - - setting_table - - - --
+CREATE TABLE IF NOT EXISTS setting_table (
+    id                  INTEGER             PRIMARY KEY         AUTOINCREMENT,
+    kakao_key           TEXT                NOT NULL,
+    google_key          TEXT                NOT NULL
+);
+
+-- 빈 DB 에서도 /load_setting 이 동작하도록 빈 키 한 줄 (실제 키는 직접 UPDATE)
+INSERT INTO setting_table (kakao_key, google_key)
+SELECT '', '' WHERE NOT EXISTS (SELECT 1 FROM setting_table);
+
+-- - - - user_table - - - --
+CREATE TABLE IF NOT EXISTS user_table (
+    id                  INTEGER             PRIMARY KEY         AUTOINCREMENT,
+    user_email          TEXT                NOT NULL            UNIQUE,
+    user_nickname       TEXT                NOT NULL,
+    user_image          TEXT                NOT NULL
+);
+
+-- - - - team_table (0005) - - - --
+CREATE TABLE IF NOT EXISTS team_table (
+    id                  INTEGER             PRIMARY KEY         AUTOINCREMENT,
+    team_name           TEXT                NOT NULL,
+    created_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP
+);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_team_name          ON team_table (team_name);
+
+-- - - - task_table - - - -- task_target != '' 이면 팀 단위 할 일, == '' 이면 개인 단위 할 일
+CREATE TABLE IF NOT EXISTS task_table (
+    id                  INTEGER             PRIMARY KEY         AUTOINCREMENT,
+    team_id             INTEGER             NOT NULL            REFERENCES team_table (id),
+    task_name           TEXT                NOT NULL,
+    task_start          DATE                NOT NULL,
+    task_end            DATE                NOT NULL,
+    task_state          TEXT                NOT NULL            DEFAULT 'TODO'
+                                            CHECK (task_state IN ('TODO', 'DOING', 'DONE')),
+    task_color          INTEGER             NOT NULL            DEFAULT 0,
+    task_target         TEXT                NOT NULL,
+    user_email          TEXT                NOT NULL,
+    revision            INTEGER             NOT NULL            DEFAULT 0,
+    updated_at          TIMESTAMP           NOT NULL            DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+);
+CREATE INDEX IF NOT EXISTS ix_task_team_state           ON task_table (team_id, task_state);
+CREATE INDEX IF NOT EXISTS ix_task_team_name            ON task_table (team_id, task_name);
+CREATE INDEX IF NOT EXISTS ix_task_team_rev             ON task_table (team_id, revision);
+CREATE INDEX IF NOT EXISTS ix_task_team_end             ON task_table (team_id, task_end);
+CREATE INDEX IF NOT EXISTS ix_task_owner_end            ON task_table (task_target, user_email, task_end);
+CREATE INDEX IF NOT EXISTS ix_task_user_name            ON task_table (user_email, task_name);
+
+CREATE TRIGGER IF NOT EXISTS tr_task_updated_at
+AFTER UPDATE OF task_name, task_start, task_end, task_state, task_color, task_target, user_email, revision
+ON task_table
+BEGIN
+    UPDATE task_table SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE id = NEW.id;
+END;
+
+-- - - - member_table - - - -- user_owner, 0 = MEMBER, 1 = OWNER
+CREATE TABLE IF NOT EXISTS member_table (
+    id                  INTEGER             PRIMARY KEY         AUTOINCREMENT,
+    team_id             INTEGER             NOT NULL            REFERENCES team_table (id),
+    user_email          TEXT                NOT NULL,
+    user_owner          INTEGER             NOT NULL            DEFAULT 0,
+    revision            INTEGER             NOT NULL            DEFAULT 0,
+    updated_at          TIMESTAMP           NOT NULL            DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_team_user          ON member_table (team_id, user_email);
+CREATE INDEX IF NOT EXISTS ix_member_user_team          ON member_table (user_email, team_id);   -- 0008
+DROP INDEX IF EXISTS ix_member_user;                                                              -- 0008 이전 DB 파일
+CREATE INDEX IF NOT EXISTS ix_member_team_rev           ON member_table (team_id, revision);
+
+CREATE TRIGGER IF NOT EXISTS tr_member_updated_at
+AFTER UPDATE OF user_email, user_owner, revision ON member_table
+BEGIN
+    UPDATE member_table SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE id = NEW.id;
+END;
+
+-- - - - board_table (0005) - - - -- (team_id, board_name) 엔티티
+CREATE TABLE IF NOT EXISTS board_table (
+    id                  INTEGER             PRIMARY KEY         AUTOINCREMENT,
+    team_id             INTEGER             NOT NULL            REFERENCES team_table (id),
+    board_name          TEXT                NOT NULL,
+    board_color         INTEGER             NOT NULL            DEFAULT 0,
+    revision            INTEGER             NOT NULL            DEFAULT 0,
+    updated_at          TIMESTAMP           NOT NULL            DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_board_team_name    ON board_table (team_id, board_name);
+
+CREATE TRIGGER IF NOT EXISTS tr_board_updated_at
+AFTER UPDATE OF board_name, board_color, revision ON board_table
+BEGIN
+    UPDATE board_table SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE id = NEW.id;
+END;
+
+-- - - - card_table (0005) - - - --
+CREATE TABLE IF NOT EXISTS card_table (
+    id                  INTEGER             PRIMARY KEY         AUTOINCREMENT,
+    board_id            INTEGER             NOT NULL            REFERENCES board_table (id) ON DELETE CASCADE,
+    card_name           TEXT                NOT NULL,
+    card_content        TEXT                NOT NULL,
+    revision            INTEGER             NOT NULL            DEFAULT 0,
+    updated_at          TIMESTAMP           NOT NULL            DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+);
+CREATE INDEX IF NOT EXISTS ix_card_board_name           ON card_table (board_id, card_name);
+CREATE INDEX IF NOT EXISTS ix_card_board_rev            ON card_table (board_id, revision);
+
+CREATE TRIGGER IF NOT EXISTS tr_card_updated_at
+AFTER UPDATE OF board_id, card_name, card_content, revision ON card_table
+BEGIN
+    UPDATE card_table SET updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE id = NEW.id;
+END;
+
+-- - - - revision_table / tombstone_table (0002) - - - --
+CREATE TABLE IF NOT EXISTS revision_table (
+    team_name           TEXT                NOT NULL            PRIMARY KEY,
+    revision            INTEGER             NOT NULL            DEFAULT 0,
+    pruned_revision     INTEGER             NOT NULL            DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS tombstone_table (
+    id                  INTEGER             PRIMARY KEY         AUTOINCREMENT,
+    table_name          TEXT                NOT NULL,
+    row_id              INTEGER             NOT NULL,
+    team_name           TEXT                NOT NULL,
+    revision            INTEGER             NOT NULL,
+    deleted_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS ix_tombstone_team_rev        ON tombstone_table (team_name, revision);
+CREATE INDEX IF NOT EXISTS ix_tombstone_deleted_at      ON tombstone_table (deleted_at);
+
+-- - - - cascade_job_table (0004) - - - --
+CREATE TABLE IF NOT EXISTS cascade_job_table (
+    id                  INTEGER             PRIMARY KEY         AUTOINCREMENT,
+    kind                TEXT                NOT NULL            CHECK (kind IN ('team', 'user')),
+    target              TEXT                NOT NULL,
+    state               TEXT                NOT NULL            DEFAULT 'queued'
+                                            CHECK (state IN ('queued', 'running', 'done', 'failed')),
+    deleted             INTEGER             NOT NULL            DEFAULT 0,
+    error               TEXT                NULL,
+    created_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP,
+    updated_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS ix_cascade_state             ON cascade_job_table (state, updated_at);
+
+CREATE TRIGGER IF NOT EXISTS tr_cascade_job_updated_at
+AFTER UPDATE OF state, deleted, error ON cascade_job_table
+BEGIN
+    UPDATE cascade_job_table SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+
+-- - - - idempotency_table (0006) - - - --
+CREATE TABLE IF NOT EXISTS idempotency_table (
+    route               TEXT                NOT NULL,
+    idem_key            TEXT                NOT NULL,
+    fingerprint         TEXT                NOT NULL,
+    status              INTEGER             NULL,
+    body                TEXT                NULL,
+    created_at          TIMESTAMP           NOT NULL            DEFAULT CURRENT_TIMESTAMP,
+    expires_at          TIMESTAMP           NOT NULL,
+    PRIMARY KEY (route, idem_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_idempotency_expires       ON idempotency_table (expires_at);
+
+-- - - - task_stats_table (0007) - - - --
+CREATE TABLE IF NOT EXISTS task_stats_table (
+    team_id             INTEGER             NOT NULL            REFERENCES team_table (id),
+    task_state          TEXT                NOT NULL            CHECK (task_state IN ('TODO', 'DOING', 'DONE')),
+    task_end            DATE                NOT NULL,
+    task_count          INTEGER             NOT NULL            DEFAULT 0,
+    PRIMARY KEY (team_id, task_state, task_end)
+) WITHOUT ROWID;
+
+-- 이 테이블이 생기기 전의 DB 파일 → 한 번 채워 둔다 (이후는 증분 갱신 + reconcile)
+INSERT INTO task_stats_table (team_id, task_state, task_end, task_count)
+SELECT team_id, task_state, task_end, COUNT(*) FROM task_table
+ WHERE NOT EXISTS (SELECT 1 FROM task_stats_table)
+ GROUP BY team_id, task_state, task_end;
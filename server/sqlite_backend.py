@@ -0,0 +1,207 @@
+"""
+sqlite_backend.py – Embedded SQLite storage backend (STORAGE_BACKEND=sqlite)
+
+단일 노드 배포 / CI / 로컬 benchmark 용. 네트워크 왕복 없이 같은 rds.py 함수가 그대로 돈다.
+
+* 파일 하나 (SQLITE_PATH), WAL 모드 → 읽기는 쓰기를 기다리지 않고, 쓰기는 한 번에 하나
+  (busy_timeout 동안 대기 – MySQL 의 행 잠금 대기에 해당)
+* 스키마는 sqlite.sql (migrations 0001–0008 적용 후와 같은 테이블 / 인덱스), prepare() 에서 없으면 생성
+* rds.py 가 기대하는 pymysql 동작을 맞춘다
+    - 쓰기 문장 앞에서 BEGIN IMMEDIATE (commit / rollback 까지 한 트랜잭션)
+    - execute 반환값 = rowcount, RETURNING 문장은 첫 열을 lastrowid 로 (LAST_INSERT_ID(expr) 대신)
+    - sqlite3 예외 → pymysql.err.* (UNIQUE 위반은 1062 duplicate key)
+    - ";" 로 이어진 sqlite 템플릿은 문장별로 실행 (?N 번호 파라미터)
+* 날짜 / 시각은 ISO 문자열로 저장, 조회 결과도 문자열 (JSON 출력은 같은 값)
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, List, Sequence, Tuple
+
+import pymysql
+
+from storage import StorageBackend
+
+SCHEMA_PATH = Path(__file__).resolve().parent / "sqlite.sql"
+DUPLICATE_KEY = 1062
+
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+
+_ERRORS = (
+    (sqlite3.IntegrityError, pymysql.err.IntegrityError),
+    (sqlite3.OperationalError, pymysql.err.OperationalError),
+    (sqlite3.ProgrammingError, pymysql.err.ProgrammingError),
+    (sqlite3.DataError, pymysql.err.DataError),
+    (sqlite3.NotSupportedError, pymysql.err.NotSupportedError),
+    (sqlite3.InterfaceError, pymysql.err.InterfaceError),
+    (sqlite3.DatabaseError, pymysql.err.DatabaseError),
+)
+_WRITES = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+@contextmanager
+def _translate() -> Iterator[None]:
+    """sqlite3 예외 → pymysql 예외 (rds.py / pool.py 는 pymysql.err 만 다룬다)"""
+    try:
+        yield
+    except sqlite3.Error as exc:
+        message = str(exc)
+        if message.startswith("UNIQUE constraint failed"):
+            code = DUPLICATE_KEY
+        else:
+            code = getattr(exc, "sqlite_errorcode", 0)
+        for source, target in _ERRORS:
+            if isinstance(exc, source):
+                raise target(code, message) from exc
+        raise pymysql.err.Error(code, message) from exc
+
+
+@lru_cache(maxsize=None)
+def _script(query: str) -> Tuple[Tuple[str, int], ...]:
+    """ "a; b" → ((a, 파라미터 수), (b, 파라미터 수)) – 각 문장은 ?N 번호 파라미터만"""
+    return tuple(
+        (part.strip(), max(map(int, re.findall(r"\?(\d+)", part)), default=0))
+        for part in query.split(";") if part.strip()
+    )
+
+
+class SQLiteCursor:
+    """pymysql cursor 와 같은 호출 모양 (rows 는 tuple)"""
+
+    def __init__(self, connection: "SQLiteConnection"):
+        self.connection = connection
+        self._cursor = connection.raw.cursor()
+        self._returned: List[Tuple[Any, ...]] | None = None
+        self.lastrowid: int | None = None
+        self.rowcount = -1
+
+    def _begin(self, query: str) -> None:
+        if not self.connection.raw.in_transaction and query[:7].lstrip().upper().startswith(_WRITES):
+            self._cursor.execute("BEGIN IMMEDIATE")
+
+    def execute(self, query: str, args: Sequence[Any] | None = None) -> int:
+        params = tuple(args) if args is not None else ()
+        self._returned = None
+        with _translate():
+            self._begin(query)
+            if ";" in query:
+                for statement, count in _script(query):
+                    self._cursor.execute(statement, params[:count])
+            else:
+                self._cursor.execute(query, params)
+            if " RETURNING " in query:
+                # 결과를 끝까지 읽어 문장을 끝낸다 (열린 문장이 있으면 COMMIT 이 실패)
+                self._returned = self._cursor.fetchall()
+                self.lastrowid = self._returned[0][0] if self._returned else None
+            else:
+                self.lastrowid = self._cursor.lastrowid
+        self.rowcount = self._cursor.rowcount
+        return self.rowcount
+
+    def executemany(self, query: str, args: Sequence[Sequence[Any]]) -> int:
+        rows = [tuple(row) for row in args]
+        with _translate():
+            self._begin(query)
+            self._cursor.executemany(query, rows)
+        self.rowcount = self._cursor.rowcount
+        return self.rowcount
+
+    def fetchone(self) -> Tuple[Any, ...] | None:
+        if self._returned is not None:
+            return self._returned.pop(0) if self._returned else None
+        with _translate():
+            return self._cursor.fetchone()
+
+    def fetchmany(self, size: int | None = None) -> List[Tuple[Any, ...]]:
+        if self._returned is not None:
+            size = size or 1
+            rows, self._returned = self._returned[:size], self._returned[size:]
+            return rows
+        with _translate():
+            return self._cursor.fetchmany(size) if size is not None else self._cursor.fetchmany()
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        if self._returned is not None:
+            rows, self._returned = self._returned, []
+            return rows
+        with _translate():
+            return self._cursor.fetchall()
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """sqlite3 커넥션 + pymysql.Connection 과 같은 이름의 메서드 (풀 / rds 공용)"""
+
+    def __init__(self, path: str, *, busy_timeout: float = 5.0):
+        with _translate():
+            # isolation_level=None : 암묵적 BEGIN 없음 – 쓰기 문장에서 SQLiteCursor 가 BEGIN IMMEDIATE
+            self.raw = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None,
+                                       check_same_thread=False)
+            self.raw.execute("PRAGMA journal_mode=WAL")
+            self.raw.execute("PRAGMA synchronous=NORMAL")       # WAL 에서는 checkpoint 때만 fsync
+            self.raw.execute("PRAGMA foreign_keys=ON")          # card_table ON DELETE CASCADE
+        self.open = True
+
+    def cursor(self, cursorclass: Any = None) -> SQLiteCursor:
+        # sqlite3 cursor 는 원래 한 행씩 step → SSCursor 요청도 같은 cursor 로 충분
+        return SQLiteCursor(self)
+
+    def commit(self) -> None:
+        with _translate():
+            if self.raw.in_transaction:
+                self.raw.execute("COMMIT")
+
+    def rollback(self) -> None:
+        with _translate():
+            if self.raw.in_transaction:
+                self.raw.execute("ROLLBACK")
+
+    def ping(self, reconnect: bool = True) -> None:
+        with _translate():
+            self.raw.execute("SELECT 1").fetchone()
+
+    def close(self) -> None:
+        if self.open:
+            self.open = False
+            with _translate():
+                self.raw.close()
+
+
+class SQLiteBackend(StorageBackend):
+    name = dialect = "sqlite"
+
+    def __init__(self, path: str, *, busy_timeout: float = 5.0):
+        self.path = path
+        self.busy_timeout = busy_timeout
+
+    def connect(self) -> SQLiteConnection:
+        return SQLiteConnection(self.path, busy_timeout=self.busy_timeout)
+
+    def prepare(self) -> None:
+        """스키마 생성 (IF NOT EXISTS – 이미 있으면 그대로). worker 가 여럿이어도 한 트랜잭션씩"""
+        connection = self.connect()
+        try:
+            with _translate():
+                connection.raw.executescript(
+                    "BEGIN IMMEDIATE;\n" + SCHEMA_PATH.read_text(encoding="utf-8") + "\nCOMMIT;"
+                )
+        finally:
+            connection.close()
+
+    def describe(self) -> str:
+        return f"sqlite:///{self.path}"
+
+
+__all__ = ["SQLiteBackend", "SQLiteConnection", "SQLiteCursor", "SCHEMA_PATH"]
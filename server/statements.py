@@ -0,0 +1,126 @@
+"""
+statements.py – Compiled SQL statement registry for rds.py
+
+* 쿼리 모양(shape)마다 SQL 텍스트를 모듈 import 시점에 한 번만 만든다 (기본 테이블 기준)
+* 테이블 자리({table}, {revision} ...)는 TABLES whitelist 로 검증 → 임의 문자열이 SQL 에 섞일 수 없음
+* 그 밖의 자리({where}, {sets} ...)는 rds.py 안의 고정 조각 전용 – 값별로 한 번 compile 후 재사용
+  (사용자 입력을 넣지 말 것. 값은 항상 %s 파라미터로)
+* 공백을 정리해 두어 매 호출 전송되는 SQL 바이트도 줄어든다
+
+    LOAD_USER = Statement("SELECT * FROM {table} WHERE user_email=%s", table="user_table")
+    cursor.execute(LOAD_USER[table_name], (user_email,))            # dict 조회 한 번
+    cursor.execute(TASK_OWNERS[table_name, where], params)          # 조각 자리가 있으면 tuple key
+
+pymysql 은 server-side prepared statement (COM_STMT_PREPARE / EXECUTE) 를 지원하지 않는다.
+파라미터 escape 는 여전히 클라이언트에서 하므로, 여기서 줄이는 것은 SQL 조립 비용과 전송 크기.
+드라이버를 바꾸면 compile 된 SQL 텍스트를 prepare 키로 그대로 쓸 수 있다.
+
+SQL 방언 (storage backend – storage.py)
+  템플릿은 MySQL 기준. 문법이 다른 문장만 sqlite= 로 SQLite 템플릿을 따로 둔다.
+  use_dialect("sqlite") 는 모든 Statement 를 다시 compile (%s → ?) – 커넥션을 만들기 전에 한 번.
+  sqlite 템플릿의 ?1, ?2 ... 는 MySQL 쪽 파라미터 순서 그대로의 번호 (순서가 달라야 할 때)
+"""
+
+from __future__ import annotations
+
+from itertools import product
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Tuple
+
+TABLES = frozenset({
+    "setting_table", "user_table", "task_table", "board_table", "card_table", "member_table", "team_table",
+    "revision_table", "tombstone_table", "cascade_job_table", "idempotency_table", "task_stats_table",
+})
+DIALECTS = ("mysql", "sqlite")
+
+_dialect = "mysql"
+_registry: List["Statement"] = []
+
+
+def check_table(name: str) -> str:
+    if name not in TABLES:
+        raise ValueError(f"unknown table: {name!r}")
+    return name
+
+
+class Statement(dict):
+    """
+    SQL 템플릿 하나 = {key: compile 된 SQL} dict
+      key = table 이름                          (조각 자리가 없을 때)
+            (table 이름, 조각 값 ...)           (조각 자리가 있을 때, 템플릿 등장 순서)
+    keyword 인자 = 테이블 자리 기본값. "table" 만 호출마다 바꿀 수 있고 나머지는 고정.
+    처음 보는 key 는 __missing__ 에서 검증 후 compile, 이후에는 dict 조회만 한다.
+    """
+
+    def __init__(self, template: str, *, sqlite: str | None = None, **tables: str):
+        super().__init__()
+        self.templates = {"mysql": " ".join(template.split())}
+        self.templates["sqlite"] = " ".join(sqlite.split()) if sqlite else self.templates["mysql"]
+        self.tables = {name: check_table(value) for name, value in tables.items()}
+        self.fragments = _fragments(self.templates["mysql"], tables)
+        if sqlite and set(_fragments(self.templates["sqlite"], tables)) != set(self.fragments):
+            raise ValueError(f"sqlite template needs the same fragments {self.fragments}")
+        self._warmed: List[Dict[str, Iterable[str]]] = []
+        self._compile()
+        _registry.append(self)
+
+    def _compile(self) -> None:
+        self.clear()
+        self.template = self.templates[_dialect]
+        # 조각 자리가 없으면 기본 테이블용 SQL 을 지금 만들어 둔다
+        self.sql = None if self.fragments else self[self.tables.get("table")]
+        for choices in self._warmed:
+            self._warm(choices)
+
+    def __missing__(self, key: Any) -> str:
+        table, parts = (key[0], key[1:]) if self.fragments else (key, ())
+        if len(parts) != len(self.fragments):
+            raise TypeError(f"statement needs {self.fragments}: {self.template[:60]}")
+        values: Dict[str, str] = dict(self.tables)
+        if "table" in values:
+            values["table"] = check_table(table or values["table"])
+        values.update(zip(self.fragments, parts))
+        sql = self.template.format(**values)
+        if _dialect == "sqlite":
+            sql = sql.replace("%s", "?")
+        self[key] = sql
+        return sql
+
+    def warm(self, **choices: Iterable[str]) -> "Statement":
+        """조각 자리에 올 수 있는 값을 미리 compile (import 시점에 모든 shape 준비)"""
+        choices = {name: tuple(values) for name, values in choices.items()}
+        self._warmed.append(choices)
+        self._warm(choices)
+        return self
+
+    def _warm(self, choices: Dict[str, Iterable[str]]) -> None:
+        for table in choices.get("table", [self.tables.get("table")]):
+            for parts in product(*(choices[name] for name in self.fragments)):
+                self[(table, *parts)]
+
+    def __repr__(self) -> str:
+        return f"Statement({self.template[:60]!r})"
+
+
+def _fragments(template: str, tables: Dict[str, str]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(
+        name for _, name, _, _ in Formatter().parse(template) if name and name not in tables
+    ))
+
+
+def dialect() -> str:
+    return _dialect
+
+
+def use_dialect(name: str) -> None:
+    """프로세스 전체 SQL 방언 변경 – 이미 만든 Statement 도 모두 다시 compile"""
+    global _dialect
+    if name not in DIALECTS:
+        raise ValueError(f"unknown SQL dialect: {name!r}")
+    if name != _dialect:
+        _dialect = name
+        for statement in _registry:
+            statement._compile()
+
+
+__all__ = ["Statement", "TABLES", "DIALECTS", "check_table", "dialect", "use_dialect"]
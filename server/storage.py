@@ -0,0 +1,83 @@
+"""
+storage.py – Storage backend interface (rds.py 아래 드라이버 / SQL 방언)
+
+rds.py 함수는 connection / cursor 만 받으므로 backend 가 정하는 것은 세 가지뿐이다.
+  connect()  : pymysql 과 같은 모양의 DB-API 커넥션
+               (cursor.execute 반환값 = rowcount, cursor.lastrowid, 예외는 pymysql.err.*)
+  dialect    : statements.use_dialect 로 넘길 SQL 방언
+  prepare()  : 첫 커넥션 전에 한 번 (SQLite 는 스키마 생성, MySQL 은 migrate.py 로 따로)
+
+STORAGE_BACKEND=mysql (기본, .env 의 HOST / USER / PASSWORD / DATABASE)
+STORAGE_BACKEND=sqlite (SQLITE_PATH 파일, WAL – sqlite_backend.py)
+"""
+
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from typing import Any
+
+import pymysql
+
+
+class StorageBackend(ABC):
+    name = ""
+    dialect = "mysql"
+
+    @abstractmethod
+    def connect(self) -> Any:
+        """새 커넥션 (풀 / 스크립트 공용)"""
+
+    def prepare(self) -> None:
+        """프로세스에서 커넥션을 만들기 전에 한 번"""
+
+    def describe(self) -> str:
+        return self.name
+
+
+class MySQLBackend(StorageBackend):
+    name = dialect = "mysql"
+
+    def __init__(self, *, host: str | None, user: str | None, password: str | None,
+                 database: str | None, connect_timeout: int = 5):
+        self.host = host
+        self.user = user
+        self.password = password
+        self.database = database
+        self.connect_timeout = connect_timeout
+
+    def connect(self) -> pymysql.Connection:
+        return pymysql.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            charset="utf8mb4",
+            connect_timeout=self.connect_timeout,
+        )
+
+    def describe(self) -> str:
+        return f"mysql://{self.host}/{self.database}"
+
+
+def load_backend(name: str | None = None) -> StorageBackend:
+    """환경 변수 기반 backend (load_dotenv 는 호출하는 쪽에서)"""
+    name = name or os.getenv("STORAGE_BACKEND", "mysql")
+    if name == "mysql":
+        return MySQLBackend(
+            host=os.environ.get("HOST"),
+            user=os.environ.get("USER"),
+            password=os.environ.get("PASSWORD"),
+            database=os.environ.get("DATABASE"),
+            connect_timeout=int(os.getenv("DB_CONNECT_TIMEOUT", 5)),
+        )
+    if name == "sqlite":
+        from sqlite_backend import SQLiteBackend     # 선택 backend – mysql 만 쓸 때는 import 하지 않음
+        return SQLiteBackend(
+            os.getenv("SQLITE_PATH", "planit.db"),
+            busy_timeout=float(os.getenv("SQLITE_BUSY_TIMEOUT", 5)),
+        )
+    raise ValueError(f"unknown STORAGE_BACKEND: {name!r} (mysql | sqlite)")
+
+
+__all__ = ["StorageBackend", "MySQLBackend", "load_backend"]
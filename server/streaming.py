@@ -0,0 +1,116 @@
+"""
+streaming.py – Incremental JSON encoders for StreamingResponse
+
+rows batch iterator 를 받아서 바로 bytes 조각으로 내보낸다. 전체 결과를 리스트로 만들지 않음.
+  * json_array : {"<key>": [row, row, ...]}  – 기존 load_* 응답과 같은 모양
+  * ndjson     : 한 줄에 row 하나
+  * gzip_chunks: 위 조각들을 gzip 스트림으로 (/export_team archive)
+  * ndjson_records : 반대 방향 – 업로드 body 조각 → (줄 번호, 값), gzip 이면 자동으로 풀어서
+date / datetime 은 str() (ISO 형식) 로 변환.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence, Tuple
+
+NDJSON = "application/x-ndjson"
+
+
+def _dumps(row: Any) -> str:
+    return json.dumps(row, ensure_ascii=False, default=str, separators=(",", ":"))
+
+
+def json_array(key: str, batches: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    yield ('{"%s":[' % key).encode()
+    first = True
+    for rows in batches:
+        chunk = ",".join(_dumps(row) for row in rows)
+        if not chunk:
+            continue
+        yield ((chunk if first else "," + chunk)).encode()
+        first = False
+    yield b"]}"
+
+
+def ndjson(batches: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    for rows in batches:
+        yield "".join(_dumps(row) + "\n" for row in rows).encode()
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    return bool(accept) and NDJSON in accept
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """조각마다 압축해서 바로 내보낸다 (전체를 모으지 않음). wbits=31 → gzip 헤더 / trailer"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def ndjson_records(
+    chunks: AsyncIterable[bytes], *, max_line: int = 1 << 20
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    request.stream() → (줄 번호, json 값). 빈 줄은 건너뛴다.
+    처음 두 바이트가 gzip magic 이면 풀면서 읽는다 (압축을 풀어도 한 번에 max_line 바이트씩만).
+    잘못된 JSON / gzip, max_line 보다 긴 줄 → ValueError
+    """
+    decompressor = None
+    head = b""
+    buffer = b""
+    lineno = 0
+
+    def lines(data: bytes) -> Iterator[Tuple[int, Any]]:
+        nonlocal buffer, lineno
+        buffer += data
+        *complete, buffer = buffer.split(b"\n")
+        if len(buffer) > max_line:
+            raise ValueError(f"line {lineno + len(complete) + 1}: longer than {max_line} bytes")
+        for line in complete:
+            lineno += 1
+            if line.strip():
+                try:
+                    yield lineno, json.loads(line)
+                except ValueError:
+                    raise ValueError(f"line {lineno}: invalid JSON") from None
+
+    def feed(data: bytes) -> Iterator[Tuple[int, Any]]:
+        if decompressor is None:
+            yield from lines(data)
+            return
+        try:
+            while data:
+                yield from lines(decompressor.decompress(data, max_line))
+                data = decompressor.unconsumed_tail
+        except zlib.error as exc:
+            raise ValueError(f"invalid gzip data: {exc}") from None
+
+    async for chunk in chunks:
+        if head is not None:
+            head += chunk
+            if len(head) < 2:
+                continue
+            if head[:2] == b"\x1f\x8b":
+                decompressor = zlib.decompressobj(47)     # gzip / zlib 헤더 자동 인식
+            chunk, head = head, None
+        for record in feed(chunk):
+            yield record
+    if head:                                        # 1 바이트짜리 body
+        for record in feed(head):
+            yield record
+    if decompressor is not None:
+        for record in lines(decompressor.flush()):
+            yield record
+        if not decompressor.eof:
+            raise ValueError("truncated gzip data")
+    for record in lines(b"\n"):                     # 마지막 줄에 개행이 없을 때
+        yield record
+
+
+__all__ = ["json_array", "ndjson", "gzip_chunks", "ndjson_records", "wants_ndjson", "NDJSON"]
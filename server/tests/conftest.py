@@ -0,0 +1,86 @@
+"""
+pytest 공통 fixture – server.app 전체 경로를 SQLite backend (STORAGE_BACKEND=sqlite) 로 실행한다.
+
+* 테스트마다 새 DB 파일 (tmp_path) + startup / shutdown (TestClient with 블록)
+* 여기 환경 변수가 .env 보다 우선 (load_dotenv 는 이미 있는 값을 덮어쓰지 않는다)
+* 설정을 바꾸는 테스트는 env.setenv(...) 뒤에 TestClient(server.app) 를 직접 연다
+
+    cd server && python -m pytest -q
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import rds  # noqa: E402
+import server  # noqa: E402
+
+ENV = {
+    "STORAGE_BACKEND": "sqlite",
+    "POOL_MIN_SIZE": "1",
+    "POOL_MAX_SIZE": "4",
+    "POOL_TIMEOUT": "2",
+    "STREAM_CONCURRENCY": "0",              # 풀의 절반
+    "CACHE_TTL": "5",
+    "RATE_LIMIT": "0",                      # TestClient 요청은 모두 같은 클라이언트 → 필요한 테스트에서만 켠다
+    "IDEMPOTENCY_SHARED": "1",
+    "WRITE_BEHIND": "0",
+    "TASK_STATS_RECONCILE_SECONDS": "0",
+    "SETTING_REFRESH_SECONDS": "3600",
+    "ADMIN_TOKEN": "",
+    "DRAIN_TIMEOUT": "1",
+}
+
+
+@pytest.fixture
+def env(monkeypatch, tmp_path):
+    for name, value in ENV.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "planit.db"))
+    monkeypatch.setattr(rds, "backend", None)       # init_backend 가 새 파일로 다시 prepare
+    rds.cache.clear()
+    return monkeypatch
+
+
+@pytest.fixture
+def client(env):
+    with TestClient(server.app) as client:
+        yield client
+
+
+@pytest.fixture
+def add_task(client):
+    """팀 할 일 하나 추가 (task_target 기본 = team_name, 개인 할 일은 task_target='')"""
+
+    def add(team_name: str, task_name: str, *, headers: dict | None = None, **fields: Any):
+        body = {
+            "team_name": team_name, "task_name": task_name,
+            "task_start": "2026-03-01", "task_end": "2026-03-31", "task_state": "TODO",
+            "task_color": "0", "task_target": team_name, "user_email": "owner@planit.test",
+            **fields,
+        }
+        response = client.post("/add_task", json=body, headers=headers or {})
+        assert response.status_code == 200, response.text
+        return response
+
+    return add
+
+
+@pytest.fixture
+def add_member(client):
+    def add(team_name: str, user_email: str, *, owner: bool = False):
+        response = client.post("/add_member", json={"team_name": team_name, "user_email": user_email,
+                                                    "user_owner": "1" if owner else "0"})
+        assert response.status_code == 200, response.text
+        return response
+
+    return add
+
@@ -0,0 +1,87 @@
+"""user-024 – /export_team (NDJSON, gzip) → /import_team 왕복, 비어 있지 않은 팀 409, replace, 잘린 archive 400"""
+
+import gzip
+import json
+
+import pytest
+
+LOAD = {"task_target": "", "user_email": "", "hide_done": False}
+
+
+@pytest.fixture
+def seeded(client, add_task, add_member):
+    add_member("alpha", "owner@planit.test", owner=True)
+    add_member("alpha", "kim@planit.test")
+    add_task("alpha", "a", task_state="DONE", task_color="3")
+    add_task("alpha", "b", task_end="2026-04-01")
+    client.post("/add_board", json={"team_name": "alpha", "board_name": "todo", "board_color": "2",
+                                    "card_name": "first", "card_content": "hello"})
+    return client
+
+
+def export(client, **fields):
+    response = client.post("/export_team", json={"team_name": "alpha", **fields})
+    assert response.status_code == 200, response.text
+    return response.content
+
+
+def import_(client, body, **params):
+    return client.post("/import_team", content=body, params=params)
+
+
+def snapshot(client, team_name):
+    tasks = client.post("/load_task", json={"team_name": team_name, **LOAD}).json()["task"]
+    members = client.post("/load_member", json={"team_name": team_name}).json()["member"]
+    cards = client.post("/load_board", json={"team_name": team_name, "board_name": "todo"}).json()["board"]
+    return (sorted((r[2], r[3], r[4], r[5], r[6]) for r in tasks),
+            sorted((r[2], r[3]) for r in members),
+            sorted((r[2], r[3], r[4], r[5]) for r in cards))
+
+
+def test_round_trip_into_other_team(seeded):
+    archive = export(seeded)
+    lines = [json.loads(line) for line in archive.splitlines()]
+    assert lines[0]["kind"] == "team" and lines[-1]["kind"] == "end"
+
+    response = import_(seeded, archive, team_name="beta")
+    assert response.status_code == 200, response.text
+    assert response.json()["imported"] == {"member": 2, "board": 1, "card": 1, "task": 2}
+    assert snapshot(seeded, "beta") == snapshot(seeded, "alpha")
+
+
+def test_gzip_round_trip(seeded):
+    archive = export(seeded, gzip=True)
+    assert archive[:2] == b"\x1f\x8b"
+    assert gzip.decompress(archive) == export(seeded)
+    assert import_(seeded, archive, team_name="beta").status_code == 200
+    assert snapshot(seeded, "beta") == snapshot(seeded, "alpha")
+
+
+def test_non_empty_team_is_409_unless_replace(seeded, add_task):
+    archive = export(seeded)
+    before = snapshot(seeded, "alpha")
+    add_task("alpha", "added after export")
+
+    assert import_(seeded, archive).status_code == 409
+    response = import_(seeded, archive, replace="true")
+    assert response.status_code == 200
+    assert response.json()["replaced"] == {"member": 2, "task": 3, "board": 1, "board_entity": 1}
+    assert snapshot(seeded, "alpha") == before
+
+
+def test_truncated_archive_is_400_with_imported_counts(seeded):
+    archive = export(seeded).splitlines()
+    response = import_(seeded, b"\n".join(archive[:-1]), team_name="beta")     # end 줄 없음
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    assert "truncated" in detail["error"]
+    assert sum(detail["imported"].values()) == len(archive) - 2             # 앞 batch 는 commit 되어 남는다
+
+
+@pytest.mark.parametrize("body", [b"", b'{"kind": "task"}\n', b"not json\n"])
+def test_bad_archive_is_400(client, body):
+    assert import_(client, body, team_name="beta").status_code == 400
+
+
+def test_export_needs_team_name(client):
+    assert client.post("/export_team", json={"team_name": ""}).status_code == 400
@@ -0,0 +1,53 @@
+"""user-006 – /batch_tasks, /batch_cards: 배치 하나 = 트랜잭션 하나"""
+
+import pymysql
+import pytest
+
+LOAD = {"team_name": "alpha", "task_target": "", "user_email": ""}
+
+
+def create(name, **fields):
+    return {"op": "create", "team_name": "alpha", "task_name": name, "task_start": "2026-03-01",
+            "task_end": "2026-03-31", "task_state": "TODO", "task_color": "0", "task_target": "alpha",
+            "user_email": "owner@planit.test", **fields}
+
+
+def load(client):
+    return {row[2]: row for row in client.post("/load_task", json=LOAD).json()["task"]}
+
+
+def test_batch_applies_every_operation(client, add_task):
+    add_task("alpha", "old")
+    response = client.post("/batch_tasks", json={"operations": [
+        create("a"), create("b"),
+        {"op": "update", "team_name": "alpha", "task_name": "a", "task_state": "DOING"},
+        {"op": "delete", "team_name": "alpha", "task_name": "old"},
+    ]})
+    assert response.status_code == 200, response.text
+    assert [item["affected"] for item in response.json()["result"]] == [1, 1, 1, 1]
+    tasks = load(client)
+    assert set(tasks) == {"a", "b"} and tasks["a"][5] == "DOING"
+
+
+def test_invalid_operation_is_rejected_before_any_write(client):
+    response = client.post("/batch_tasks", json={"operations": [create("a"), {"op": "update", "team_name": "alpha",
+                                                                              "task_name": "a"}]})
+    assert response.status_code == 400 and "nothing to update" in response.json()["detail"]
+    assert load(client) == {}
+
+
+def test_database_error_rolls_back_whole_batch(client, add_task):
+    add_task("alpha", "kept")
+    with pytest.raises(pymysql.err.IntegrityError):          # task_state CHECK 위반 (MySQL 은 ENUM)
+        client.post("/batch_tasks", json={"operations": [create("a"), create("b", task_state="BOGUS")]})
+    assert set(load(client)) == {"kept"}
+
+
+def test_batch_cards_moves_card_between_boards(client):
+    response = client.post("/batch_cards", json={"operations": [
+        {"op": "create", "team_name": "alpha", "board_name": "todo", "card_name": "c1", "card_content": "x"},
+        {"op": "update", "team_name": "alpha", "board_name": "todo", "card_name": "c1", "new_board_name": "done"},
+    ]})
+    assert response.status_code == 200, response.text
+    done = client.post("/load_board", json={"team_name": "alpha", "board_name": "done"}).json()["board"]
+    assert [(row[2], row[4]) for row in done] == [("done", "c1")]
@@ -0,0 +1,27 @@
+"""user-009 – benchmark.py 가 fake backend 로 끝까지 돌고 결과 파일을 쓰는지 (짧게)"""
+
+import json
+
+import benchmark
+
+
+def test_fake_backend_run_writes_report(env, tmp_path, capsys):
+    out = tmp_path / "bench.json"
+    code = benchmark.main(["--duration", "0.3", "--clients", "2", "--teams", "1", "--tasks", "5",
+                           "--boards", "1", "--out", str(out)])
+    assert code == 0
+    result = json.loads(out.read_text(encoding="utf-8"))
+    assert result["meta"]["backend"] == "fake"
+    assert "results →" in capsys.readouterr().out
+
+
+def test_compare_flags_regression(env, tmp_path):
+    out = tmp_path / "bench.json"
+    args = ["--duration", "0.2", "--clients", "1", "--teams", "1", "--tasks", "5", "--boards", "1", "--out", str(out)]
+    assert benchmark.main(args) == 0
+    baseline = json.loads(out.read_text(encoding="utf-8"))
+    assert baseline["endpoints"]
+    for stats in baseline["endpoints"].values():            # 기준을 아주 빠르게 → 이번 실행은 회귀
+        stats["p95_ms"] = 1e-3
+    (tmp_path / "base.json").write_text(json.dumps(baseline), encoding="utf-8")
+    assert benchmark.main(args + ["--compare", str(tmp_path / "base.json"), "--threshold", "10"]) == 1
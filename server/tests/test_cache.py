@@ -0,0 +1,42 @@
+"""user-004 – load_* read-through 캐시와 쓰기 무효화"""
+
+from fastapi.testclient import TestClient
+
+import server
+from rds import cache
+
+LOAD = {"team_name": "alpha", "task_target": "", "user_email": ""}
+
+
+def test_repeated_load_is_served_from_cache(client, add_task):
+    add_task("alpha", "first")
+    client.post("/load_task", json=LOAD)
+    hits = cache.stats()["hits"]
+    client.post("/load_task", json=LOAD)
+    assert cache.stats()["hits"] == hits + 1
+
+
+def test_write_invalidates_cached_rows(client, add_task):
+    add_task("alpha", "first")
+    assert len(client.post("/load_task", json=LOAD).json()["task"]) == 1
+    add_task("alpha", "second")
+    assert len(client.post("/load_task", json=LOAD).json()["task"]) == 2
+    client.post("/delete_task", json={"team_name": "alpha", "task_name": "first"})
+    assert [row[2] for row in client.post("/load_task", json=LOAD).json()["task"]] == ["second"]
+
+
+def test_other_team_write_keeps_entry(client, add_task):
+    add_task("alpha", "first")
+    client.post("/load_task", json=LOAD)
+    add_task("beta", "elsewhere")
+    hits = cache.stats()["hits"]
+    client.post("/load_task", json=LOAD)
+    assert cache.stats()["hits"] == hits + 1
+
+
+def test_ttl_zero_disables_cache(env):
+    env.setenv("CACHE_TTL", "0")
+    with TestClient(server.app) as client:
+        client.post("/load_task", json=LOAD)
+        client.post("/load_task", json=LOAD)
+        assert cache.stats()["enabled"] is False and cache.stats()["entries"] == 0
@@ -0,0 +1,135 @@
+"""user-016 – 팀 / 사용자 삭제 cascade: 동기 삭제, background job (202 + /cascade_job), 실패 기록"""
+
+import time
+
+import pytest
+
+import rds
+import server
+
+NOTHING = {"member": 0, "task": 0, "board": 0, "board_entity": 0}
+
+
+def wait_job(client, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/cascade_job/{job_id}").json()
+        if job["state"] in ("done", "failed") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.02)
+
+
+def team_rows(client, team_name="alpha"):
+    tasks = client.post("/load_task", json={"team_name": team_name, "task_target": "", "user_email": ""}).json()
+    members = client.post("/load_member", json={"team_name": team_name}).json()
+    return tasks["task"], members["member"]
+
+
+def seed(client, add_task, add_member):
+    add_member("alpha", "owner@planit.test", owner=True)
+    add_member("alpha", "kim@planit.test")
+    for name in ("a", "b", "c"):
+        add_task("alpha", name)
+    client.post("/add_board", json={"team_name": "alpha", "board_name": "todo", "board_color": "1",
+                                    "card_name": "first", "card_content": ""})
+
+
+def test_delete_team_inline_returns_counts(client, add_task, add_member):
+    seed(client, add_task, add_member)
+    response = client.post("/delete_team", json={"team_name": "alpha"})
+    assert response.status_code == 200
+    assert response.json()["deleted"] == {"member": 2, "task": 3, "board": 1, "board_entity": 1}
+    assert team_rows(client) == ([], [])
+
+
+def test_delete_team_in_background(client, add_task, add_member):
+    seed(client, add_task, add_member)
+    response = client.post("/delete_team", json={"team_name": "alpha", "background": True})
+    assert response.status_code == 202
+    assert response.json()["state"] == "queued"
+
+    job = wait_job(client, response.json()["job_id"])
+    assert (job["kind"], job["target"], job["state"], job["error"]) == ("team", "alpha", "done", None)
+    assert job["deleted"] == 7                          # member 2 + task 3 + card 1 + board 1
+    assert team_rows(client) == ([], [])
+
+
+def test_delete_user_in_background(client, add_task, add_member):
+    client.post("/add_user", json={"user_email": "kim@planit.test", "user_nickname": "kim", "user_image": ""})
+    add_member("alpha", "kim@planit.test")
+    add_task("alpha", "mine", user_email="kim@planit.test")
+
+    response = client.post("/delete_user", json={"user_email": "kim@planit.test", "background": True})
+    assert response.status_code == 202
+    assert wait_job(client, response.json()["job_id"])["state"] == "done"
+
+    tasks, members = team_rows(client)
+    assert members == []
+    assert [(row[2], row[8]) for row in tasks] == [("mine", "")]     # 팀 할 일은 남기고 담당자만 해제
+    assert client.post("/load_user", json={"user_email": "kim@planit.test"}).json()["user"] is None
+
+
+def test_failed_job_is_recorded(client, add_task, env):
+    add_task("alpha", "a")
+
+    def broken(**kwargs):
+        raise RuntimeError("disk full")
+
+    env.setattr(server, "delete_team_from_db", broken)
+    job_id = client.post("/delete_team", json={"team_name": "alpha", "background": True}).json()["job_id"]
+    job = wait_job(client, job_id)
+    assert job["state"] == "failed" and "disk full" in job["error"]
+
+
+def test_unknown_job_is_404(client):
+    assert client.get("/cascade_job/999").status_code == 404
+
+
+def query(sql, *params):
+    connection = rds.backend.connect()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    finally:
+        connection.close()
+
+
+def test_deleting_missing_team_writes_nothing(client, add_task):
+    add_task("alpha", "a")
+    revisions = query("SELECT * FROM revision_table")
+    published = client.get("/event_stats").json()["published"]
+
+    assert client.post("/delete_team", json={"team_name": "nobody"}).json()["deleted"] == NOTHING
+    job_id = client.post("/delete_team", json={"team_name": "nobody", "background": True}).json()["job_id"]
+    job = wait_job(client, job_id)
+    assert (job["state"], job["deleted"]) == ("done", 0)
+
+    assert query("SELECT * FROM revision_table") == revisions
+    assert query("SELECT COUNT(*) FROM tombstone_table") == [(0,)]
+    assert query("SELECT COUNT(*) FROM team_table WHERE team_name=?", "nobody") == [(0,)]
+    assert client.get("/event_stats").json()["published"] == published
+
+
+def test_interrupted_delete_leaves_no_stats_for_deleted_tasks(client, add_task):
+    for name in ("a", "b", "c"):
+        add_task("alpha", name)
+    calls = []
+
+    def stop():                                     # member 1번, task 1번 (2행) 뒤에 멈춤
+        calls.append(1)
+        return len(calls) > 2
+
+    connection = rds.backend.connect()
+    try:
+        with pytest.raises(rds.CascadeInterrupted):
+            rds.delete_team_from_db(connection=connection, cursor=connection.cursor(),
+                                    team_name="alpha", chunk_size=2, stop=stop)
+        assert query("SELECT COUNT(*) FROM task_table") == [(1,)]
+        assert query("SELECT COUNT(*) FROM task_stats_table") == [(0,)]       # 지운 2개가 남아 있지 않음
+
+        rds.reconcile_task_stats_to_db(connection=connection, cursor=connection.cursor(), team_name="alpha")
+    finally:
+        connection.close()
+    stats = client.post("/task_stats", json={"team_name": "alpha"}).json()
+    assert stats["total"] == 1                      # 남은 할 일은 reconcile 이 다시 센다
@@ -0,0 +1,62 @@
+"""user-017 – team_table / board_table 엔티티: team_id · board_id 로 묶고, 응답 행 모양은 그대로"""
+
+import rds
+
+
+def add_card(client, team_name, board_name, card_name, board_color="1"):
+    response = client.post("/add_board", json={"team_name": team_name, "board_name": board_name,
+                                               "board_color": board_color, "card_name": card_name,
+                                               "card_content": ""})
+    assert response.status_code == 200, response.text
+
+
+def cards(client, team_name, board_name):
+    return client.post("/load_board", json={"team_name": team_name, "board_name": board_name}).json()["board"]
+
+
+def query(sql, *params):
+    connection = rds.backend.connect()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+    finally:
+        connection.close()
+
+
+def test_board_color_lives_on_the_board_entity(client):
+    add_card(client, "alpha", "todo", "first", board_color="1")
+    add_card(client, "alpha", "todo", "second", board_color="2")        # 있는 board → 기존 색 유지
+    assert [(row[2], row[3], row[4]) for row in cards(client, "alpha", "todo")] == [
+        ("todo", 1, "first"), ("todo", 1, "second")]
+
+    client.post("/update_board", json={"team_name": "alpha", "board_name": "todo", "board_color": "5"})
+    assert {row[3] for row in cards(client, "alpha", "todo")} == {5}
+    assert query("SELECT COUNT(*) FROM board_table") == [(1,)]
+    assert query("SELECT COUNT(*) FROM card_table") == [(2,)]
+
+
+def test_same_board_name_in_two_teams_is_two_boards(client):
+    add_card(client, "alpha", "todo", "a", board_color="1")
+    add_card(client, "beta", "todo", "b", board_color="2")
+    client.post("/update_board", json={"team_name": "beta", "board_name": "todo", "board_color": "9"})
+
+    assert [(row[1], row[3], row[4]) for row in cards(client, "alpha", "todo")] == [("alpha", 1, "a")]
+    assert [(row[1], row[3], row[4]) for row in cards(client, "beta", "todo")] == [("beta", 9, "b")]
+
+
+def test_team_row_outlives_team_delete(client, add_task):
+    add_task("alpha", "a")
+    [(team_id,)] = query("SELECT id FROM team_table WHERE team_name=?", "alpha")
+    client.post("/delete_team", json={"team_name": "alpha"})
+
+    add_task("alpha", "again")                          # 캐시된 team_id 가 그대로 유효
+    assert query("SELECT id FROM team_table WHERE team_name=?", "alpha") == [(team_id,)]
+    assert query("SELECT team_id FROM task_table") == [(team_id,)]
+
+
+def test_unknown_team_reads_nothing(client, add_task):
+    add_task("alpha", "a")
+    tasks = client.post("/load_task", json={"team_name": "nobody", "task_target": "", "user_email": ""}).json()
+    assert tasks["task"] == [] and cards(client, "nobody", "todo") == []
+    assert query("SELECT COUNT(*) FROM team_table WHERE team_name=?", "nobody") == [(0,)]
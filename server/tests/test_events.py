@@ -0,0 +1,97 @@
+"""user-008 – 팀 변경 알림 (WebSocket), 느린 구독자는 resync 로, Broker 인터페이스"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+from events import RESYNC, Broker, EventHub, LocalBroker, Subscription, UnixSocketBroker, load_broker
+
+
+def test_subscriber_receives_team_changes(client, add_task):
+    with client.websocket_connect("/ws/alpha") as websocket:
+        add_task("beta", "other team")              # 다른 팀 변경은 오지 않는다
+        add_task("alpha", "a")
+        event = websocket.receive_json()
+    assert event == {"team_name": "alpha", "type": "change", "table": "task", "op": "add", "task_name": "a"}
+
+
+def test_personal_tasks_are_not_published(client, add_task):
+    published = client.get("/event_stats").json()["published"]
+    add_task("", "mine", task_target="", user_email="me@planit.test")
+    assert client.get("/event_stats").json()["published"] == published
+
+
+def test_full_queue_collapses_to_resync():
+    sub = Subscription("alpha", maxsize=2)
+    for i in range(3):
+        sub.offer({"type": "change", "i": i})
+    assert sub.dropped == 2
+    assert asyncio.run(sub.get()) == RESYNC
+
+
+def test_broker_is_abstract():
+    with pytest.raises(TypeError):
+        Broker()
+
+    class Incomplete(Broker):
+        async def start(self, deliver):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_socket_broker_fans_out_between_hubs(tmp_path):
+    async def scenario():
+        first, second = EventHub(UnixSocketBroker(str(tmp_path))), EventHub(UnixSocketBroker(str(tmp_path)))
+        await first.start()
+        await second.start()
+        try:                                        # 서로 다른 worker 라고 보고 hub 마다 구독자 하나
+            mine, theirs = first.subscribe("alpha"), second.subscribe("alpha")
+            await first.publish("alpha", {"type": "change", "op": "add"})
+            expected = {"team_name": "alpha", "type": "change", "op": "add"}
+            assert await asyncio.wait_for(mine.get(), 1) == expected
+            assert await asyncio.wait_for(theirs.get(), 1) == expected
+        finally:
+            await first.close()
+            await second.close()
+        assert list(tmp_path.iterdir()) == []
+
+    asyncio.run(scenario())
+
+
+def test_socket_broker_removes_dead_peer(tmp_path):
+    async def scenario():
+        dead = UnixSocketBroker(str(tmp_path))
+        await dead.start(lambda team_name, event: None)
+        dead._loop.remove_reader(dead._socket.fileno())
+        dead._socket.close()                        # 프로세스가 죽어 socket 파일만 남은 상태
+        hub = EventHub(UnixSocketBroker(str(tmp_path)))
+        await hub.start()
+        await hub.publish("alpha", {"type": "change"})
+        assert [path.name for path in tmp_path.iterdir()] == [hub.broker.path.rsplit("/", 1)[1]]
+        await hub.close()
+
+    asyncio.run(scenario())
+
+
+def test_load_broker(monkeypatch, tmp_path):
+    monkeypatch.setenv("EVENT_SOCKET_DIR", str(tmp_path))
+    assert isinstance(load_broker("local"), LocalBroker)
+    broker = load_broker("events:UnixSocketBroker")
+    assert isinstance(broker, UnixSocketBroker) and broker.directory == str(tmp_path)
+    with pytest.raises(TypeError):
+        load_broker("collections:OrderedDict")
+
+
+def test_server_uses_configured_broker(env, tmp_path):
+    env.setenv("EVENT_BROKER", "events:UnixSocketBroker")
+    env.setenv("EVENT_SOCKET_DIR", str(tmp_path / "events"))
+    with TestClient(server.app) as client:
+        assert isinstance(server.hub.broker, UnixSocketBroker)
+        with client.websocket_connect("/ws/alpha") as websocket:
+            client.post("/add_member", json={"team_name": "alpha", "user_email": "a@planit.test", "user_owner": "0"})
+            assert websocket.receive_json()["op"] == "add"
+    assert list((tmp_path / "events").iterdir()) == []
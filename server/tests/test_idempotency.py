@@ -0,0 +1,115 @@
+"""
+user-018 – Idempotency-Key: 같은 key 재시도는 첫 응답 그대로, 다른 body 는 422, DB claim (IDEMPOTENCY_SHARED)
+
+server.idempotency 의 메모리 기록은 프로세스 전체에 남으므로 테스트마다 새 key (uuid) 를 쓴다.
+"""
+
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+import rds
+import server
+
+
+def new_key():
+    return uuid.uuid4().hex
+
+
+def task_body(task_name="write spec", **fields):
+    return {"team_name": "alpha", "task_name": task_name, "task_start": "2026-03-01", "task_end": "2026-03-31",
+            "task_state": "TODO", "task_color": "0", "task_target": "alpha", "user_email": "owner@planit.test",
+            **fields}
+
+
+def task_names(client):
+    tasks = client.post("/load_task", json={"team_name": "alpha", "task_target": "", "user_email": ""}).json()
+    return [row[2] for row in tasks["task"]]
+
+
+def claims(key):
+    connection = rds.backend.connect()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT route, status FROM idempotency_table WHERE idem_key=?", (key,))
+        return cursor.fetchall()
+    finally:
+        connection.close()
+
+
+def test_retry_replays_first_response(client):
+    key = new_key()
+    first = client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key})
+    again = client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key})
+
+    assert first.status_code == again.status_code == 200
+    assert "idempotent-replayed" not in first.headers
+    assert again.headers["idempotent-replayed"] == "true"
+    assert again.json() == first.json()
+    assert task_names(client) == ["write spec"]
+
+
+def test_key_reuse_with_other_body_is_422(client):
+    key = new_key()
+    client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key})
+    response = client.post("/add_task", json=task_body("other"), headers={"Idempotency-Key": key})
+    assert response.status_code == 422
+    assert task_names(client) == ["write spec"]
+
+
+@pytest.mark.parametrize("key", ["", "k" * (server.MAX_KEY_LENGTH + 1)])
+def test_bad_key_is_400(client, key):
+    assert client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key}).status_code == 400
+    assert task_names(client) == []
+
+
+def test_shared_store_claims_in_db_and_replays_after_memory_loss(client):
+    key = new_key()
+    client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key})
+    assert claims(key) == [("/add_task", 200)]          # 쓰기와 같은 트랜잭션에서 claim + 결과 저장
+
+    server.idempotency._done.clear()                    # 다른 worker / 재시작 → DB 의 기록으로 replay
+    again = client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key})
+    assert again.headers["idempotent-replayed"] == "true"
+    assert task_names(client) == ["write spec"]
+
+    server.idempotency._done.clear()
+    assert client.post("/add_task", json=task_body("other"), headers={"Idempotency-Key": key}).status_code == 422
+
+
+def test_claim_in_progress_is_409(client):
+    key = new_key()
+    connection = rds.backend.connect()
+    try:                                                # 다른 worker 가 claim 만 하고 아직 commit 전
+        connection.cursor().execute(
+            "INSERT INTO idempotency_table (route, idem_key, fingerprint, expires_at) "
+            "VALUES ('/add_task', ?, 'x', datetime('now', '+1 hour'))", (key,))
+        connection.commit()
+    finally:
+        connection.close()
+
+    response = client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key})
+    assert response.status_code == 409 and response.headers["retry-after"] == "1"
+    assert task_names(client) == []
+
+
+def test_failed_write_releases_claim(client):
+    key = new_key()
+    with pytest.raises(Exception):                      # NOT NULL 위반 → 500 (TestClient 는 예외를 다시 던진다)
+        client.post("/add_task", json=task_body(task_state=None), headers={"Idempotency-Key": key})
+    assert claims(key) == []
+
+    response = client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key})
+    assert response.status_code == 200 and "idempotent-replayed" not in response.headers
+
+
+def test_memory_only_store(env):
+    env.setenv("IDEMPOTENCY_SHARED", "0")
+    key = new_key()
+    with TestClient(server.app) as client:
+        client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key})
+        again = client.post("/add_task", json=task_body(), headers={"Idempotency-Key": key})
+        assert again.headers["idempotent-replayed"] == "true"
+        assert task_names(client) == ["write spec"]
+        assert claims(key) == []
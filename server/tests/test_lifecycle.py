@@ -0,0 +1,52 @@
+"""user-014 – /healthz, /readyz, SIGTERM 뒤 readiness 먼저 끄기, stream body 가 끝날 때까지 in-flight"""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+import server
+
+LOAD = {"team_name": "alpha", "task_target": "", "user_email": ""}
+
+
+def test_health_and_readiness(client):
+    assert client.get("/healthz").json() == {"status": "ok"}
+    assert client.get("/readyz").json() == {"status": "ready"}
+
+
+def test_draining_rejects_new_requests_but_not_probes(env):
+    with TestClient(server.app) as client:
+        env.setattr(server, "DRAINING", True)
+        response = client.post("/load_task", json=LOAD)
+        assert response.status_code == 503 and response.headers["retry-after"] == "1"
+        assert client.get("/healthz").status_code == 200
+        assert client.get("/readyz").status_code == 503
+        env.setattr(server, "DRAINING", False)
+
+
+def test_sigterm_turns_readiness_off_before_forwarding(client):
+    loop = asyncio.new_event_loop()
+    forwarded = []
+    try:
+        on_sigterm = server.drain_on_sigterm(loop, lambda *args: forwarded.append(args), delay=5)
+        on_sigterm(15, None)
+        assert forwarded == []                                              # uvicorn 은 DRAIN_DELAY 뒤에
+        assert client.get("/readyz").status_code == 503
+        assert client.post("/load_task", json=LOAD).status_code == 200      # 요청은 계속 처리
+        on_sigterm(15, None)                                                # 두 번째 SIGTERM → 바로
+        assert forwarded == [(15, None)]
+    finally:
+        loop.close()
+
+
+def test_stream_counts_as_in_flight_until_body_is_sent(client, env):
+    seen = []
+
+    def stream_task_from_db(*, cursor, **kwargs):
+        for i in range(3):
+            seen.append(server.INFLIGHT)
+            yield [[i, "alpha", f"t{i}", "2026-03-01", "2026-03-02", "TODO", 0, "alpha", "x", 1, ""]]
+
+    env.setattr(server, "stream_task_from_db", stream_task_from_db)
+    assert len(client.post("/stream_task", json=LOAD).json()["task"]) == 3
+    assert seen == [1, 1, 1] and server.INFLIGHT == 0
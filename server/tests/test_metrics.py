@@ -0,0 +1,52 @@
+"""user-010 – rds 쿼리 계측: 함수 라벨, stream 도 같은 라벨 / 시간, 느린 쿼리 로그, /metrics"""
+
+import logging
+
+from fastapi.testclient import TestClient
+
+import server
+from metrics import DB_CALL_SECONDS, DB_QUERY_SECONDS
+
+LOAD = {"team_name": "alpha", "task_target": "", "user_email": ""}
+
+
+def observed(histogram, *labels):
+    """Histogram 의 해당 라벨 관측 수 (render 출력의 _count 줄)"""
+    prefix = histogram.name + "_count{" + ",".join(
+        f'{name}="{value}"' for name, value in zip(histogram.labelnames, labels))
+    for line in histogram.render():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_queries_are_labelled_with_rds_function(client, add_task):
+    add_task("alpha", "a")
+    before = observed(DB_QUERY_SECONDS, "load_task_from_db", "execute")
+    client.post("/load_task", json=LOAD)
+    assert observed(DB_QUERY_SECONDS, "load_task_from_db", "execute") > before
+    text = client.get("/metrics").text
+    assert 'planit_db_call_seconds_count{function="load_task_from_db"}' in text
+    assert 'planit_http_request_seconds_count{method="POST",route="/load_task",status="200"}' in text
+
+
+def test_streamed_queries_keep_function_label_and_call_time(client, add_task):
+    add_task("alpha", "a")
+    calls = observed(DB_CALL_SECONDS, "stream_task_from_db")
+    queries = observed(DB_QUERY_SECONDS, "stream_task_from_db", "fetch")
+    unlabelled = observed(DB_QUERY_SECONDS, "-", "fetch")
+
+    assert client.post("/stream_task", json=LOAD).status_code == 200
+    client.post("/export_team", json={"team_name": "alpha"})
+
+    assert observed(DB_CALL_SECONDS, "stream_task_from_db") == calls + 1
+    assert observed(DB_QUERY_SECONDS, "stream_task_from_db", "fetch") > queries
+    assert observed(DB_CALL_SECONDS, "export_team_from_db") >= 1
+    assert observed(DB_QUERY_SECONDS, "-", "fetch") == unlabelled
+
+
+def test_slow_queries_are_logged(env, caplog):
+    env.setenv("SLOW_QUERY_MS", "0")
+    with TestClient(server.app) as client, caplog.at_level(logging.WARNING, logger="planit.sql"):
+        client.post("/load_task", json=LOAD)
+    assert any('"function": "load_task_from_db"' in record.getMessage() for record in caplog.records)
@@ -0,0 +1,43 @@
+"""user-003 – migrations 쌍 / 번호, EXPLAIN 검사 (rds.SQL_* 그대로) 와 sqlite.sql 인덱스"""
+
+import re
+
+import rds
+from migrate import EXPLAIN_CHECKS, discover
+from sqlite_backend import SCHEMA_PATH
+
+
+def test_migrations_are_numbered_without_gaps():
+    versions = [migration.version for migration in discover()]
+    assert versions == list(range(1, len(versions) + 1))
+
+
+def test_sqlite_schema_header_names_latest_migration():
+    latest = discover()[-1].version
+    assert re.search(rf"0001–{latest:04d}", SCHEMA_PATH.read_text(encoding="utf-8"))
+
+
+def test_sqlite_schema_has_explain_check_indexes(env):
+    connection = rds.init_backend().connect()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        indexes = {name for (name,) in cursor.fetchall()}
+    finally:
+        connection.close()
+    expected = {index for *_, names in EXPLAIN_CHECKS for index in names if index != "PRIMARY"}
+    assert expected <= indexes, expected - indexes
+
+
+def test_explain_checks_run_the_registered_statements(env):
+    connection = rds.init_backend().connect()
+    try:
+        cursor = connection.cursor()
+        for check in EXPLAIN_CHECKS:
+            assert any(check.statement is value for value in vars(rds).values()), check.label
+            cursor.execute("EXPLAIN QUERY PLAN " + check.sql, check.params)     # 자리 수가 틀리면 여기서 실패
+            plan = " | ".join(row[-1] for row in cursor.fetchall())
+            names = [name.replace("PRIMARY", "PRIMARY KEY") for name in check.expected]
+            assert any(name in plan for name in names), f"{check.label}: {plan}"
+    finally:
+        connection.close()
@@ -0,0 +1,85 @@
+"""user-020 – load_* 응답 인코딩: columnar / msgpack (Accept), gzip (Accept-Encoding), Vary"""
+
+import gzip
+
+import pytest
+from fastapi.testclient import TestClient
+
+import payload
+import server
+from payload import COLUMNAR, JSON, MSGPACK, PayloadEncoder
+
+LOAD = {"team_name": "alpha", "task_target": "", "user_email": ""}
+
+
+def load(client, **headers):
+    response = client.post("/load_task", json=LOAD, headers=headers)
+    assert response.status_code == 200, response.text
+    return response
+
+
+def test_columnar_has_same_rows_as_json(client, add_task):
+    add_task("alpha", "a")
+    add_task("alpha", "b")
+    plain = load(client).json()
+    columnar = load(client, accept=COLUMNAR)
+
+    assert columnar.headers["content-type"] == COLUMNAR
+    assert columnar.headers["vary"] == "Accept, Accept-Encoding"
+    document = columnar.json()
+    assert document["columns"][:3] == ["id", "team_name", "task_name"]
+    assert document["rows"] == plain["task"]
+    assert {k: v for k, v in document.items() if k not in ("columns", "rows")} == \
+           {k: v for k, v in plain.items() if k != "task"}
+
+
+def test_msgpack(client, add_task):
+    msgpack = pytest.importorskip("msgpack")
+    add_task("alpha", "a")
+    response = load(client, accept=MSGPACK)
+    assert response.headers["content-type"] == MSGPACK
+    assert msgpack.unpackb(response.content)["rows"] == load(client).json()["task"]
+
+
+def test_msgpack_without_package_falls_back_to_json(client, add_task, env):
+    env.setattr(payload, "msgpack", None)
+    add_task("alpha", "a")
+    response = load(client, accept=MSGPACK)
+    assert response.headers["content-type"] == JSON
+    assert [row[2] for row in response.json()["task"]] == ["a"]
+
+
+def test_gzip_only_above_min_bytes(env):
+    env.setenv("COMPRESS_MIN_BYTES", "200")
+    with TestClient(server.app) as client:
+        small = load(client, **{"accept-encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+
+        for i in range(5):
+            client.post("/add_task", json={**LOAD, "task_name": f"task {i}", "task_start": "2026-03-01",
+                                           "task_end": "2026-03-31", "task_state": "TODO", "task_color": "0",
+                                           "task_target": "alpha", "user_email": "owner@planit.test"})
+        large = load(client, **{"accept-encoding": "gzip"})
+        assert large.headers["content-encoding"] == "gzip"
+        assert len(large.json()["task"]) == 5           # httpx 가 풀어서 돌려준다
+        assert load(client, **{"accept-encoding": "identity"}).headers.get("content-encoding") is None
+
+
+@pytest.mark.parametrize("accept, media", [
+    (None, JSON),
+    ("*/*", JSON),
+    (COLUMNAR, COLUMNAR),
+    (f"{JSON}, {COLUMNAR};q=0.5", JSON),                # JSON 보다 q 가 낮으면 JSON
+    (f"{JSON};q=0.5, {COLUMNAR}", COLUMNAR),
+    (f"{COLUMNAR};q=0", JSON),
+])
+def test_media_type_negotiation(accept, media):
+    assert PayloadEncoder().media_type(accept) == media
+
+
+def test_gzip_body_is_deterministic():
+    encoder = PayloadEncoder(min_bytes=0)
+    body, _, headers = encoder.render("task", ["id"], [[1]] * 50, {}, accept=None, accept_encoding="gzip;q=1, br;q=0")
+    assert headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == b'{"task":' + b"[" + b",".join([b"[1]"] * 50) + b"]}"
+    assert encoder.render("task", ["id"], [[1]] * 50, {}, accept=None, accept_encoding="gzip")[0] == body
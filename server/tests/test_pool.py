@@ -0,0 +1,46 @@
+"""user-001 – 커넥션 풀: 재사용, 상한 + timeout, 반환 시 rollback, close"""
+
+import pytest
+
+import rds
+from pool import ConnectionPool, PoolClosed, PoolTimeout
+
+
+@pytest.fixture
+def pool(env):
+    pool = ConnectionPool(connect=rds.init_backend().connect, min_size=1, max_size=2, timeout=0.2)
+    yield pool
+    pool.close()
+
+
+def test_connection_is_reused(pool):
+    with pool.acquire() as (first, _):
+        pass
+    with pool.acquire() as (second, _):
+        pass
+    assert first is second
+    assert pool.size == 1
+
+
+def test_checkout_times_out_at_max_size(pool):
+    with pool.acquire(), pool.acquire():
+        assert pool.size == 2 and pool.idle == 0
+        with pytest.raises(PoolTimeout):
+            with pool.acquire():
+                pass
+    assert pool.idle == 2
+
+
+def test_release_rolls_back_uncommitted_work(pool):
+    with pool.acquire() as (_, cursor):
+        cursor.execute("INSERT INTO team_table (team_name) VALUES (?)", ("left open",))
+    with pool.acquire() as (_, cursor):
+        cursor.execute("SELECT COUNT(*) FROM team_table WHERE team_name=?", ("left open",))
+        assert cursor.fetchone() == (0,)
+
+
+def test_closed_pool_refuses_checkout(pool):
+    pool.close()
+    with pytest.raises(PoolClosed):
+        with pool.acquire():
+            pass
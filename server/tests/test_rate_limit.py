@@ -0,0 +1,64 @@
+"""user-019 – 사용자별 token bucket (429 + Retry-After), 팀 동시 처리 수 상한, stream 은 body 끝까지 슬롯 유지"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+LOAD = {"team_name": "alpha", "task_target": "", "user_email": ""}
+ROW = [1, "alpha", "t", "2026-03-01", "2026-03-02", "TODO", 0, "alpha", "x", 1, ""]
+
+
+@pytest.fixture
+def limited(env):
+    env.setenv("RATE_LIMIT", "1")
+    env.setenv("TEAM_CONCURRENCY", "1")
+    env.setenv("RATE_LIMIT_ROUTES", "/load_task=1:1,*=100:100")
+    with TestClient(server.app) as client:
+        yield client
+
+
+def test_exhausted_budget_is_429_with_retry_after(limited):
+    assert limited.post("/load_task", json=LOAD).status_code == 200
+    response = limited.post("/load_task", json=LOAD)
+    assert response.status_code == 429
+    assert response.json()["reason"] == "rate" and response.headers["retry-after"] == "1"
+    assert limited.post("/load_member", json={"team_name": "alpha"}).status_code == 200   # route 별 bucket
+
+
+def test_health_paths_are_exempt(limited):
+    for _ in range(3):
+        assert limited.get("/healthz").status_code == 200
+        assert limited.get("/readyz").status_code == 200
+        assert limited.get("/metrics").status_code == 200
+
+
+def test_stream_holds_team_slot_until_body_is_sent(limited, env):
+    seen = []
+
+    def stream_task_from_db(*, cursor, **kwargs):
+        for _ in range(3):
+            seen.append(server.limiter.stats()["active_requests"])
+            yield [ROW]
+
+    env.setattr(server, "stream_task_from_db", stream_task_from_db)
+    assert len(limited.post("/stream_task", json=LOAD).json()["task"]) == 3
+    assert seen == [1, 1, 1]
+    assert server.limiter.stats()["active_requests"] == 0
+
+
+def test_second_request_for_busy_team_is_429(limited, env):
+    during = []
+
+    def stream_task_from_db(*, cursor, **kwargs):
+        yield [ROW]                                     # 첫 batch 를 보낸 뒤 같은 팀으로 다른 요청
+        during.append(limited.post("/load_member", json={"team_name": "alpha"}))
+        during.append(limited.post("/load_member", json={"team_name": "beta"}))
+        yield [ROW]
+
+    env.setattr(server, "stream_task_from_db", stream_task_from_db)
+    assert limited.post("/stream_task", json=LOAD).status_code == 200
+    busy, other = during
+    assert busy.status_code == 429 and busy.json()["reason"] == "team_concurrency"
+    assert other.status_code == 200
+    assert limited.post("/load_member", json={"team_name": "alpha"}).status_code == 200
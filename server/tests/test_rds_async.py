@@ -0,0 +1,62 @@
+"""user-002 – AsyncDB: rds 함수를 전용 thread pool 에서, connection / cursor 주입"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import rds
+from rds_async import AsyncDB
+
+
+@pytest.fixture
+def db(env):
+    env.setenv("POOL_MAX_SIZE", "4")
+    pool = rds.init_pool()
+    db = AsyncDB(pool)
+    yield db
+    db.close()
+    pool.close()
+
+
+def where(*, cursor):
+    cursor.execute("SELECT 1")
+    return threading.current_thread().name, cursor.fetchone()
+
+
+def with_connection(*, connection, cursor):
+    return connection is not None and cursor is not None
+
+
+def slow(*, cursor, seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def test_call_runs_on_rds_thread_with_cursor(db):
+    name, row = asyncio.run(db.call(where))
+    assert name.startswith("rds") and row == (1,)
+
+
+def test_connection_injected_only_when_wanted(db):
+    assert asyncio.run(db.call(with_connection)) is True
+
+
+def test_calls_run_concurrently_off_the_event_loop(db):
+    async def main():
+        started = time.perf_counter()
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while time.perf_counter() - started < 0.15:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(tick(), *(db.call(slow, seconds=0.2) for _ in range(4)))
+        return time.perf_counter() - started, ticks
+
+    elapsed, ticks = asyncio.run(main())
+    assert elapsed < 0.6                    # 4 × 0.2s 가 직렬이면 0.8s
+    assert ticks > 5                        # 그동안 event loop 는 계속 돈다
@@ -0,0 +1,41 @@
+"""user-013 – /load_setting 미리 만든 본문 + ETag / 304, /reload_setting 키 회전"""
+
+from fastapi.testclient import TestClient
+
+import rds
+import server
+
+
+def rotate_keys(kakao, google):
+    connection = rds.init_backend().connect()
+    try:
+        connection.cursor().execute("UPDATE setting_table SET kakao_key=?, google_key=?", (kakao, google))
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def test_etag_round_trip_returns_304(client):
+    first = client.post("/load_setting")
+    assert first.status_code == 200 and first.json() == {"kakao": "", "google": ""}
+    again = client.post("/load_setting", headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["etag"] == first.headers["etag"]
+
+
+def test_reload_requires_admin_token(client):
+    assert client.post("/reload_setting").status_code == 403          # ADMIN_TOKEN 비어 있음 → 항상 거부
+
+
+def test_reload_picks_up_rotated_keys(env):
+    env.setenv("ADMIN_TOKEN", "s3cret")
+    with TestClient(server.app) as client:
+        etag = client.post("/load_setting").headers["etag"]
+        rotate_keys("k-new", "g-new")
+        assert client.post("/reload_setting", headers={"X-Admin-Token": "wrong"}).status_code == 403
+        reloaded = client.post("/reload_setting", headers={"X-Admin-Token": "s3cret"}).json()
+        assert reloaded["changed"] is True
+        assert client.post("/reload_setting", headers={"X-Admin-Token": "s3cret"}).json()["changed"] is False
+
+        response = client.post("/load_setting", headers={"If-None-Match": etag})
+        assert response.status_code == 200 and response.json() == {"kakao": "k-new", "google": "g-new"}
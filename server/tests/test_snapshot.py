@@ -0,0 +1,24 @@
+"""user-005 – /load_team_snapshot: 할 일 + board (card 묶음) + 멤버를 한 번에"""
+
+
+def test_snapshot_returns_tasks_boards_and_members(client, add_task, add_member):
+    add_member("alpha", "owner@planit.test", owner=True)
+    add_task("alpha", "team task")
+    add_task("beta", "mine", task_target="", user_email="owner@planit.test")
+    for card in ("c1", "c2"):
+        client.post("/add_board", json={"team_name": "alpha", "board_name": "todo", "board_color": "3",
+                                         "card_name": card, "card_content": "..."})
+
+    snapshot = client.post("/load_team_snapshot", json={"team_name": "alpha", "task_target": "",
+                                                        "user_email": "owner@planit.test"}).json()
+
+    assert {row[2] for row in snapshot["task"]} == {"team task", "mine"}
+    assert [(group["board_name"], group["board_color"]) for group in snapshot["board"]] == [("todo", 3)]
+    assert sorted(row[4] for row in snapshot["board"][0]["card"]) == ["c1", "c2"]
+    assert [row[2] for row in snapshot["member"]] == ["owner@planit.test"]
+
+
+def test_snapshot_of_unknown_team_is_empty(client):
+    snapshot = client.post("/load_team_snapshot", json={"team_name": "nobody", "task_target": "x",
+                                                        "user_email": "x"}).json()
+    assert snapshot == {"task": [], "board": [], "member": []}
@@ -0,0 +1,62 @@
+"""user-021 – SQLite backend: 스키마 준비, pymysql 호환 동작, 엔드포인트 왕복"""
+
+import pymysql
+import pytest
+
+import rds
+from fastapi.testclient import TestClient
+
+import server
+
+
+def test_prepare_is_idempotent(env):
+    backend = rds.init_backend()
+    backend.prepare()                                   # 두 번째 실행도 그대로 (IF NOT EXISTS)
+    assert backend.describe().startswith("sqlite:///")
+
+
+def test_unique_violation_maps_to_pymysql_duplicate_key(env):
+    connection = rds.init_backend().connect()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("INSERT INTO team_table (team_name) VALUES (?)", ("alpha",))
+        connection.commit()
+        with pytest.raises(pymysql.err.IntegrityError) as error:
+            cursor.execute("INSERT INTO team_table (team_name) VALUES (?)", ("alpha",))
+        assert error.value.args[0] == 1062
+        connection.rollback()
+    finally:
+        connection.close()
+
+
+def test_rollback_discards_uncommitted_write(env):
+    connection = rds.init_backend().connect()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("INSERT INTO team_table (team_name) VALUES (?)", ("beta",))
+        connection.rollback()
+        cursor.execute("SELECT COUNT(*) FROM team_table WHERE team_name=?", ("beta",))
+        assert cursor.fetchone() == (0,)
+    finally:
+        connection.close()
+
+
+def test_endpoints_round_trip(client, add_task, add_member):
+    add_member("alpha", "owner@planit.test", owner=True)
+    add_task("alpha", "write spec")
+    add_task("alpha", "review", task_end="2026-03-10")
+
+    tasks = client.post("/load_task", json={"team_name": "alpha", "task_target": "", "user_email": ""}).json()["task"]
+    assert {row[2] for row in tasks} == {"write spec", "review"}
+    assert client.post("/load_member", json={"team_name": "alpha"}).json()["member"][0][2] == "owner@planit.test"
+
+
+def test_data_survives_restart(env):
+    body = {"team_name": "alpha", "task_name": "persisted", "task_start": "2026-03-01", "task_end": "2026-03-02",
+            "task_state": "TODO", "task_color": "0", "task_target": "alpha", "user_email": "owner@planit.test"}
+    with TestClient(server.app) as client:
+        assert client.post("/add_task", json=body).status_code == 200
+    rds.cache.clear()
+    with TestClient(server.app) as client:              # 같은 파일로 다시 startup
+        tasks = client.post("/load_task", json={"team_name": "alpha", "task_target": "", "user_email": ""}).json()
+    assert [row[2] for row in tasks["task"]] == ["persisted"]
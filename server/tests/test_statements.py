@@ -0,0 +1,58 @@
+"""user-015 – Statement registry: 테이블 whitelist, 조각 compile, 방언 전환"""
+
+import pytest
+
+import statements
+from statements import Statement, check_table, use_dialect
+
+
+@pytest.fixture
+def mysql():
+    before = statements.dialect()
+    use_dialect("mysql")
+    yield
+    use_dialect(before)
+
+
+def test_unknown_table_is_rejected(mysql):
+    with pytest.raises(ValueError):
+        check_table("user_table; DROP TABLE user_table")
+    with pytest.raises(ValueError):
+        Statement("SELECT * FROM {table}", table="not_a_table")
+    load = Statement("SELECT * FROM {table} WHERE user_email=%s", table="user_table")
+    with pytest.raises(ValueError):
+        load["secret_table"]
+
+
+def test_default_table_compiled_at_import(mysql):
+    load = Statement("SELECT *   FROM {table}\n  WHERE user_email=%s", table="user_table")
+    assert load.sql == "SELECT * FROM user_table WHERE user_email=%s"
+    assert load["member_table"] == "SELECT * FROM member_table WHERE user_email=%s"
+    assert load[None] == load.sql                       # table 없이 부르면 기본 테이블
+
+
+def test_fragments_need_tuple_key_and_warm(mysql):
+    owners = Statement("SELECT id FROM {table} WHERE {where}", table="task_table").warm(where=("a=%s", "b=%s"))
+    assert ("task_table", "a=%s") in owners and ("task_table", "b=%s") in owners
+    assert owners["task_table", "c=%s"] == "SELECT id FROM task_table WHERE c=%s"
+    with pytest.raises(TypeError):
+        owners["task_table"]
+
+
+def test_sqlite_template_needs_same_fragments():
+    with pytest.raises(ValueError):
+        Statement("UPDATE {table} SET {sets}", sqlite="UPDATE {table} SET x=1", table="task_table")
+
+
+def test_use_dialect_recompiles_registry(mysql):
+    upsert = Statement("INSERT INTO {table} (a) VALUES (%s) ON DUPLICATE KEY UPDATE a=%s",
+                       sqlite="INSERT INTO {table} (a) VALUES (?1) ON CONFLICT DO UPDATE SET a=?2", table="team_table")
+    plain = Statement("SELECT * FROM {table} WHERE a=%s AND b=%s", table="team_table")
+    use_dialect("sqlite")
+    assert upsert.sql == "INSERT INTO team_table (a) VALUES (?1) ON CONFLICT DO UPDATE SET a=?2"
+    assert plain.sql == "SELECT * FROM team_table WHERE a=? AND b=?"
+    assert plain["user_table"] == "SELECT * FROM user_table WHERE a=? AND b=?"
+    use_dialect("mysql")
+    assert plain.sql.endswith("a=%s AND b=%s")
+    with pytest.raises(ValueError):
+        use_dialect("postgres")
@@ -0,0 +1,58 @@
+"""user-012 – /stream_task, /stream_member (JSON 배열 / NDJSON) + 동시 stream 상한"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+from pool import PoolTimeout
+from rds import stream_task_from_db
+
+LOAD = {"team_name": "alpha", "task_target": "", "user_email": ""}
+
+
+def test_stream_task_matches_load_task(client, add_task, env):
+    env.setattr(server, "STREAM_BATCH_SIZE", 2)             # batch 여러 개에 걸쳐서
+    for i in range(5):
+        add_task("alpha", f"t{i}")
+    streamed = client.post("/stream_task", json=LOAD).json()["task"]
+    loaded = client.post("/load_task", json=LOAD).json()["task"]
+    assert sorted(row[0] for row in streamed) == sorted(row[0] for row in loaded) and len(streamed) == 5
+
+
+def test_ndjson_is_one_row_per_line(client, add_member):
+    for i in range(3):
+        add_member("alpha", f"u{i}@planit.test")
+    response = client.post("/stream_member", json={"team_name": "alpha"}, headers={"Accept": "application/x-ndjson"})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row[2] for row in rows) == ["u0@planit.test", "u1@planit.test", "u2@planit.test"]
+
+
+def test_empty_stream_is_valid_json(client):
+    assert client.post("/stream_task", json={**LOAD, "team_name": "nobody"}).json() == {"task": []}
+
+
+def test_concurrent_streams_are_capped_and_leave_room_for_calls(env):
+    env.setenv("STREAM_CONCURRENCY", "1")
+    env.setenv("POOL_TIMEOUT", "0.2")
+    with TestClient(server.app) as client:
+        for name in ("a", "b"):
+            client.post("/add_task", json={**LOAD, "task_name": name, "task_start": "2026-03-01",
+                                           "task_end": "2026-03-02", "task_state": "TODO", "task_color": "0",
+                                           "task_target": "alpha", "user_email": "x"})
+        assert server.db.max_streams == 1
+        held = server.db.stream(stream_task_from_db, batch_size=1, **LOAD)
+        assert len(next(held)) == 1                         # 첫 batch 뒤 열어 둔 채로 자리 + 커넥션 점유
+        try:
+            with pytest.raises(PoolTimeout):
+                next(server.db.stream(stream_task_from_db, batch_size=1, **LOAD))
+            assert client.post("/load_task", json=LOAD).status_code == 200     # db.call 은 그대로
+        finally:
+            held.close()                                    # 클라이언트가 끊긴 것과 같음 → 자리 반환
+        assert len(client.post("/stream_task", json=LOAD).json()["task"]) == 2
+
+
+def test_default_cap_is_half_the_pool(client):
+    assert server.db.max_streams == max(1, server.pool.max_size // 2)
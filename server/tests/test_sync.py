@@ -0,0 +1,59 @@
+"""user-007 – 팀 revision + /sync delta (변경 행, tombstone, 정리된 구간은 reset)"""
+
+import rds
+
+
+def sync(client, since, team_name="alpha"):
+    response = client.post("/sync", json={"team_name": team_name, "since": since})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_first_sync_is_a_full_reset(client, add_task):
+    add_task("alpha", "a")
+    add_task("alpha", "b")
+    changes = sync(client, 0)
+    assert changes["reset"] is True and changes["revision"] == 2
+    assert {row[2] for row in changes["task"]} == {"a", "b"}
+
+
+def test_delta_returns_only_changes_since_cursor(client, add_task):
+    add_task("alpha", "a")
+    add_task("alpha", "b")
+    cursor = sync(client, 0)["revision"]
+
+    client.post("/update_task", json={"team_name": "alpha", "task_name": "a", "task_state": "DONE"})
+    changes = sync(client, cursor)
+    assert changes["reset"] is False and changes["revision"] == cursor + 1
+    assert [(row[2], row[5]) for row in changes["task"]] == [("a", "DONE")]
+    assert sync(client, changes["revision"])["task"] == []
+
+
+def test_deleted_rows_come_back_as_tombstones(client, add_task):
+    add_task("alpha", "a")
+    task_id = sync(client, 0)["task"][0][0]
+    cursor = sync(client, 0)["revision"]
+
+    client.post("/delete_task", json={"team_name": "alpha", "task_name": "a"})
+    changes = sync(client, cursor)
+    assert changes["task"] == []
+    assert [(table, row_id) for table, row_id, _ in changes["deleted"]] == [("task_table", task_id)]
+
+
+def test_cursor_older_than_pruned_tombstones_resets(client, add_task):
+    add_task("alpha", "a")
+    add_task("alpha", "b")
+    cursor = sync(client, 0)["revision"]
+    client.post("/delete_task", json={"team_name": "alpha", "task_name": "a"})
+
+    connection = rds.init_backend().connect()
+    try:
+        db_cursor = connection.cursor()
+        db_cursor.execute("UPDATE tombstone_table SET deleted_at = '2000-01-01 00:00:00'")
+        connection.commit()
+        assert rds.prune_tombstones_from_db(connection=connection, cursor=db_cursor, older_than_days=30) == 1
+    finally:
+        connection.close()
+
+    changes = sync(client, cursor)
+    assert changes["reset"] is True and [row[2] for row in changes["task"]] == ["b"]
@@ -0,0 +1,48 @@
+"""user-011 – /load_task keyset 페이지 (task_end, id) + 기간 필터"""
+
+BASE = {"team_name": "alpha", "task_target": "", "user_email": "me@planit.test"}
+
+
+def page(client, **fields):
+    response = client.post("/load_task", json={**BASE, **fields})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    return [row[2] for row in body["task"]], body.get("next")
+
+
+def seed(add_task):
+    for i, day in enumerate((5, 1, 3, 3, 9)):
+        add_task("alpha", f"d{day}-{i}", task_end=f"2026-03-{day:02d}")
+    add_task("alpha", "done", task_end="2026-03-02", task_state="DONE")
+    add_task("", "mine", task_target="", user_email="me@planit.test", task_end="2026-03-04")
+
+
+def test_pages_walk_in_task_end_order_without_gaps(client, add_task):
+    seed(add_task)
+    seen, cursor = [], {}
+    while True:
+        names, cursor = page(client, limit=2, **cursor)
+        seen += names
+        if cursor is None:
+            break
+    assert seen == ["d1-1", "d3-2", "d3-3", "mine", "d5-0", "d9-4"]
+
+
+def test_limit_is_clamped_and_next_is_last_row(client, add_task):
+    seed(add_task)
+    names, cursor = page(client, limit=0)                   # 최소 1
+    assert names == ["d1-1"] and cursor["after_end"] == "2026-03-01"
+
+
+def test_window_and_archive_filters(client, add_task):
+    seed(add_task)
+    names, _ = page(client, limit=50, window_start="2026-03-03", window_end="2026-03-01")
+    assert names == ["d3-2", "d3-3", "mine", "d5-0", "d9-4"]
+    names, _ = page(client, limit=50, hide_done=False, window_start="2026-03-02")
+    assert names[0] == "done"
+
+
+def test_without_limit_returns_everything(client, add_task):
+    seed(add_task)
+    names, cursor = page(client)
+    assert sorted(names) == sorted(["d1-1", "d3-2", "d3-3", "mine", "d5-0", "d9-4"]) and cursor is None
@@ -0,0 +1,91 @@
+"""user-023 – /task_stats: task_stats_table 요약 (상태별, 기한 지남 / 임박), 증분 갱신, reconcile 보정"""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import rds
+import server
+
+TODAY = "2026-03-15"
+
+
+def stats(client, team_name="alpha", **fields):
+    response = client.post("/task_stats", json={"team_name": team_name, "today": TODAY, **fields})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def seed(add_task):
+    add_task("alpha", "late", task_end="2026-03-10")                         # overdue
+    add_task("alpha", "soon", task_end="2026-03-20", task_state="DOING")     # due_soon (7일 안)
+    add_task("alpha", "later", task_end="2026-04-30")
+    add_task("alpha", "finished", task_end="2026-03-01", task_state="DONE")  # DONE 은 기한 계산에서 제외
+    add_task("beta", "other team")
+
+
+def corrupt(sql, *params):
+    connection = rds.backend.connect()
+    try:
+        connection.cursor().execute(sql, params)
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def test_counts_by_state_and_due_date(client, add_task):
+    seed(add_task)
+    result = stats(client)
+    assert result["state"] == {"TODO": 2, "DOING": 1, "DONE": 1} and result["total"] == 4
+    assert (result["overdue"], result["due_soon"]) == (1, 1)
+    assert (result["today"], result["due_until"]) == (TODAY, "2026-03-22")
+    assert stats(client, due_days=60)["due_soon"] == 2
+
+
+def test_writes_update_stats(client, add_task):
+    seed(add_task)
+    stats(client)                                       # 캐시된 뒤에도 쓰기가 무효화
+    client.post("/update_task", json={"team_name": "alpha", "task_name": "late", "task_state": "DONE"})
+    client.post("/delete_task", json={"team_name": "alpha", "task_name": "later"})
+    result = stats(client)
+    assert result["state"] == {"TODO": 0, "DOING": 1, "DONE": 2}
+    assert result["overdue"] == 0
+
+    client.post("/delete_team", json={"team_name": "alpha"})
+    assert stats(client)["total"] == 0
+
+
+@pytest.mark.parametrize("body", [{"team_name": ""}, {"team_name": "alpha", "today": "15/03/2026"}])
+def test_bad_request_is_400(client, body):
+    assert client.post("/task_stats", json=body).status_code == 400
+
+
+def test_reconcile_fixes_drift(client, add_task):
+    seed(add_task)
+    corrupt("UPDATE task_stats_table SET task_count = task_count + 5 WHERE task_state='TODO'")
+    corrupt("DELETE FROM task_stats_table WHERE task_state='DONE'")
+    rds.cache.clear()
+    assert stats(client)["state"]["TODO"] == 12         # alpha + beta 모두 어긋남
+
+    connection = rds.backend.connect()
+    try:
+        result = rds.reconcile_task_stats_to_db(connection=connection, cursor=connection.cursor())
+    finally:
+        connection.close()
+    assert result == {"teams": 2, "fixed": 2}
+    assert stats(client)["state"] == {"TODO": 2, "DOING": 1, "DONE": 1}
+    assert stats(client, "beta")["state"]["TODO"] == 1
+
+
+def test_background_reconciler(env):
+    env.setenv("TASK_STATS_RECONCILE_SECONDS", "0.05")
+    with TestClient(server.app) as client:
+        client.post("/add_task", json={"team_name": "alpha", "task_name": "a", "task_start": "2026-03-01",
+                                       "task_end": "2026-03-31", "task_state": "TODO", "task_color": "0",
+                                       "task_target": "alpha", "user_email": "owner@planit.test"})
+        corrupt("UPDATE task_stats_table SET task_count = 9")
+        deadline = time.monotonic() + 5
+        while stats(client)["total"] != 1 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert stats(client)["total"] == 1
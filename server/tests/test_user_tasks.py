@@ -0,0 +1,75 @@
+"""user-025 – /load_user_task: 사용자의 모든 팀 할 일 + 개인 할 일을 (task_end, id) keyset 페이지로"""
+
+import pytest
+
+ME = "kim@planit.test"
+
+
+def load(client, **fields):
+    response = client.post("/load_user_task", json={"user_email": ME, **fields})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def names(page):
+    return [row[2] for row in page["task"]]
+
+
+@pytest.fixture
+def seeded(client, add_task, add_member):
+    add_member("alpha", ME)
+    add_member("beta", ME)
+    add_task("alpha", "alpha mine", task_end="2026-03-05", user_email=ME)
+    add_task("alpha", "alpha theirs", task_end="2026-03-10")
+    add_task("beta", "beta done", task_end="2026-03-07", task_state="DONE", user_email=ME)
+    add_task("beta", "beta mine", task_end="2026-03-20", user_email=ME)
+    add_task("gamma", "not my team", task_end="2026-03-01", user_email=ME)
+    add_task("", "personal", task_end="2026-03-15", task_target="", user_email=ME)
+    add_task("", "someone else's", task_end="2026-03-02", task_target="", user_email="lee@planit.test")
+    return client
+
+
+def test_all_teams_and_personal_tasks_in_due_order(seeded):
+    page = load(seeded)
+    assert names(page) == ["alpha mine", "alpha theirs", "personal", "beta mine"]
+    assert page["next"] is None
+    assert names(load(seeded, hide_done=False)) == ["alpha mine", "beta done", "alpha theirs", "personal", "beta mine"]
+
+
+def test_assigned_only(seeded):
+    assert names(load(seeded, assigned_only=True)) == ["alpha mine", "personal", "beta mine"]
+
+
+def test_keyset_pages(seeded):
+    seen, cursor = [], {}
+    while True:
+        page = load(seeded, limit=1, hide_done=False, **cursor)
+        seen += names(page)
+        if page["next"] is None:
+            break
+        cursor = page["next"]
+    assert seen == ["alpha mine", "beta done", "alpha theirs", "personal", "beta mine"]
+
+
+def test_window(seeded):
+    assert names(load(seeded, window_start="2026-03-08", window_end="2026-03-31")) == \
+           ["alpha theirs", "personal", "beta mine"]
+
+
+def test_joining_a_team_invalidates_cached_page(seeded, add_member):
+    assert "not my team" not in names(load(seeded))
+    add_member("gamma", ME)
+    assert names(load(seeded))[0] == "not my team"
+
+    seeded.post("/delete_member", json={"team_name": "gamma", "user_email": ME})
+    assert "not my team" not in names(load(seeded))
+
+
+def test_personal_task_changes_invalidate(seeded, add_task):
+    load(seeded)
+    add_task("", "new personal", task_end="2026-03-01", task_target="", user_email=ME)
+    assert names(load(seeded))[0] == "new personal"
+
+
+def test_user_email_is_required(client):
+    assert client.post("/load_user_task", json={"user_email": ""}).status_code == 400
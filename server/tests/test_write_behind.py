@@ -0,0 +1,80 @@
+"""user-022 – 색 변경 write-behind (WRITE_BEHIND=1): 읽기 overlay, 합치기, shutdown flush, 동기 쓰기 전 forget"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import rds
+import server
+
+LOAD = {"team_name": "alpha", "task_target": "", "user_email": "", "hide_done": False}
+TASK = {"team_name": "alpha", "task_name": "a", "task_start": "2026-03-01", "task_end": "2026-03-31",
+        "task_state": "TODO", "task_color": "0", "task_target": "alpha", "user_email": "owner@planit.test"}
+
+
+@pytest.fixture
+def behind(env):
+    env.setenv("WRITE_BEHIND", "1")
+    env.setenv("WRITE_BEHIND_INTERVAL", "60")           # 테스트 중에는 자동 flush 없음
+    with TestClient(server.app) as client:
+        client.post("/add_task", json=TASK)
+        yield client
+
+
+def set_color(client, color, task_name="a"):
+    response = client.post("/update_task", json={"team_name": "alpha", "task_name": task_name, "task_color": color})
+    assert response.status_code == 200, response.text
+
+
+def loaded_colors(client):
+    return [row[6] for row in client.post("/load_task", json=LOAD).json()["task"]]
+
+
+def stored_colors():
+    connection = rds.backend.connect()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT task_color FROM task_table ORDER BY id")
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        connection.close()
+
+
+def test_reads_see_pending_color_before_flush(behind):
+    set_color(behind, "3")
+    set_color(behind, "4")                              # 같은 key → 하나로 합쳐짐
+    assert server.writes.stats()["pending"] == 1
+    assert loaded_colors(behind) == [4]
+    assert stored_colors() == [0]
+
+
+def test_shutdown_flushes_pending_colors(env):
+    env.setenv("WRITE_BEHIND", "1")
+    env.setenv("WRITE_BEHIND_INTERVAL", "60")
+    with TestClient(server.app) as client:
+        client.post("/add_task", json=TASK)
+        set_color(client, "7")
+        client.post("/update_board", json={"team_name": "alpha", "board_name": "todo", "board_color": "2"})
+    assert stored_colors() == [7]
+    assert server.writes.stats()["pending"] == 0
+
+
+def test_delete_forgets_pending_color(behind):
+    set_color(behind, "5")
+    behind.post("/delete_task", json={"team_name": "alpha", "task_name": "a"})
+    assert server.writes.stats()["pending"] == 0
+
+    behind.post("/add_task", json=TASK)                 # 같은 이름으로 다시 만들어도 예전 색이 덮어쓰지 않음
+    assert loaded_colors(behind) == [0]
+
+
+def test_synchronous_update_supersedes_pending_color(behind):
+    set_color(behind, "5")
+    behind.post("/update_task", json={"team_name": "alpha", "task_name": "a", "task_state": "DONE", "task_color": "6"})
+    assert server.writes.stats()["pending"] == 0
+    assert stored_colors() == [6] and loaded_colors(behind) == [6]
+
+
+def test_non_integer_color_is_400(behind):
+    response = behind.post("/update_task", json={"team_name": "alpha", "task_name": "a", "task_color": "red"})
+    assert response.status_code == 400
+    assert server.writes.stats()["pending"] == 0
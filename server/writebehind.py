@@ -0,0 +1,204 @@
+"""
+writebehind.py – Write-behind queue for cosmetic updates (task_color / board_color)
+
+색상 picker 를 끌면 /update_task, /update_board 가 초당 여러 번 들어오는데 매번 commit 할 필요는 없다.
+* 색 변경은 메모리에 (kind, team_name, name) → 마지막 값으로 모아 둔다 (같은 key 는 덮어써서 하나로)
+* 첫 변경 후 interval 초 동안 모았다가 (가득 차면 바로) batch_size 개씩 한 트랜잭션으로 flush
+  (rds.flush_colors_to_db – 팀마다 revision +1, commit 한 번)
+* 읽기는 overlay_* 로 아직 DB 에 없는 값 (대기 중 + flush 중) 을 덮어써서 돌려준다
+* 같은 key 를 건드리는 동기 쓰기 (상태+색 변경, 삭제, 팀 삭제) 전에는 forget() → 오래된 색이 나중에 덮어쓰지 않게
+* flush 실패 → 되돌려 두고 interval 뒤 재시도 (그 사이 들어온 새 값이 우선)
+* stop() 은 남은 변경을 모두 flush 한 뒤 끝난다 (shutdown)
+
+메모리는 worker 별 → 다른 worker 의 읽기 / delta sync / 다른 노드에는 flush 뒤 (최대 interval) 에 보인다.
+opt-in (WRITE_BEHIND=1). 꺼져 있으면 put 을 부르지 않고 예전처럼 바로 쓴다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from metrics import WRITE_BEHIND_UPDATES
+from rds import flush_colors_to_db
+
+log = logging.getLogger("planit.writebehind")
+
+# db.call 과 같은 모양 : call(func, **kwargs)
+Call = Callable[..., Awaitable[Any]]
+
+TASK = "task"
+BOARD = "board"
+Key = Tuple[str, str, str]      # (TASK | BOARD, team_name, task_name | board_name)
+
+
+class WriteBehindQueue:
+    def __init__(self, call: Call, *, enabled: bool = False, interval: float = 0.2,
+                 max_pending: int = 10000, batch_size: int = 500):
+        self._call = call
+        self._pending: Dict[Key, int] = {}
+        self._inflight: Dict[Key, int] = {}
+        self._lock = asyncio.Lock()             # flush 는 한 번에 하나
+        self._wake = asyncio.Event()
+        self._closing = False
+        self._task: asyncio.Task | None = None
+        self.configure(enabled=enabled, interval=interval, max_pending=max_pending, batch_size=batch_size)
+
+    def configure(self, *, enabled: bool, interval: float, max_pending: int, batch_size: int) -> None:
+        self.enabled = enabled
+        self.interval = interval
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+
+    # ── 쓰기 ──
+    def put(self, kind: str, team_name: str, name: str, color: Any) -> None:
+        """색 변경 예약 – 정수가 아니면 ValueError (DB 에 가서야 실패하지 않게 여기서)"""
+        color = int(color)
+        key = (kind, team_name or "", name)
+        if not self._pending or len(self._pending) + 1 >= self.max_pending:
+            self._wake.set()                    # 첫 변경 → 모으기 시작, 가득 참 → 바로 flush
+        WRITE_BEHIND_UPDATES.inc(kind, "coalesced" if key in self._pending else "queued")
+        self._pending[key] = color
+
+    async def forget(self, kind: str | None, team_name: str | None, name: str | None = None) -> None:
+        """
+        동기 쓰기 직전에 – 같은 key (name=None 이면 팀 전체, kind=None 이면 task / board 모두) 의
+        대기 중 변경은 버리고, flush 중이면 그 트랜잭션이 끝날 때까지 기다린다.
+        """
+        if not self._pending and not self._inflight:
+            return
+        team_name = team_name or ""
+
+        def match(key: Key) -> bool:
+            return (key[1] == team_name and (kind is None or key[0] == kind)
+                    and (name is None or key[2] == name))
+
+        for key in [key for key in self._pending if match(key)]:
+            del self._pending[key]
+            WRITE_BEHIND_UPDATES.inc(key[0], "superseded")
+        if any(match(key) for key in self._inflight):
+            async with self._lock:
+                pass
+
+    # ── flush ──
+    async def flush(self) -> int:
+        """대기 중인 변경을 모두 DB 로 (batch_size 개씩 트랜잭션). 실패하면 남은 것은 되돌려 두고 예외"""
+        flushed = 0
+        async with self._lock:
+            while self._pending:
+                keys = list(islice(self._pending, self.batch_size))
+                batch = self._inflight = {key: self._pending.pop(key) for key in keys}
+                try:
+                    await self._call(
+                        flush_colors_to_db,
+                        task_colors=[(team, name, color) for (kind, team, name), color in batch.items() if kind == TASK],
+                        board_colors=[(team, name, color) for (kind, team, name), color in batch.items() if kind == BOARD],
+                        task_table="task_table",
+                        card_table="card_table",
+                    )
+                except BaseException:
+                    for key, color in batch.items():
+                        self._pending.setdefault(key, color)    # 그 사이 들어온 새 값이 있으면 그쪽
+                    self._count(batch, "failed")
+                    raise
+                finally:
+                    self._inflight = {}
+                self._count(batch, "flushed")
+                flushed += len(batch)
+        return flushed
+
+    @staticmethod
+    def _count(batch: Dict[Key, int], outcome: str) -> None:
+        tasks = sum(1 for kind, _, _ in batch if kind == TASK)
+        if tasks:
+            WRITE_BEHIND_UPDATES.inc(TASK, outcome, amount=tasks)
+        if len(batch) > tasks:
+            WRITE_BEHIND_UPDATES.inc(BOARD, outcome, amount=len(batch) - tasks)
+
+    async def _run(self) -> None:
+        while not self._closing:
+            await self._wake.wait()             # 첫 변경이 들어올 때까지 잠들어 있다
+            self._wake.clear()
+            if not self._closing and len(self._pending) < self.max_pending:
+                try:                            # interval 동안 모으기 (가득 차거나 stop 이면 바로)
+                    await asyncio.wait_for(self._wake.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("write-behind flush failed; %d updates kept for retry", len(self._pending))
+                if not self._closing:
+                    await asyncio.sleep(self.interval)
+                    self._wake.set()
+
+    async def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._closing = False
+            self._lock = asyncio.Lock()         # 같은 프로세스에서 다시 시작하면 event loop 가 바뀐다 (테스트 / benchmark)
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """남은 변경을 모두 flush (요청 drain 이후, 풀을 닫기 전에 호출)"""
+        if self._task is not None:
+            self._closing = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        try:
+            await self.flush()                  # loop 의 마지막 flush 가 실패했으면 한 번 더
+        except Exception:
+            log.exception("write-behind: %d color updates lost on shutdown", len(self._pending))
+
+    # ── 읽기 (대기 중인 값 덮어쓰기) ──
+    def color(self, kind: str, team_name: str, name: str) -> int | None:
+        key = (kind, team_name, name)
+        color = self._pending.get(key)
+        return self._inflight.get(key) if color is None else color
+
+    def _patch(self, row: Sequence[Any], kind: str, index: int) -> Sequence[Any]:
+        color = self.color(kind, row[1], row[2])
+        if color is None or color == row[index]:
+            return row
+        return (*row[:index], color, *row[index + 1:])
+
+    def overlay_tasks(self, rows: Sequence[Sequence[Any]]) -> Sequence[Sequence[Any]]:
+        """task 행 (rds.TASK_COLUMNS: id, team_name, task_name, ..., task_color=6) – 캐시 행은 고치지 않고 새 tuple"""
+        if not self._pending and not self._inflight:
+            return rows
+        return [self._patch(row, TASK, 6) for row in rows]
+
+    def overlay_cards(self, rows: Sequence[Sequence[Any]]) -> Sequence[Sequence[Any]]:
+        """card 행 (rds.CARD_COLUMNS: id, team_name, board_name, board_color=3, ...)"""
+        if not self._pending and not self._inflight:
+            return rows
+        return [self._patch(row, BOARD, 3) for row in rows]
+
+    def overlay_snapshot(self, team_name: str, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """load_team_snapshot_from_db 결과 – board 묶음의 board_color 도"""
+        if not self._pending and not self._inflight:
+            return snapshot
+        board: List[Dict[str, Any]] = []
+        for group in snapshot["board"]:
+            color = self.color(BOARD, team_name, group["board_name"])
+            board.append({**group, "board_color": group["board_color"] if color is None else color,
+                          "card": self.overlay_cards(group["card"])})
+        return {**snapshot, "task": self.overlay_tasks(snapshot["task"]), "board": board}
+
+    def overlay_batches(self, batches: Iterator[Sequence[Any]]) -> Iterator[Sequence[Any]]:
+        """stream_task 용 – batch 마다 overlay_tasks (닫히면 안쪽 stream 도 닫아 커넥션 반환)"""
+        try:
+            for rows in batches:
+                yield self.overlay_tasks(rows)
+        finally:
+            batches.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"enabled": int(self.enabled), "pending": len(self._pending), "inflight": len(self._inflight)}
+
+
+__all__ = ["WriteBehindQueue", "TASK", "BOARD"]